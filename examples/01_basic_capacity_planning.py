@@ -8,6 +8,8 @@ import os
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
 from site_calc_investment import (
     Battery,
     ElectricityExport,
@@ -45,16 +47,14 @@ def main():
     print(f"Planning horizon: {timespan.intervals} hourly intervals ({timespan.intervals / 24:.0f} days)")
 
     # Generate price profile with day/night pattern
-    prices = []
-    for hour in range(168):
-        hour_of_day = hour % 24
-        if 9 <= hour_of_day <= 20:
-            prices.append(80.0)  # Day: high price
-        else:
-            prices.append(30.0)  # Night: low price
+    hour_of_day = np.arange(timespan.intervals) % 24
+    prices = np.where((hour_of_day >= 9) & (hour_of_day <= 20), 80.0, 30.0)  # Day: high, night: low
 
     print(f"Price profile generated: {len(prices)} values")
-    print("  Day price: EUR 80/MWh, Night price: EUR 30/MWh")
+    print(
+        f"  Day price: EUR {prices.max():.0f}/MWh, Night price: EUR {prices.min():.0f}/MWh, "
+        f"Average: EUR {prices.mean():.1f}/MWh"
+    )
 
     # Define 10 MW / 20 MWh battery (2-hour duration)
     battery = Battery(
@@ -67,15 +67,17 @@ def main():
         },
     )
 
-    # Market devices (grid connections)
+    # Market devices (grid connections) - convert to a plain list once, at the API boundary
+    price_list = prices.tolist()
+
     grid_import = ElectricityImport(
         name="GridImport",
-        properties={"price": prices, "max_import": 20.0},
+        properties={"price": price_list, "max_import": 20.0},
     )
 
     grid_export = ElectricityExport(
         name="GridExport",
-        properties={"price": prices, "max_export": 20.0},
+        properties={"price": price_list, "max_export": 20.0},
     )
 
     # Create site
@@ -123,7 +125,8 @@ def main():
 
     result = client.wait_for_completion(
         job.job_id,
-        poll_interval=5,  # Check every 5 seconds
+        poll_interval=2,  # First check after 2 seconds
+        poll_interval_max=30,  # Back off to at most 30 seconds between checks
         timeout=600,  # 10 minute maximum
     )
 
@@ -1,13 +1,19 @@
 """Scenario Comparison Example
 
 This example compares three different battery sizes to find the optimal
-capacity for investment.
+capacity for investment. Each scenario is submitted and awaited in its own
+worker thread sharing one client, so total wall time is roughly that of the
+slowest solve.
 """
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
 from site_calc_investment import (
     Battery,
     ElectricityExport,
@@ -19,36 +25,40 @@ from site_calc_investment import (
     Site,
     compare_scenarios,
 )
+from site_calc_investment.models.devices import MarketExportProperties, MarketImportProperties
 from site_calc_investment.models.requests import TimeSpanInvestment
 
+# Scenarios run in worker threads; keep each scenario's output block together
+_print_lock = threading.Lock()
+
 
 def create_prices(days: int = 7):
-    """Create price profile with daily pattern."""
-    prices = []
-    for day in range(days):
-        for hour in range(24):
-            if 9 <= hour <= 20:
-                prices.append(80.0)  # Day: high price
-            else:
-                prices.append(30.0)  # Night: low price
-    return prices
-
-
-def create_scenario(
+    """Create price profile with daily pattern.
+
+    One 24-hour profile (day: high price, night: low price) is tiled across
+    all days in a single array fill and converted to a list once for the API.
+    """
+    hour_of_day = np.arange(24)
+    daily_profile = np.where((hour_of_day >= 9) & (hour_of_day <= 20), 80.0, 30.0)
+    return np.tile(daily_profile, days).tolist()
+
+
+def submit_scenario(
     client: InvestmentClient,
     capacity_mwh: float,
-    prices: list,
+    import_properties: MarketImportProperties,
+    export_properties: MarketExportProperties,
     timespan: TimeSpanInvestment,
 ) -> tuple:
-    """Create and run a scenario with given battery capacity.
+    """Create and submit a scenario with given battery capacity.
+
+    The market properties are built once in main() and shared by every
+    scenario, so the price profile is validated and stored only once.
 
     Returns:
-        (scenario_name, result)
+        (scenario_name, job_id)
     """
     scenario_name = f"{capacity_mwh:.0f} MWh Battery"
-    print(f"\n{'=' * 60}")
-    print(f"SCENARIO: {scenario_name}")
-    print(f"{'=' * 60}")
 
     # Battery sized for 2-hour duration
     battery = Battery(
@@ -61,15 +71,8 @@ def create_scenario(
         },
     )
 
-    grid_import = ElectricityImport(
-        name="GridImport",
-        properties={"price": prices, "max_import": 50.0},
-    )
-
-    grid_export = ElectricityExport(
-        name="GridExport",
-        properties={"price": prices, "max_export": 50.0},
-    )
+    grid_import = ElectricityImport(name="GridImport", properties=import_properties)
+    grid_export = ElectricityExport(name="GridExport", properties=export_properties)
 
     site = Site(
         site_id=f"site_{capacity_mwh:.0f}mwh",
@@ -99,18 +102,48 @@ def create_scenario(
         ),
     )
 
-    print(f"  Capacity:   {capacity_mwh:.0f} MWh")
-    print(f"  Power:      {capacity_mwh / 2:.0f} MW")
-    print(f"  CAPEX:      EUR {capex:,.0f}")
-    print(f"  Annual O&M: EUR {opex:,.0f}")
-
     job = client.create_planning_job(request)
-    print(f"\n  Job ID: {job.job_id}")
-    print("  Waiting for completion...")
 
-    result = client.wait_for_completion(job.job_id, poll_interval=5, timeout=600)
+    with _print_lock:
+        print(f"\n{'=' * 60}")
+        print(f"SCENARIO: {scenario_name}")
+        print(f"{'=' * 60}")
+        print(f"  Capacity:   {capacity_mwh:.0f} MWh")
+        print(f"  Power:      {capacity_mwh / 2:.0f} MW")
+        print(f"  CAPEX:      EUR {capex:,.0f}")
+        print(f"  Annual O&M: EUR {opex:,.0f}")
+        print(f"\n  Job ID: {job.job_id}")
 
-    print(f"  Completed in {result.summary.solve_time_seconds:.0f}s")
+    return scenario_name, job.job_id
+
+
+def run_scenario(
+    client: InvestmentClient,
+    capacity_mwh: float,
+    import_properties: MarketImportProperties,
+    export_properties: MarketExportProperties,
+    timespan: TimeSpanInvestment,
+) -> tuple:
+    """Submit a scenario, wait for it to finish and print its metrics.
+
+    Runs in a worker thread; waiting is I/O-bound HTTP polling, so scenarios
+    overlap on the shared client's connection pool.
+
+    Returns:
+        (scenario_name, result)
+    """
+    scenario_name, job_id = submit_scenario(client, capacity_mwh, import_properties, export_properties, timespan)
+    result = client.wait_for_completion(job_id, poll_interval=2, poll_interval_max=30, timeout=600)
+
+    with _print_lock:
+        print_scenario_result(scenario_name, result)
+
+    return scenario_name, result
+
+
+def print_scenario_result(scenario_name: str, result) -> None:
+    """Print solve time and investment metrics for a completed scenario."""
+    print(f"\n{scenario_name}: completed in {result.summary.solve_time_seconds:.0f}s")
 
     if result.investment_metrics:
         metrics = result.investment_metrics
@@ -121,8 +154,6 @@ def create_scenario(
         print(f"  IRR:     {irr_str}")
         print(f"  Payback: {payback_str}")
 
-    return scenario_name, result
-
 
 def main():
     """Run scenario comparison example comparing three battery sizes."""
@@ -156,13 +187,21 @@ def main():
     print(f"\nPrices: {len(prices)} hourly values")
     print("  Day price: EUR 80/MWh, Night price: EUR 30/MWh")
 
+    # Shared by all scenarios - only the battery differs between them
+    import_properties = MarketImportProperties(price=prices, max_import=50.0)
+    export_properties = MarketExportProperties(price=prices, max_export=50.0)
+
     # Test three capacities
     capacities = [10.0, 20.0, 30.0]  # MWh
 
-    scenarios = []
-    for capacity in capacities:
-        name, result = create_scenario(client, capacity, prices, timespan)
-        scenarios.append((name, result))
+    # Run every scenario concurrently; the server solves them in parallel
+    with ThreadPoolExecutor(max_workers=len(capacities)) as executor:
+        scenarios = list(
+            executor.map(
+                lambda capacity: run_scenario(client, capacity, import_properties, export_properties, timespan),
+                capacities,
+            )
+        )
 
     # Compare scenarios
     print("\n" + "=" * 60)
@@ -4,10 +4,13 @@ This example demonstrates using the financial analysis helpers to
 perform detailed ROI analysis on an optimization result.
 """
 
+import numpy as np
+
 from site_calc_investment import (
     aggregate_annual,
     calculate_irr,
     calculate_npv,
+    calculate_npv_batch,
     calculate_payback_period,
 )
 
@@ -104,26 +107,16 @@ def main():
     hours_per_year = 8760
     years = 2
 
-    # Average 2 MW discharge, 50% of the time
-    hourly_discharge = []
-    for hour in range(hours_per_year * years):
-        hour_of_day = hour % 24
-        # Discharge during high-price hours (9am-8pm)
-        if 9 <= hour_of_day <= 20:
-            discharge = 2.0  # MW
-        else:
-            discharge = 0.0
-        hourly_discharge.append(discharge)
+    # Daily pattern repeated for every day of the horizon
+    hour_of_day = np.arange(24)
+    high_price_hours = (hour_of_day >= 9) & (hour_of_day <= 20)  # 9am-8pm
+    days = hours_per_year * years // 24
+
+    # Average 2 MW discharge, 50% of the time (during high-price hours)
+    hourly_discharge = np.tile(np.where(high_price_hours, 2.0, 0.0), days)
 
     # Prices: €40/MWh during day, €25/MWh at night
-    hourly_prices = []
-    for hour in range(hours_per_year * years):
-        hour_of_day = hour % 24
-        if 9 <= hour_of_day <= 20:
-            price = 40.0
-        else:
-            price = 25.0
-        hourly_prices.append(price)
+    hourly_prices = np.tile(np.where(high_price_hours, 40.0, 25.0), days)
 
     annual_revenues = aggregate_annual(hourly_discharge, hourly_prices, years=2)
 
@@ -148,9 +141,8 @@ def main():
     print(f"{'Discount Rate':<20} {'NPV':>15}")
     print("-" * 40)
 
-    for rate in discount_rates:
-        npv = calculate_npv(annual_cash_flows, rate, initial_investment)
-        print(f"{rate * 100:>6.1f}%              €{npv:>12,.0f}")
+    npvs = calculate_npv_batch(annual_cash_flows, discount_rates, initial_investment)
+    print("\n".join(f"{rate * 100:>6.1f}%              €{npv:>12,.0f}" for rate, npv in zip(discount_rates, npvs)))
 
     print("\n" + "=" * 80)
 
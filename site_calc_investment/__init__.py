@@ -5,14 +5,9 @@ Python client for long-term capacity planning and investment ROI analysis.
 
 __version__ = "1.2.8"
 
-from site_calc_investment.analysis import (
-    aggregate_annual,
-    calculate_irr,
-    calculate_npv,
-    calculate_payback_period,
-    compare_scenarios,
-)
-from site_calc_investment.api.client import InvestmentClient
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from site_calc_investment.exceptions import (
     ApiError,
     AuthenticationError,
@@ -24,38 +19,111 @@ from site_calc_investment.exceptions import (
     TimeoutError,
     ValidationError,
 )
-from site_calc_investment.models import (
-    CHP,
-    # Device models (NO ancillary_services)
-    Battery,
-    ElectricityDemand,
-    ElectricityExport,
-    ElectricityImport,
-    GasImport,
-    HeatAccumulator,
-    HeatDemand,
-    HeatExport,
-    InvestmentMetrics,
-    InvestmentParameters,
-    # Request models
-    InvestmentPlanningRequest,
-    InvestmentPlanningResponse,
-    # Response models
-    Job,
-    Location,
-    OptimizationConfig,
-    Photovoltaic,
-    Resolution,
-    Schedule,
-    # Site and configuration
-    Site,
-    # Core models
-    TimeSpan,
-)
+
+# Public name -> defining module. The client (httpx) and the pydantic models
+# are imported on first access (PEP 562), so e.g. ``from site_calc_investment
+# import calculate_npv`` only loads NumPy and the financial helpers.
+_LAZY_IMPORTS = {
+    "InvestmentClient": "site_calc_investment.api.client",
+    "InvestmentAsyncClient": "site_calc_investment.api.async_client",
+    "run_scenarios": "site_calc_investment.api.async_client",
+    "calculate_npv": "site_calc_investment.analysis.financial",
+    "calculate_npv_batch": "site_calc_investment.analysis.financial",
+    "calculate_irr": "site_calc_investment.analysis.financial",
+    "calculate_payback_period": "site_calc_investment.analysis.financial",
+    "aggregate_annual": "site_calc_investment.analysis.financial",
+    "compare_scenarios": "site_calc_investment.analysis.comparison",
+    "TimeSpan": "site_calc_investment.models",
+    "Resolution": "site_calc_investment.models",
+    "Location": "site_calc_investment.models",
+    "Battery": "site_calc_investment.models",
+    "CHP": "site_calc_investment.models",
+    "HeatAccumulator": "site_calc_investment.models",
+    "Photovoltaic": "site_calc_investment.models",
+    "HeatDemand": "site_calc_investment.models",
+    "ElectricityDemand": "site_calc_investment.models",
+    "ElectricityImport": "site_calc_investment.models",
+    "ElectricityExport": "site_calc_investment.models",
+    "GasImport": "site_calc_investment.models",
+    "HeatExport": "site_calc_investment.models",
+    "Site": "site_calc_investment.models",
+    "Schedule": "site_calc_investment.models",
+    "InvestmentParameters": "site_calc_investment.models",
+    "OptimizationConfig": "site_calc_investment.models",
+    "InvestmentPlanningRequest": "site_calc_investment.models",
+    "Job": "site_calc_investment.models",
+    "InvestmentPlanningResponse": "site_calc_investment.models",
+    "InvestmentMetrics": "site_calc_investment.models",
+}
+
+# Subpackages that used to be loaded eagerly and may be reached as attributes
+_LAZY_SUBMODULES = {"analysis", "api", "models"}
+
+if TYPE_CHECKING:
+    from site_calc_investment.analysis import (
+        aggregate_annual,
+        calculate_irr,
+        calculate_npv,
+        calculate_npv_batch,
+        calculate_payback_period,
+        compare_scenarios,
+    )
+    from site_calc_investment.api.async_client import InvestmentAsyncClient, run_scenarios
+    from site_calc_investment.api.client import InvestmentClient
+    from site_calc_investment.models import (
+        CHP,
+        # Device models (NO ancillary_services)
+        Battery,
+        ElectricityDemand,
+        ElectricityExport,
+        ElectricityImport,
+        GasImport,
+        HeatAccumulator,
+        HeatDemand,
+        HeatExport,
+        InvestmentMetrics,
+        InvestmentParameters,
+        # Request models
+        InvestmentPlanningRequest,
+        InvestmentPlanningResponse,
+        # Response models
+        Job,
+        Location,
+        OptimizationConfig,
+        Photovoltaic,
+        Resolution,
+        Schedule,
+        # Site and configuration
+        Site,
+        # Core models
+        TimeSpan,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names and subpackages on first access."""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_SUBMODULES)
+
 
 __all__ = [
     # Client
     "InvestmentClient",
+    "InvestmentAsyncClient",
+    "run_scenarios",
     # Core
     "TimeSpan",
     "Resolution",
@@ -83,6 +151,7 @@ __all__ = [
     "InvestmentMetrics",
     # Analysis
     "calculate_npv",
+    "calculate_npv_batch",
     "calculate_irr",
     "calculate_payback_period",
     "aggregate_annual",
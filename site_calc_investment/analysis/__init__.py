@@ -5,11 +5,13 @@ from site_calc_investment.analysis.financial import (
     aggregate_annual,
     calculate_irr,
     calculate_npv,
+    calculate_npv_batch,
     calculate_payback_period,
 )
 
 __all__ = [
     "calculate_npv",
+    "calculate_npv_batch",
     "calculate_irr",
     "calculate_payback_period",
     "aggregate_annual",
@@ -1,12 +1,18 @@
 """Scenario comparison utilities."""
 
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from site_calc_investment.models.responses import InvestmentPlanningResponse
+if TYPE_CHECKING:
+    # Annotations only - keeps pydantic models out of the analysis import path
+    from site_calc_investment.models.responses import InvestmentMetrics, InvestmentPlanningResponse
+
+# Summary fields shown per scenario, fetched together in one C-level call
+_SUMMARY_FIELDS = attrgetter("total_cost", "expected_profit", "solve_time_seconds", "solver_status")
 
 
 def compare_scenarios(
-    scenarios: List[InvestmentPlanningResponse],
+    scenarios: List["InvestmentPlanningResponse"],
     names: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Compare multiple optimization scenarios.
@@ -38,43 +44,39 @@ def compare_scenarios(
     if len(names) != len(scenarios):
         raise ValueError(f"Number of names ({len(names)}) must match number of scenarios ({len(scenarios)})")
 
+    # Look up each scenario's sub-models and summary fields once and reuse
+    # them for every column
+    inv_metrics = [s.investment_metrics for s in scenarios]
+    total_costs, profits, solve_times, solver_statuses = map(
+        list, zip(*(_SUMMARY_FIELDS(s.summary) for s in scenarios))
+    )
+
     comparison: Dict[str, Any] = {
         "names": names,
-        "total_revenue": [],
-        "total_costs": [],
-        "profit": [],
-        "npv": [],
-        "irr": [],
-        "payback_years": [],
-        "solve_time_seconds": [],
-        "solver_status": [],
+        "total_revenue": [
+            _total_revenue(profit, cost, inv) for profit, cost, inv in zip(profits, total_costs, inv_metrics)
+        ],
+        "total_costs": total_costs,
+        "profit": profits,
+        "npv": [inv.npv if inv else None for inv in inv_metrics],
+        "irr": [inv.irr if inv else None for inv in inv_metrics],
+        "payback_years": [inv.payback_period_years if inv else None for inv in inv_metrics],
+        "solve_time_seconds": solve_times,
+        "solver_status": solver_statuses,
     }
 
-    for scenario in scenarios:
-        summary = scenario.summary
-        inv_metrics = scenario.investment_metrics
-
-        # Calculate total revenue - use investment metrics if available
-        if inv_metrics and inv_metrics.total_revenue_10y is not None:
-            total_revenue = inv_metrics.total_revenue_10y
-        else:
-            # Fallback: calculate from profit + cost
-            profit = summary.expected_profit or 0.0
-            cost = summary.total_cost or 0.0
-            total_revenue = profit + cost
-
-        comparison["total_revenue"].append(total_revenue)
-        comparison["total_costs"].append(summary.total_cost)
-        comparison["profit"].append(summary.expected_profit)
-        comparison["npv"].append(inv_metrics.npv if inv_metrics else None)
-        comparison["irr"].append(inv_metrics.irr if inv_metrics else None)
-        comparison["payback_years"].append(inv_metrics.payback_period_years if inv_metrics else None)
-        comparison["solve_time_seconds"].append(summary.solve_time_seconds)
-        comparison["solver_status"].append(summary.solver_status)
-
     return comparison
 
 
+def _total_revenue(profit: Optional[float], cost: Optional[float], inv_metrics: Optional["InvestmentMetrics"]) -> float:
+    """Total revenue of a scenario - from investment metrics if available."""
+    if inv_metrics and inv_metrics.total_revenue_10y is not None:
+        return inv_metrics.total_revenue_10y
+
+    # Fallback: calculate from the already fetched profit + cost
+    return (profit or 0.0) + (cost or 0.0)
+
+
 def print_comparison(comparison: dict) -> None:
     """Print scenario comparison in a readable format.
 
@@ -111,11 +113,11 @@ def print_comparison(comparison: dict) -> None:
 
     print("\n" + "=" * 80)
 
-    # Find best scenario by NPV
-    npv_values = [v for v in comparison["npv"] if v is not None]
-    if npv_values:
-        best_idx = comparison["npv"].index(max(npv_values))
+    # Find best scenario by NPV in a single pass (first one wins on ties)
+    npvs = comparison["npv"]
+    best_idx = max((i for i, v in enumerate(npvs) if v is not None), key=npvs.__getitem__, default=None)
+    if best_idx is not None:
         print(f"\nBest Scenario (by NPV): {comparison['names'][best_idx]}")
-        print(f"NPV: €{comparison['npv'][best_idx]:,.0f}")
+        print(f"NPV: €{npvs[best_idx]:,.0f}")
 
     print("=" * 80)
@@ -1,10 +1,15 @@
 """Financial analysis functions."""
 
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+# Inputs may be plain lists or NumPy arrays; arrays are used without copying
+FloatArray = Union[Sequence[float], np.ndarray]
 
 
 def calculate_npv(
-    cash_flows: List[float],
+    cash_flows: FloatArray,
     discount_rate: float,
     initial_investment: float = 0,
 ) -> float:
@@ -13,7 +18,7 @@ def calculate_npv(
     NPV = Sum of (cash_flow_t / (1 + discount_rate)^t) + initial_investment
 
     Args:
-        cash_flows: Annual cash flows (revenues - costs)
+        cash_flows: Annual cash flows (revenues - costs), list or NumPy array
         discount_rate: Discount rate (e.g., 0.05 for 5%)
         initial_investment: Initial investment (negative for CAPEX, default: 0)
 
@@ -26,22 +31,59 @@ def calculate_npv(
         >>> print(f"NPV: €{npv:,.0f}")
         NPV: €-23,162
     """
-    npv = initial_investment
+    values = np.asarray(cash_flows, dtype=np.float64)
+    # (1 + r)^-t for t = 1..n as a running product - multiplies only, no pow
+    discount_factors = np.cumprod(np.full(values.size, 1 / (1 + discount_rate)))
+
+    return float(initial_investment + values @ discount_factors)
+
+
+def calculate_npv_batch(
+    cash_flows: FloatArray,
+    discount_rates: FloatArray,
+    initial_investment: float = 0,
+) -> List[float]:
+    """Calculate Net Present Value for several discount rates at once.
+
+    Equivalent to calling calculate_npv() once per rate, but evaluates all
+    rates in a single vectorized pass. Useful for sensitivity analysis.
+
+    Args:
+        cash_flows: Annual cash flows (revenues - costs), list or NumPy array
+        discount_rates: Discount rates to evaluate (e.g., [0.03, 0.05, 0.07])
+        initial_investment: Initial investment (negative for CAPEX, default: 0)
+
+    Returns:
+        List of net present values, one per discount rate
 
-    for t, cash_flow in enumerate(cash_flows, start=1):
-        npv += cash_flow / ((1 + discount_rate) ** t)
+    Example:
+        >>> cash_flows = [100000, 105000, 110000, 115000, 120000]
+        >>> npvs = calculate_npv_batch(cash_flows, [0.03, 0.05, 0.07], initial_investment=-500000)
+        >>> for rate, npv in zip([0.03, 0.05, 0.07], npvs):
+        ...     print(f"{rate:.0%}: €{npv:,.0f}")
+        3%: €2,415
+        5%: €-25,868
+        7%: €-51,747
+    """
+    values = np.asarray(cash_flows, dtype=np.float64)
+    rates = np.asarray(discount_rates, dtype=np.float64)
+    # One row of (1 + r)^-t per rate, built as a running product along t
+    discount_factors = np.cumprod(np.repeat(1 / (1 + rates[:, np.newaxis]), values.size, axis=1), axis=1)
 
-    return npv
+    npvs: List[float] = (discount_factors @ values + initial_investment).tolist()
+    return npvs
 
 
-def calculate_irr(cash_flows: List[float], initial_guess: float = 0.1) -> Optional[float]:
+def calculate_irr(cash_flows: FloatArray, initial_guess: float = 0.1) -> Optional[float]:
     """Calculate Internal Rate of Return.
 
     IRR is the discount rate that makes NPV = 0.
-    Uses Newton-Raphson method for root finding.
+    Uses Newton-Raphson from the initial guess; if that does not converge,
+    falls back to Brent's method on a bracketing interval where NPV changes
+    sign (the bracket closest to the initial guess is used).
 
     Args:
-        cash_flows: Annual cash flows INCLUDING initial investment as first element
+        cash_flows: Annual cash flows INCLUDING initial investment as first element, list or NumPy array
                    (e.g., [-500000, 100000, 105000, ...])
         initial_guess: Starting guess for IRR (default: 0.1 = 10%)
 
@@ -59,33 +101,47 @@ def calculate_irr(cash_flows: List[float], initial_guess: float = 0.1) -> Option
         return None
 
     # numpy.irr was removed in numpy 1.20+, use Newton-Raphson directly
-    return _irr_newton_raphson(cash_flows, initial_guess)
+    values = np.ascontiguousarray(cash_flows, dtype=np.float64)
+    irr = _irr_newton_raphson(values, initial_guess)
+    if irr is None:
+        irr = _irr_brent(values, initial_guess)
+    return irr
 
 
-def _irr_newton_raphson(cash_flows: List[float], initial_guess: float, max_iterations: int = 100) -> Optional[float]:
+def _irr_newton_raphson(cash_flows: np.ndarray, initial_guess: float, max_iterations: int = 20) -> Optional[float]:
     """Calculate IRR using Newton-Raphson method.
 
+    Each iteration evaluates NPV and its derivative over the whole cash flow
+    array with vectorized NumPy operations.
+
     Args:
-        cash_flows: Cash flows with initial investment as first element
+        cash_flows: Cash flows with initial investment as first element (float64 array)
         initial_guess: Starting guess
-        max_iterations: Maximum iterations
+        max_iterations: Maximum iterations (Newton converges in a handful
+            when it converges at all; otherwise the Brent fallback takes over)
 
     Returns:
         IRR or None if no convergence
     """
     rate = initial_guess
     tolerance = 1e-6
+    periods = np.arange(cash_flows.size, dtype=np.float64)
+    # Rate-independent derivative weights t * cf, built once for all iterations
+    weighted_cash_flows = periods * cash_flows
 
     for _ in range(max_iterations):
-        # Calculate NPV and derivative
-        npv: float = 0.0
-        npv_derivative: float = 0.0
+        one_plus_rate = 1 + rate
 
-        for t, cash_flow in enumerate(cash_flows):
-            discount_factor = (1 + rate) ** t
-            npv += cash_flow / discount_factor
-            if t > 0:
-                npv_derivative -= t * cash_flow / ((1 + rate) ** (t + 1))
+        # One shared vector (1 + rate)^-t serves both NPV and its derivative,
+        # d/dr [cf / (1 + rate)^t] = -t * cf * (1 + rate)^-t / (1 + rate).
+        # Overflow for extreme rates on long horizons is caught below.
+        with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+            discount_factors = np.power(one_plus_rate, -periods)
+            npv = float(cash_flows @ discount_factors)
+            npv_derivative = -float(weighted_cash_flows @ discount_factors) / one_plus_rate
+
+        if not (np.isfinite(npv) and np.isfinite(npv_derivative)):
+            return None
 
         # Check convergence
         if abs(npv) < tolerance:
@@ -104,14 +160,107 @@ def _irr_newton_raphson(cash_flows: List[float], initial_guess: float, max_itera
     return None  # No convergence
 
 
-def calculate_payback_period(cash_flows: List[float]) -> Optional[float]:
+# Candidate rates scanned for a sign change of NPV when Newton-Raphson fails
+# (same -99% to 1000% range that Newton-Raphson accepts)
+_IRR_BRACKET_GRID = np.array(
+    [-0.99, -0.9, -0.75, -0.5, -0.25, -0.1, -0.05, -0.01, 0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+)
+
+
+def _irr_npv(cash_flows: np.ndarray, rate: float) -> float:
+    """NPV of cash flows at rate, with the first cash flow undiscounted (may be inf/nan)."""
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        return float(cash_flows @ np.power(1 + rate, -np.arange(cash_flows.size, dtype=np.float64)))
+
+
+def _irr_brent(
+    cash_flows: np.ndarray,
+    initial_guess: float,
+    xtol: float = 1e-12,
+    max_iterations: int = 100,
+) -> Optional[float]:
+    """Calculate IRR using Brent's method on a sign-changing bracket.
+
+    Scans _IRR_BRACKET_GRID for adjacent rates where NPV changes sign and
+    takes the bracket closest to the initial guess. Brent's method combines
+    bisection with secant and inverse quadratic interpolation steps, so it
+    always converges once a bracket exists, typically superlinearly.
+
+    Args:
+        cash_flows: Cash flows with initial investment as first element (float64 array)
+        initial_guess: Rate used to choose between multiple brackets
+        xtol: Absolute tolerance on the rate
+        max_iterations: Maximum iterations
+
+    Returns:
+        IRR or None if NPV does not change sign in the scanned range
+    """
+    npvs = [_irr_npv(cash_flows, rate) for rate in _IRR_BRACKET_GRID]
+    brackets = [
+        (a, b, fa, fb)
+        for a, b, fa, fb in zip(_IRR_BRACKET_GRID[:-1], _IRR_BRACKET_GRID[1:], npvs[:-1], npvs[1:])
+        if np.isfinite(fa) and np.isfinite(fb) and (fa <= 0) != (fb <= 0)
+    ]
+    if not brackets:
+        return None
+    a, b, fa, fb = min(brackets, key=lambda bracket: abs((bracket[0] + bracket[1]) / 2 - initial_guess))
+
+    # Brent's method (as in Brent 1973 / scipy's brentq): b is the best
+    # estimate, c the counterpoint keeping the root bracketed in [b, c]
+    if fa == 0:
+        return float(a)
+    if fb == 0:
+        return float(b)
+    c, fc = a, fa
+    step = previous_step = b - a
+
+    for _ in range(max_iterations):
+        if (fa < 0) != (fb < 0):
+            # Root lies between a and b; restart the counterpoint there
+            c, fc = a, fa
+            step = previous_step = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tolerance = (xtol + 4 * np.finfo(np.float64).eps * abs(b)) / 2
+        bisection = (c - b) / 2
+        if fb == 0 or abs(bisection) < tolerance:
+            return float(b)
+
+        if abs(previous_step) > tolerance and abs(fb) < abs(fa):
+            if a == c:
+                # Secant step
+                trial = -fb * (b - a) / (fb - fa)
+            else:
+                # Inverse quadratic interpolation through a, b, c
+                slope_a = (fa - fb) / (a - b)
+                slope_c = (fc - fb) / (c - b)
+                trial = -fb * (fc * slope_c - fa * slope_a) / (slope_c * slope_a * (fc - fa))
+            if 2 * abs(trial) < min(abs(previous_step), 3 * abs(bisection) - tolerance):
+                previous_step, step = step, trial
+            else:
+                previous_step = step = bisection
+        else:
+            previous_step = step = bisection
+
+        a, fa = b, fb
+        b += step if abs(step) > tolerance else (tolerance if bisection > 0 else -tolerance)
+        fb = _irr_npv(cash_flows, b)
+        if not np.isfinite(fb):
+            return None
+
+    return None  # No convergence
+
+
+def calculate_payback_period(cash_flows: FloatArray) -> Optional[float]:
     """Calculate simple payback period.
 
     Payback period is the time it takes for cumulative cash flows
     to become positive (recover initial investment).
 
     Args:
-        cash_flows: Annual cash flows INCLUDING initial investment as first element
+        cash_flows: Annual cash flows INCLUDING initial investment as first element, list or NumPy array
                    (e.g., [-500000, 100000, 105000, ...])
 
     Returns:
@@ -126,30 +275,31 @@ def calculate_payback_period(cash_flows: List[float]) -> Optional[float]:
     if len(cash_flows) < 2:
         return None
 
-    cumulative: float = 0.0
-    for year, cash_flow in enumerate(cash_flows):
-        cumulative += cash_flow
+    values = np.asarray(cash_flows, dtype=np.float64)
+    cumulative = np.cumsum(values)
 
-        if cumulative >= 0:
-            # Interpolate within the year
-            if year == 0:
-                return 0.0
+    # Cumulative cash flow need not be monotonic, so take the first crossing
+    # rather than binary-searching
+    recovered = cumulative >= 0
+    year = int(np.argmax(recovered))
+    if not recovered[year]:
+        return None  # Never pays back
 
-            # How much was needed at start of this year
-            prev_cumulative = cumulative - cash_flow
+    if year == 0:
+        return 0.0
 
-            # Fraction of year needed
-            fraction = -prev_cumulative / cash_flow
+    # How much was still needed at start of this year, and the fraction
+    # of this year's cash flow required to cover it
+    prev_cumulative = cumulative[year - 1]
+    fraction = -prev_cumulative / values[year]
 
-            # Return year - 1 + fraction because year 0 is initial investment
-            return (year - 1) + fraction
-
-    return None  # Never pays back
+    # Return year - 1 + fraction because year 0 is initial investment
+    return float((year - 1) + fraction)
 
 
 def aggregate_annual(
-    hourly_values: List[float],
-    prices: Optional[List[float]] = None,
+    hourly_values: FloatArray,
+    prices: Optional[FloatArray] = None,
     years: int = 1,
 ) -> List[float]:
     """Aggregate hourly values into annual totals.
@@ -158,7 +308,7 @@ def aggregate_annual(
     Otherwise, calculates annual sum (e.g., energy).
 
     Args:
-        hourly_values: Hourly power or flow values (MW)
+        hourly_values: Hourly power or flow values (MW), list or NumPy array
         prices: Optional hourly prices (EUR/MWh)
         years: Number of years (for validation)
 
@@ -181,22 +331,16 @@ def aggregate_annual(
     if prices is not None and len(prices) != expected_length:
         raise ValueError(f"Prices length {len(prices)} doesn't match hourly_values length {len(hourly_values)}")
 
-    annual_values = []
-
-    for year in range(years):
-        start_idx = year * hours_per_year
-        end_idx = (year + 1) * hours_per_year
-
-        year_values = hourly_values[start_idx:end_idx]
-
-        if prices is not None:
-            year_prices = prices[start_idx:end_idx]
-            # Revenue = sum(MW * hours * EUR/MWh) = sum(MW * EUR/MWh) for 1-hour intervals
-            annual_value = sum(v * p for v, p in zip(year_values, year_prices))
-        else:
-            # Just sum the values
-            annual_value = sum(year_values)
+    # One row per year, so each annual total is a single row reduction
+    year_values = np.asarray(hourly_values, dtype=np.float64).reshape(years, hours_per_year)
 
-        annual_values.append(annual_value)
+    if prices is None:
+        annual_totals = year_values.sum(axis=1)
+    else:
+        # Revenue = sum(MW * hours * EUR/MWh) = sum(MW * EUR/MWh) for 1-hour intervals;
+        # einsum fuses the multiply and row sum without a product temporary
+        year_prices = np.asarray(prices, dtype=np.float64).reshape(years, hours_per_year)
+        annual_totals = np.einsum("yh,yh->y", year_values, year_prices)
 
+    annual_values: List[float] = annual_totals.tolist()
     return annual_values
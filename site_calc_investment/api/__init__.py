@@ -1,5 +1,6 @@
 """API client for investment optimization."""
 
+from site_calc_investment.api.async_client import InvestmentAsyncClient, run_scenarios
 from site_calc_investment.api.client import InvestmentClient
 
-__all__ = ["InvestmentClient"]
+__all__ = ["InvestmentAsyncClient", "InvestmentClient", "run_scenarios"]
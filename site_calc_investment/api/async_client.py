@@ -0,0 +1,337 @@
+"""Asyncio Investment Client for Site-Calc API."""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, List, Optional
+
+import httpx
+
+from site_calc_investment.api.client import _CONNECTION_LIMITS, _BaseInvestmentClient
+from site_calc_investment.exceptions import ApiError, SiteCalcError
+from site_calc_investment.models.requests import InvestmentPlanningRequest
+from site_calc_investment.models.responses import InvestmentPlanningResponse, Job
+
+
+class InvestmentAsyncClient(_BaseInvestmentClient):
+    """Asyncio client for Site-Calc investment planning API.
+
+    Mirrors InvestmentClient on top of httpx.AsyncClient. Waiting for a job
+    is I/O-bound polling, so many scenarios can be awaited concurrently on
+    one event loop and one connection pool (see run_scenarios()).
+
+    Example:
+        >>> async with InvestmentAsyncClient(
+        ...     base_url="https://api.site-calc.example.com",
+        ...     api_key="inv_your_key_here"
+        ... ) as client:
+        ...     results = await run_scenarios(client, [request_10mw, request_20mw])
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 900.0,
+        max_retries: int = 3,
+        http2: bool = False,
+    ):
+        """Initialize the async investment client.
+
+        Args:
+            base_url: Base URL of the API (e.g., "https://api.site-calc.example.com")
+            api_key: API key with 'inv_' prefix (investment client)
+            timeout: Default request timeout in seconds (default: 15 minutes)
+            max_retries: Maximum number of retry attempts for failed requests
+            http2: Use HTTP/2 when the server supports it (requires the
+                'http2' extra: pip install site-calc-investment[http2])
+
+        Raises:
+            ValueError: If API key doesn't start with 'inv_'
+            ImportError: If http2=True but the 'h2' package is not installed
+        """
+        super().__init__(base_url, api_key, timeout, max_retries)
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._headers,
+            timeout=timeout,
+            limits=_CONNECTION_LIMITS,
+            http2=http2,
+        )
+
+    async def __aenter__(self) -> "InvestmentAsyncClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def _validate_server_version(self) -> None:
+        """Check server API version compatibility once per client instance."""
+        if self._version_checked:
+            return
+
+        self._version_checked = True
+
+        try:
+            self._warn_on_version_mismatch(await self._client.get("/health"))
+        except Exception:
+            pass
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Make HTTP request with retry logic.
+
+        Same retry policy as InvestmentClient._request_with_retry, but waits
+        with asyncio.sleep so other coroutines keep running.
+
+        Args:
+            method: HTTP method (GET, POST, DELETE)
+            path: API path
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            HTTP response
+
+        Raises:
+            Various exceptions based on response status
+        """
+        await self._validate_server_version()
+
+        for attempt in range(self.max_retries):
+            try:
+                response = await self._client.request(method, path, **kwargs)
+            except httpx.RequestError as e:
+                delay = self._retry_wait(method, attempt, e)
+            else:
+                if response.status_code < 400:
+                    return response
+                delay = self._retry_wait(method, attempt, response)
+            await asyncio.sleep(delay)
+
+        raise ApiError("Request failed after retries")
+
+    async def create_planning_job(self, request: InvestmentPlanningRequest) -> Job:
+        """Create a long-term investment planning job.
+
+        Args:
+            request: Investment planning request
+
+        Returns:
+            Job object with job_id and initial status
+
+        Raises:
+            ValidationError: If request is invalid
+            ForbiddenFeatureError: If using forbidden features (ANS)
+            LimitExceededError: If exceeding client limits
+            AuthenticationError: If API key is invalid
+        """
+        response = await self._request_with_retry(
+            "POST",
+            "/api/v1/jobs/device-planning",
+            content=request.model_dump_json_for_api(),
+        )
+
+        return Job(**response.json())
+
+    async def get_job_status(self, job_id: str) -> Job:
+        """Get current job status.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job object with current status
+
+        Raises:
+            JobNotFoundError: If job doesn't exist
+        """
+        response = await self._request_with_retry(
+            "GET",
+            f"/api/v1/jobs/{job_id}",
+        )
+
+        return Job(**response.json())
+
+    async def get_job_result(self, job_id: str) -> InvestmentPlanningResponse:
+        """Get job result (must be completed).
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Complete optimization result
+
+        Raises:
+            JobNotFoundError: If job doesn't exist
+            ApiError: If job is not completed
+        """
+        response = await self._request_with_retry(
+            "GET",
+            f"/api/v1/jobs/{job_id}/result",
+        )
+
+        return self._parse_result(response)
+
+    async def cancel_job(self, job_id: str) -> Job:
+        """Cancel a running job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job object with cancelled status
+
+        Raises:
+            JobNotFoundError: If job doesn't exist
+            ApiError: If job cannot be cancelled (already completed)
+        """
+        response = await self._request_with_retry(
+            "DELETE",
+            f"/api/v1/jobs/{job_id}",
+        )
+
+        return Job(**response.json())
+
+    async def cancel_all_jobs(self) -> dict[str, object]:
+        """Cancel all pending or running jobs.
+
+        Returns:
+            Dictionary with cancelled_count, cancelled_jobs and message
+
+        Raises:
+            AuthenticationError: If API key is invalid
+        """
+        response = await self._request_with_retry(
+            "DELETE",
+            "/api/v1/jobs",
+        )
+
+        result: dict[str, object] = response.json()
+        return result
+
+    async def wait_for_completion(
+        self,
+        job_id: str,
+        poll_interval: float = 2,
+        timeout: Optional[float] = 7200,
+        poll_interval_max: Optional[float] = 30,
+    ) -> InvestmentPlanningResponse:
+        """Wait for job to complete and return result.
+
+        Same adaptive polling as InvestmentClient.wait_for_completion, with
+        asyncio.sleep between polls.
+
+        Args:
+            job_id: Job identifier
+            poll_interval: Seconds before the first status re-check (default: 2s)
+            timeout: Maximum wait time in seconds (default: 2 hours, None=unlimited)
+            poll_interval_max: Upper bound for the backed-off poll interval
+                (default: 30s, None=poll at a fixed ``poll_interval``)
+
+        Returns:
+            Complete optimization result
+
+        Raises:
+            TimeoutError: If timeout is exceeded
+            JobNotFoundError: If job doesn't exist
+            OptimizationError: If job fails
+        """
+        start_time = time.time()
+        max_interval = poll_interval if poll_interval_max is None else max(poll_interval, poll_interval_max)
+        interval = poll_interval
+        job: Optional[Job] = None
+        etag: Optional[str] = None
+
+        while True:
+            response = await self._request_with_retry(
+                "GET",
+                f"/api/v1/jobs/{job_id}",
+                headers=self._revalidation_headers(job, etag),
+            )
+            job, etag = self._parse_polled_status(response, job, etag)
+
+            if self._is_completed(job):
+                return await self.get_job_result(job_id)
+
+            # Wait before next poll
+            await asyncio.sleep(self._next_sleep(start_time, interval, timeout))
+            interval = min(interval * 1.5, max_interval)
+
+    async def submit_and_wait(
+        self,
+        request: InvestmentPlanningRequest,
+        **wait_kwargs: Any,
+    ) -> InvestmentPlanningResponse:
+        """Create a planning job and wait for its result.
+
+        If the wait is cancelled, the job is cancelled on the server too
+        (best effort) so it does not keep running unobserved.
+
+        Args:
+            request: Investment planning request
+            **wait_kwargs: Passed to wait_for_completion (poll_interval, timeout, ...)
+
+        Returns:
+            Complete optimization result
+        """
+        job = await self.create_planning_job(request)
+        try:
+            return await self.wait_for_completion(job.job_id, **wait_kwargs)
+        except asyncio.CancelledError:
+            with contextlib.suppress(SiteCalcError):
+                await self.cancel_job(job.job_id)
+            raise
+
+
+async def run_scenarios(
+    client: InvestmentAsyncClient,
+    requests: List[InvestmentPlanningRequest],
+    **wait_kwargs: Any,
+) -> List[InvestmentPlanningResponse]:
+    """Submit several scenarios and wait for all of them concurrently.
+
+    Wall time is roughly that of the slowest scenario rather than the sum.
+    Results are returned in the order of ``requests``, ready for
+    compare_scenarios().
+
+    Fails fast: the first scenario to raise cancels the others (including
+    their server-side jobs) and its exception is propagated.
+
+    Args:
+        client: Async investment client
+        requests: Planning requests, one per scenario
+        **wait_kwargs: Passed to wait_for_completion (poll_interval, timeout, ...)
+
+    Returns:
+        List of optimization results
+
+    Example:
+        >>> async with InvestmentAsyncClient(api_url, api_key) as client:
+        ...     results = await run_scenarios(client, requests, timeout=3600)
+        >>> comparison = compare_scenarios(results, names=["10 MWh", "20 MWh"])
+    """
+    tasks = [asyncio.ensure_future(client.submit_and_wait(request, **wait_kwargs)) for request in requests]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # gather() does not cancel the remaining awaitables on failure
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -1,10 +1,12 @@
 """Investment Client for Site-Calc API."""
 
+import math
 import time
 import warnings
 from typing import Any, Optional
 
 import httpx
+from pydantic_core import from_json
 
 from site_calc_investment import __version__
 from site_calc_investment.exceptions import (
@@ -21,45 +23,33 @@ from site_calc_investment.exceptions import (
 from site_calc_investment.models.requests import InvestmentPlanningRequest
 from site_calc_investment.models.responses import InvestmentPlanningResponse, Job
 
+# Keep idle connections alive longer than the maximum poll interval so that
+# status polls reuse the pooled TCP/TLS connection instead of reconnecting
+# (httpx drops idle connections after 5s by default).
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=8,
+    max_keepalive_connections=4,
+    keepalive_expiry=120.0,
+)
 
-class InvestmentClient:
-    """Client for Site-Calc investment planning API.
+# Methods that can be re-sent safely after a failure with unknown outcome
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
 
-    This client is specifically for long-term capacity planning and
-    investment ROI analysis. It:
-    - Only supports 1-hour resolution
-    - Maximum 100,000 intervals (~11 years)
-    - Does NOT support ancillary services
-    - Only has access to /device-planning endpoint
+# Longest Retry-After wait honored, in seconds; larger values are clamped so a
+# misbehaving server cannot block the caller for hours
+_MAX_RETRY_AFTER = 60.0
 
-    Example:
-        >>> client = InvestmentClient(
-        ...     base_url="https://api.site-calc.example.com",
-        ...     api_key="inv_your_key_here"
-        ... )
-        >>> job = client.create_planning_job(request)
-        >>> result = client.wait_for_completion(job.job_id, timeout=7200)
-        >>> print(f"NPV: €{result.summary.investment_metrics.npv:,.0f}")
-    """
+
+class _BaseInvestmentClient:
+    """Configuration, error mapping and parsing shared by the sync and async clients."""
 
     def __init__(
         self,
         base_url: str,
         api_key: str,
-        timeout: float = 900.0,
-        max_retries: int = 3,
+        timeout: float,
+        max_retries: int,
     ):
-        """Initialize the investment client.
-
-        Args:
-            base_url: Base URL of the API (e.g., "https://api.site-calc.example.com")
-            api_key: API key with 'inv_' prefix (investment client)
-            timeout: Default request timeout in seconds (default: 1 hour)
-            max_retries: Maximum number of retry attempts for failed requests
-
-        Raises:
-            ValueError: If API key doesn't start with 'inv_'
-        """
         if not api_key.startswith("inv_"):
             raise ValueError("API key must start with 'inv_' for investment client")
 
@@ -68,61 +58,34 @@ class InvestmentClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.max_intervals = 100_000
-
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-            timeout=timeout,
-        )
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
         self._version_checked = False
 
-    def __enter__(self) -> "InvestmentClient":
-        """Context manager entry."""
-        return self
-
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: object,
-    ) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _validate_server_version(self) -> None:
-        """Check server API version compatibility and warn if mismatched.
+    @staticmethod
+    def _warn_on_version_mismatch(response: httpx.Response) -> None:
+        """Warn if a /health response reports an incompatible API version.
 
         Compares client MAJOR.MINOR with server api_version.
-        Only runs once per client instance.
-        """
-        if self._version_checked:
-            return
 
-        self._version_checked = True
+        Args:
+            response: Response from GET /health
+        """
         client_api_version = ".".join(__version__.split(".")[:2])
 
-        try:
-            response = self._client.get("/health")
-            if response.status_code == 200:
-                health = response.json()
-                server_api_version = health.get("api_version")
-                if server_api_version and client_api_version != server_api_version:
-                    warnings.warn(
-                        f"Client version {__version__} (API {client_api_version}) may not be compatible "
-                        f"with server API {server_api_version}. Consider upgrading.",
-                        UserWarning,
-                        stacklevel=3,
-                    )
-        except Exception:
-            pass
+        if response.status_code == 200:
+            health = response.json()
+            server_api_version = health.get("api_version")
+            if server_api_version and client_api_version != server_api_version:
+                warnings.warn(
+                    f"Client version {__version__} (API {client_api_version}) may not be compatible "
+                    f"with server API {server_api_version}. Consider upgrading.",
+                    UserWarning,
+                    stacklevel=4,
+                )
 
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle API error responses.
@@ -186,6 +149,280 @@ class InvestmentClient:
         else:
             raise ApiError(message, code, details)
 
+    @staticmethod
+    def _can_retry(method: str, error: Optional[httpx.RequestError] = None) -> bool:
+        """Check whether a failed request can be re-sent without side effects.
+
+        Idempotent methods can always be retried. Non-idempotent ones (POST)
+        only when the connection was never established, so the server cannot
+        have received the request.
+
+        Args:
+            method: HTTP method
+            error: Transport error raised by httpx, if any
+
+        Returns:
+            True if the request may be retried
+        """
+        if method.upper() in _IDEMPOTENT_METHODS:
+            return True
+        return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a failed response.
+
+        Honors a numeric Retry-After header (sent with 429/503), capped at
+        60 seconds; otherwise falls back to exponential backoff.
+
+        Args:
+            response: Failed HTTP response
+            attempt: Zero-based attempt number
+
+        Returns:
+            Delay in seconds
+        """
+        try:
+            delay = float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            delay = math.nan
+        if not math.isfinite(delay):
+            return float(2**attempt)
+        return min(max(0.0, delay), _MAX_RETRY_AFTER)
+
+    def _retry_wait(
+        self,
+        method: str,
+        attempt: int,
+        outcome: httpx.Response | httpx.RequestError,
+    ) -> float:
+        """Decide what to do after a failed attempt.
+
+        Shared by the sync and async retry loops, which only send and sleep.
+
+        Args:
+            method: HTTP method
+            attempt: Zero-based attempt number
+            outcome: Error response (status >= 400), or the transport error
+                raised by httpx if the server never answered
+
+        Returns:
+            Seconds to wait before the next attempt
+
+        Raises:
+            SiteCalcError: If the request must not or can no longer be retried
+        """
+        last_attempt = attempt >= self.max_retries - 1
+
+        if isinstance(outcome, httpx.RequestError):
+            exc: SiteCalcError
+            if isinstance(outcome, httpx.TimeoutException):
+                exc = TimeoutError(f"Request timeout after {self.timeout}s", timeout=self.timeout)
+            else:
+                exc = ApiError(f"Request failed: {str(outcome)}")
+            if last_attempt or not self._can_retry(method, outcome):
+                raise exc
+            return float(2**attempt)
+
+        response = outcome
+        # Don't retry client errors (4xx) except timeouts
+        if 400 <= response.status_code < 500 and response.status_code not in [408, 429]:
+            self._handle_error(response)
+
+        # A server error on a non-idempotent request (job creation) may
+        # already have taken effect - retrying could duplicate the job
+        if response.status_code >= 500 and not self._can_retry(method):
+            self._handle_error(response)
+
+        # Retry server errors (5xx) and specific client errors
+        if last_attempt:
+            self._handle_error(response)
+        return self._retry_delay(response, attempt)
+
+    @staticmethod
+    def _parse_result(response: httpx.Response) -> InvestmentPlanningResponse:
+        """Parse a /result response into an InvestmentPlanningResponse.
+
+        Args:
+            response: Successful response from GET /jobs/{id}/result
+
+        Returns:
+            Complete optimization result
+        """
+        # Results carry full hourly schedules (multi-MB for long horizons);
+        # pydantic-core's parser is several times faster than response.json()
+        data = from_json(response.content)
+
+        # Extract result from wrapper and flatten
+        result_data = {
+            "job_id": str(data.get("job_id")),
+            "status": data.get("status"),
+            **data.get("result", {}),
+        }
+
+        return InvestmentPlanningResponse(**result_data)
+
+    @staticmethod
+    def _is_completed(job: Job) -> bool:
+        """Check whether a polled job has completed successfully.
+
+        Args:
+            job: Current job status
+
+        Returns:
+            True if completed, False if still pending or running
+
+        Raises:
+            OptimizationError: If job failed
+            ApiError: If job was cancelled
+        """
+        if job.status == "completed":
+            return True
+        elif job.status == "failed":
+            error_msg: str = str(job.error.get("message", "Unknown error")) if job.error else "Unknown error"
+            error_code = job.error.get("code") if job.error else None
+            error_details = job.error.get("details") if job.error else None
+            raise OptimizationError(error_msg, error_code, error_details)
+        elif job.status == "cancelled":
+            raise ApiError("Job was cancelled")
+        return False
+
+    @staticmethod
+    def _next_sleep(start_time: float, interval: float, timeout: Optional[float]) -> float:
+        """Seconds to wait before the next poll, clamped to the remaining timeout.
+
+        Args:
+            start_time: time.time() when waiting started
+            interval: Current poll interval
+            timeout: Maximum wait time in seconds (None=unlimited)
+
+        Returns:
+            Delay in seconds
+
+        Raises:
+            TimeoutError: If timeout is exceeded
+        """
+        if timeout is None:
+            return interval
+
+        elapsed = time.time() - start_time
+        if elapsed > timeout:
+            raise TimeoutError(f"Job did not complete within {timeout}s", timeout=timeout)
+        return min(interval, timeout - elapsed)
+
+    @staticmethod
+    def _revalidation_headers(previous: Optional[Job], etag: Optional[str]) -> Optional[dict[str, str]]:
+        """If-None-Match header revalidating the previous status poll, if any."""
+        return {"If-None-Match": etag} if previous is not None and isinstance(etag, str) else None
+
+    @staticmethod
+    def _parse_polled_status(
+        response: httpx.Response,
+        previous: Optional[Job],
+        etag: Optional[str],
+    ) -> tuple[Job, Optional[str]]:
+        """Parse a status poll, reusing ``previous`` on 304 Not Modified.
+
+        Args:
+            response: Response from GET /jobs/{id}
+            previous: Job returned by the previous poll, if any
+            etag: ETag header returned with ``previous``
+
+        Returns:
+            Tuple of (job, etag)
+        """
+        if response.status_code == 304 and previous is not None:
+            return previous, etag
+
+        new_etag = response.headers.get("ETag")
+        return Job(**response.json()), new_etag if isinstance(new_etag, str) else None
+
+
+class InvestmentClient(_BaseInvestmentClient):
+    """Client for Site-Calc investment planning API.
+
+    This client is specifically for long-term capacity planning and
+    investment ROI analysis. It:
+    - Only supports 1-hour resolution
+    - Maximum 100,000 intervals (~11 years)
+    - Does NOT support ancillary services
+    - Only has access to /device-planning endpoint
+
+    Example:
+        >>> client = InvestmentClient(
+        ...     base_url="https://api.site-calc.example.com",
+        ...     api_key="inv_your_key_here"
+        ... )
+        >>> job = client.create_planning_job(request)
+        >>> result = client.wait_for_completion(job.job_id, timeout=7200)
+        >>> print(f"NPV: €{result.summary.investment_metrics.npv:,.0f}")
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 900.0,
+        max_retries: int = 3,
+        http2: bool = False,
+    ):
+        """Initialize the investment client.
+
+        Args:
+            base_url: Base URL of the API (e.g., "https://api.site-calc.example.com")
+            api_key: API key with 'inv_' prefix (investment client)
+            timeout: Default request timeout in seconds (default: 1 hour)
+            max_retries: Maximum number of retry attempts for failed requests
+            http2: Use HTTP/2 when the server supports it (requires the
+                'http2' extra: pip install site-calc-investment[http2])
+
+        Raises:
+            ValueError: If API key doesn't start with 'inv_'
+            ImportError: If http2=True but the 'h2' package is not installed
+        """
+        super().__init__(base_url, api_key, timeout, max_retries)
+
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=self._headers,
+            timeout=timeout,
+            limits=_CONNECTION_LIMITS,
+            http2=http2,
+        )
+
+    def __enter__(self) -> "InvestmentClient":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP client."""
+        self._client.close()
+
+    def _validate_server_version(self) -> None:
+        """Check server API version compatibility and warn if mismatched.
+
+        Compares client MAJOR.MINOR with server api_version.
+        Only runs once per client instance.
+        """
+        if self._version_checked:
+            return
+
+        self._version_checked = True
+
+        try:
+            self._warn_on_version_mismatch(self._client.get("/health"))
+        except Exception:
+            pass
+
     def _request_with_retry(
         self,
         method: str,
@@ -206,42 +443,18 @@ class InvestmentClient:
             Various exceptions based on response status
         """
         self._validate_server_version()
-        last_exception: SiteCalcError | None = None
 
         for attempt in range(self.max_retries):
             try:
                 response = self._client.request(method, path, **kwargs)
-
+            except httpx.RequestError as e:
+                delay = self._retry_wait(method, attempt, e)
+            else:
                 if response.status_code < 400:
                     return response
+                delay = self._retry_wait(method, attempt, response)
+            time.sleep(delay)
 
-                # Don't retry client errors (4xx) except timeouts
-                if 400 <= response.status_code < 500 and response.status_code not in [408, 429]:
-                    self._handle_error(response)
-
-                # Retry server errors (5xx) and specific client errors
-                if attempt < self.max_retries - 1:
-                    wait_time = 2**attempt  # Exponential backoff
-                    time.sleep(wait_time)
-                    continue
-
-                self._handle_error(response)
-
-            except httpx.TimeoutException:
-                last_exception = TimeoutError(f"Request timeout after {self.timeout}s", timeout=self.timeout)
-                if attempt < self.max_retries - 1:
-                    time.sleep(2**attempt)
-                    continue
-                raise last_exception
-            except httpx.RequestError as e:
-                last_exception = ApiError(f"Request failed: {str(e)}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2**attempt)
-                    continue
-                raise last_exception
-
-        if last_exception:
-            raise last_exception
         raise ApiError("Request failed after retries")
 
     def create_planning_job(self, request: InvestmentPlanningRequest) -> Job:
@@ -268,12 +481,13 @@ class InvestmentClient:
             >>> job = client.create_planning_job(request)
             >>> print(f"Job ID: {job.job_id}")
         """
-        payload = request.model_dump_for_api()
-
+        # Serialize straight to JSON with pydantic-core; going through a dict
+        # and the stdlib encoder used by httpx's json= is slow on the long
+        # price/profile arrays.
         response = self._request_with_retry(
             "POST",
             "/api/v1/jobs/device-planning",
-            json=payload,
+            content=request.model_dump_json_for_api(),
         )
 
         return Job(**response.json())
@@ -323,16 +537,7 @@ class InvestmentClient:
             f"/api/v1/jobs/{job_id}/result",
         )
 
-        data = response.json()
-
-        # Extract result from wrapper and flatten
-        result_data = {
-            "job_id": str(data.get("job_id")),
-            "status": data.get("status"),
-            **data.get("result", {}),
-        }
-
-        return InvestmentPlanningResponse(**result_data)
+        return self._parse_result(response)
 
     def cancel_job(self, job_id: str) -> Job:
         """Cancel a running job.
@@ -389,17 +594,26 @@ class InvestmentClient:
     def wait_for_completion(
         self,
         job_id: str,
-        poll_interval: float = 30,
+        poll_interval: float = 2,
         timeout: Optional[float] = 7200,
+        poll_interval_max: Optional[float] = 30,
     ) -> InvestmentPlanningResponse:
         """Wait for job to complete and return result.
 
-        Polls the job status at regular intervals until completion or timeout.
+        Polls the job status until completion or timeout. The wait between
+        polls starts at ``poll_interval`` and grows by 1.5x after each check
+        up to ``poll_interval_max``, so short jobs are picked up quickly
+        without hammering the API on long ones. The last wait is shortened
+        so the timeout is not overshot. Status polls are revalidated with
+        the last ``ETag`` so an unchanged job costs a bodyless 304 instead
+        of a full response.
 
         Args:
             job_id: Job identifier
-            poll_interval: Seconds between status checks (default: 30s)
+            poll_interval: Seconds before the first status re-check (default: 2s)
             timeout: Maximum wait time in seconds (default: 2 hours, None=unlimited)
+            poll_interval_max: Upper bound for the backed-off poll interval
+                (default: 30s, None=poll at a fixed ``poll_interval``)
 
         Returns:
             Complete optimization result
@@ -410,33 +624,46 @@ class InvestmentClient:
             OptimizationError: If job fails
 
         Example:
-            >>> result = client.wait_for_completion(
-            ...     job_id,
-            ...     poll_interval=30,
-            ...     timeout=7200
-            ... )
+            >>> result = client.wait_for_completion(job_id, timeout=7200)
             >>> print(f"Solved in {result.summary.solve_time_seconds:.1f}s")
         """
         start_time = time.time()
+        max_interval = poll_interval if poll_interval_max is None else max(poll_interval, poll_interval_max)
+        interval = poll_interval
+        job: Optional[Job] = None
+        etag: Optional[str] = None
 
         while True:
-            job = self.get_job_status(job_id)
+            job, etag = self._poll_job_status(job_id, job, etag)
 
-            if job.status == "completed":
+            if self._is_completed(job):
                 return self.get_job_result(job_id)
-            elif job.status == "failed":
-                error_msg: str = str(job.error.get("message", "Unknown error")) if job.error else "Unknown error"
-                error_code = job.error.get("code") if job.error else None
-                error_details = job.error.get("details") if job.error else None
-                raise OptimizationError(error_msg, error_code, error_details)
-            elif job.status == "cancelled":
-                raise ApiError("Job was cancelled")
-
-            # Check timeout
-            if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed > timeout:
-                    raise TimeoutError(f"Job did not complete within {timeout}s", timeout=timeout)
 
             # Wait before next poll
-            time.sleep(poll_interval)
+            time.sleep(self._next_sleep(start_time, interval, timeout))
+            interval = min(interval * 1.5, max_interval)
+
+    def _poll_job_status(
+        self,
+        job_id: str,
+        previous: Optional[Job],
+        etag: Optional[str],
+    ) -> tuple[Job, Optional[str]]:
+        """Fetch job status, revalidating the previous poll with its ETag.
+
+        Args:
+            job_id: Job identifier
+            previous: Job returned by the previous poll, if any
+            etag: ETag header returned with ``previous``
+
+        Returns:
+            Tuple of (job, etag). ``previous`` is returned unchanged when the
+            server answers 304 Not Modified.
+        """
+        response = self._request_with_retry(
+            "GET",
+            f"/api/v1/jobs/{job_id}",
+            headers=self._revalidation_headers(previous, etag),
+        )
+
+        return self._parse_polled_status(response, previous, etag)
@@ -1,5 +1,6 @@
 """Configuration for the MCP server, loaded from environment variables."""
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
@@ -18,9 +19,14 @@ class Config:
     api_key: str
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> "Config":
         """Load configuration from environment variables.
 
+        The result is cached for the lifetime of the process (failures are
+        not cached); call ``Config.from_env.cache_clear()`` after changing
+        the environment.
+
         :raises ValueError: If required environment variables are missing.
         """
         api_url = os.environ.get("INVESTMENT_API_URL", "")
@@ -1,29 +1,63 @@
 """Data loading utilities for resolving price/profile shorthand to arrays."""
 
+import asyncio
+import codecs
+import contextlib
 import csv
-import json
+import functools
+import io
+import itertools
+import mmap
+import operator
 import os
 import posixpath
-from typing import Any, Optional, Union
+import re
+import warnings
+from typing import IO, Any, Iterator, Optional, Union
 from urllib.parse import urlparse
 
+import numpy as np
+from pydantic_core import from_json
+
+# Files at least this large are parsed with pyarrow when it is installed; for
+# smaller ones the import cost outweighs the faster tokenizer.
+_ARROW_MIN_BYTES = 1 << 20
+
+# Bytes handed to csv.Sniffer - enough for dozens of rows of a wide file
+_SNIFF_SAMPLE_BYTES = 64 * 1024
+
+# Delimiters csv.Sniffer may choose. Unrestricted it can pick "." or a digit
+# in single-column numeric files, splitting every decimal number.
+_SNIFF_DELIMITERS = ",;\t| "
+
+# Dialects implied by the file extension when the header line is unambiguous
+# (semicolon-separated .csv files still go through the sniffer)
+_EXT_DIALECTS: dict[str, type[csv.Dialect]] = {".csv": csv.excel, ".tsv": csv.excel_tab}
+
+# File buffer for streamed CSV parsing and download chunk size; the 8 KB
+# defaults cost one syscall per few hundred rows
+_IO_BUFFER_BYTES = 1 << 20
+
+# Per-request timeout for URL downloads, in seconds
+_DOWNLOAD_TIMEOUT = 30.0
+
 
 def resolve_price_or_profile(
     value: Union[float, int, list[float], dict[str, Any]],
     expected_length: Optional[int],
-) -> list[float]:
-    """Resolve a price or profile value to a flat list of floats.
+) -> np.ndarray:
+    """Resolve a price or profile value to a flat float64 array.
 
     Accepts:
     - float/int: expanded to constant array of expected_length
-    - list[float]: validated length (if expected_length set), returned as-is
+    - list[float]: validated length (if expected_length set), converted to an array
     - {"file": "path.csv"}: loaded from CSV (first numeric column)
     - {"file": "path.csv", "column": "price_eur"}: specific column from CSV
     - {"file": "path.json"}: loaded from JSON (flat array)
 
     :param value: The value to resolve.
     :param expected_length: Expected array length (from timespan). None skips length validation.
-    :returns: List of floats.
+    :returns: 1-D float64 array.
     :raises ValueError: If the value cannot be resolved or has wrong length.
     :raises FileNotFoundError: If a referenced file does not exist.
     """
@@ -32,13 +66,13 @@ def resolve_price_or_profile(
             raise ValueError(
                 "Cannot expand scalar value without a timespan. Set the timespan first, or provide an explicit array."
             )
-        return [float(value)] * expected_length
+        return np.full(expected_length, float(value), dtype=np.float64)
 
     if isinstance(value, list):
-        result = [float(v) for v in value]
-        if expected_length is not None and len(result) != expected_length:
+        result = _to_float_array(value, "List")
+        if expected_length is not None and result.shape[0] != expected_length:
             raise ValueError(
-                f"Array length {len(result)} does not match expected length {expected_length} "
+                f"Array length {result.shape[0]} does not match expected length {expected_length} "
                 f"(from timespan). Provide exactly {expected_length} values."
             )
         return result
@@ -53,31 +87,34 @@ def resolve_price_or_profile(
     )
 
 
-def _load_from_file(spec: dict[str, Any], expected_length: Optional[int]) -> list[float]:
+def _load_from_file(spec: dict[str, Any], expected_length: Optional[int]) -> np.ndarray:
     """Load data from a file reference.
 
     :param spec: Dict with "file" key and optional "column" key.
     :param expected_length: Expected array length.
-    :returns: List of floats loaded from file.
+    :returns: Float64 array loaded from file.
     """
     file_path = spec.get("file")
     if not file_path:
         raise ValueError('File reference must include a "file" key with the path.')
 
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(
-            f"Data file not found: {file_path}. Provide an absolute path to a CSV or JSON file on the local filesystem."
-        )
-
     ext = os.path.splitext(file_path)[1].lower()
     column = spec.get("column")
 
-    if ext == ".json":
-        result = _load_json(file_path)
-    elif ext in (".csv", ".tsv", ".txt"):
-        result = _load_csv(file_path, column)
-    else:
-        raise ValueError(f"Unsupported file format: '{ext}'. Supported formats: .csv, .tsv, .json")
+    # No separate existence check: a missing file surfaces when it is opened
+    try:
+        if ext == ".json":
+            result = _load_json(file_path)
+        elif ext in (".csv", ".tsv", ".txt"):
+            result = _load_csv(file_path, column)
+        elif not os.path.exists(file_path):
+            raise FileNotFoundError(file_path)
+        else:
+            raise ValueError(f"Unsupported file format: '{ext}'. Supported formats: .csv, .tsv, .json")
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Data file not found: {file_path}. Provide an absolute path to a CSV or JSON file on the local filesystem."
+        ) from None
 
     if expected_length is not None and len(result) != expected_length:
         raise ValueError(
@@ -88,40 +125,115 @@ def _load_from_file(spec: dict[str, Any], expected_length: Optional[int]) -> lis
     return result
 
 
-def _load_json(file_path: str) -> list[float]:
+def _load_json(file_path: str) -> np.ndarray:
     """Load a flat array from a JSON file."""
-    with open(file_path, encoding="utf-8") as f:
-        data = json.load(f)
+    # pydantic-core's Rust parser is several times faster than json.load on
+    # number-heavy files
+    with open(file_path, "rb") as f:
+        data = from_json(f.read())
 
     if not isinstance(data, list):
         raise ValueError(
             f"JSON file '{file_path}' must contain a flat array of numbers, but got {type(data).__name__}."
         )
 
+    return _to_float_array(data, f"JSON file '{file_path}'")
+
+
+def _to_float_array(values: list[Any], source: str) -> np.ndarray:
+    """Convert a list of numbers to a 1-D float64 array in one C-level pass.
+
+    :param values: List of numbers (or numeric strings).
+    :param source: Description of where the values came from, for error messages.
+    :returns: 1-D float64 array.
+    :raises ValueError: If a value is not numeric or the list is nested.
+    """
     try:
-        return [float(v) for v in data]
+        result = np.fromiter(values, dtype=np.float64, count=len(values))
     except (TypeError, ValueError) as e:
-        raise ValueError(f"JSON file '{file_path}' contains non-numeric values: {e}") from e
+        if any(isinstance(v, list) for v in values):
+            raise ValueError(f"{source} must contain a flat array of numbers, but got nested arrays.") from e
+        raise ValueError(f"{source} contains non-numeric values: {e}") from e
+
+    # fromiter turns None into NaN, which float() used to reject; only scan
+    # for it when a NaN actually shows up
+    if np.isnan(result).any() and None in values:
+        raise ValueError(f"{source} contains non-numeric values: null")
+    return result
 
 
-def _load_csv(file_path: str, column: Optional[str] = None) -> list[float]:
-    """Load numeric data from a CSV file.
+class _KnownDialectSniffer(csv.Sniffer):
+    """Sniffer whose sniff() returns an already detected dialect.
 
-    If column is specified, reads that column by header name.
-    Otherwise, reads the first numeric column.
+    csv.Sniffer.has_header() sniffs the sample again internally; this lets
+    it reuse the first result instead of repeating the regex scans.
     """
-    with open(file_path, encoding="utf-8", newline="") as f:
-        sample = f.read(8192)
-        f.seek(0)
 
+    def __init__(self, dialect: type[csv.Dialect]) -> None:
+        super().__init__()
+        self._dialect = dialect
+
+    def sniff(self, sample: str, delimiters: Optional[str] = None) -> type[csv.Dialect]:
+        return self._dialect
+
+
+def _read_csv_sample(file_path: str) -> str:
+    """Read the leading sniffing sample of a file through a read-only mmap.
+
+    The slice is served straight from the page cache, and the text stream
+    used for parsing does not have to be read and rewound for it.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""  # mmap cannot map empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            sample = mm[:_SNIFF_SAMPLE_BYTES]
+            # Unless the sample is the whole file, the cut may split a multi-byte
+            # character: final=False holds that tail back, while invalid bytes
+            # still raise UnicodeDecodeError
+            return codecs.getincrementaldecoder("utf-8")().decode(sample, final=len(sample) == len(mm))
+
+
+def _sniff_csv(sample: str, ext: str = "") -> tuple[type[csv.Dialect], bool]:
+    """Detect the dialect and header row of a CSV sample.
+
+    For .csv and .tsv files whose first line is plainly split by the
+    extension's delimiter, the dialect is taken from the extension and
+    csv.Sniffer.sniff() is skipped.
+
+    :param sample: Leading part of the file.
+    :param ext: Lowercase file extension including the dot, if known.
+    """
+    known = _EXT_DIALECTS.get(ext)
+    if known is not None and _is_plainly_delimited(sample.partition("\n")[0], known.delimiter):
+        dialect = known
+    else:
         try:
-            dialect = csv.Sniffer().sniff(sample)
+            dialect = csv.Sniffer().sniff(sample, delimiters=_SNIFF_DELIMITERS)
         except csv.Error:
-            dialect = csv.excel  # type: ignore[assignment]
+            dialect = csv.excel
+
+    return dialect, _KnownDialectSniffer(dialect).has_header(sample)
 
-        has_header = csv.Sniffer().has_header(sample)
-        f.seek(0)
 
+def _is_plainly_delimited(line: str, delimiter: str) -> bool:
+    """Check that a line uses delimiter, no other candidate, and no padding after it."""
+    return (
+        delimiter in line
+        and f"{delimiter} " not in line
+        and not any(c in line for c in _SNIFF_DELIMITERS if c not in (delimiter, " "))
+    )
+
+
+def _load_csv(file_path: str, column: Optional[str] = None) -> np.ndarray:
+    """Load numeric data from a CSV file.
+
+    If column is specified, reads that column by header name.
+    Otherwise, reads the first numeric column.
+    """
+    dialect, has_header = _sniff_csv(_read_csv_sample(file_path), os.path.splitext(file_path)[1].lower())
+
+    with open(file_path, encoding="utf-8", newline="", buffering=_IO_BUFFER_BYTES) as f:
         reader = csv.reader(f, dialect)
 
         if has_header:
@@ -134,42 +246,142 @@ def _load_csv(file_path: str, column: Optional[str] = None) -> list[float]:
                         f"Column '{column}' not found in '{file_path}'. Available columns: {', '.join(headers)}"
                     )
             else:
-                col_idx = _find_first_numeric_column(headers, file_path)
+                col_idx = _find_first_numeric_column(headers)
         else:
             if column:
                 raise ValueError(f"Cannot use column='{column}' with '{file_path}': the file has no header row.")
             col_idx = 0
 
+        if os.fstat(f.fileno()).st_size >= _ARROW_MIN_BYTES:
+            arrow_values = _load_csv_column_arrow(file_path, dialect, has_header, col_idx)
+            if arrow_values is not None and arrow_values.size:
+                return arrow_values
+
+        numpy_values = _load_csv_column_numpy(file_path, dialect, has_header, col_idx)
+        if numpy_values is not None and numpy_values.size:
+            return numpy_values
+
+        # Slow path: only reached for files the C parsers reject (blank
+        # cells, ragged rows, non-numeric values); reports the exact problem
+
         values: list[float] = []
+        get_cell = operator.itemgetter(col_idx)
         for row_num, row in enumerate(reader, start=2 if has_header else 1):
-            if not row or all(cell.strip() == "" for cell in row):
+            # Blank row (no cells or only whitespace) - one join+strip in C
+            if not "".join(row).strip():
                 continue
-            if col_idx >= len(row):
+            try:
+                values.append(float(get_cell(row)))
+            except IndexError:
                 raise ValueError(
                     f"Row {row_num} in '{file_path}' has only {len(row)} columns, "
                     f"but column index {col_idx} was expected."
                 )
-            try:
-                values.append(float(row[col_idx]))
             except ValueError:
                 raise ValueError(
-                    f"Non-numeric value '{row[col_idx]}' at row {row_num}, column {col_idx} in '{file_path}'."
+                    f"Non-numeric value '{get_cell(row)}' at row {row_num}, column {col_idx} in '{file_path}'."
                 )
 
     if not values:
         raise ValueError(f"No data found in '{file_path}'.")
 
+    return np.array(values, dtype=np.float64)
+
+
+def _load_csv_column_arrow(
+    file_path: str, dialect: Union[type[csv.Dialect], csv.Dialect], has_header: bool, col_idx: int
+) -> Optional[np.ndarray]:
+    """Parse a single numeric CSV column with pyarrow's C++ reader.
+
+    Returns None when pyarrow is not installed or the file is not clean
+    numeric data (ragged rows, blank cells, non-numeric values); the caller
+    then falls back to the stdlib parser, which reports the exact problem.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+
+    column_name = f"f{col_idx}"
+    try:
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(
+                block_size=1 << 20, skip_rows=1 if has_header else 0, autogenerate_column_names=True
+            ),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=dialect.delimiter,
+                quote_char=dialect.quotechar or False,
+                double_quote=dialect.doublequote,
+                escape_char=dialect.escapechar or False,
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=[column_name], column_types={column_name: pa.float64()}
+            ),
+        )
+    except (pa.ArrowException, ValueError):
+        return None
+
+    column = table.column(column_name)
+    if column.null_count:
+        return None
+    values: np.ndarray = column.to_numpy()
     return values
 
 
-def _find_first_numeric_column(headers: list[str], file_path: str) -> int:
+def _load_csv_column_numpy(
+    file_path: str, dialect: Union[type[csv.Dialect], csv.Dialect], has_header: bool, col_idx: int
+) -> Optional[np.ndarray]:
+    """Parse a single numeric CSV column with NumPy's C text reader.
+
+    Returns None if the file is not clean numeric data in that column; the
+    caller then falls back to the stdlib parser, which reports the problem.
+    """
+    try:
+        with warnings.catch_warnings():
+            # Header-only files: the caller reports "No data found"
+            warnings.simplefilter("ignore", UserWarning)
+            with open(file_path, encoding="utf-8", newline="", buffering=_IO_BUFFER_BYTES) as f:
+                values: np.ndarray = np.loadtxt(
+                    f,
+                    dtype=np.float64,
+                    delimiter=dialect.delimiter,
+                    quotechar=dialect.quotechar,
+                    comments=None,
+                    usecols=col_idx,
+                    skiprows=1 if has_header else 0,
+                    ndmin=1,
+                )
+    except (TypeError, ValueError):
+        # TypeError: dialects loadtxt cannot express (e.g. a sniffed newline delimiter)
+        return None
+    return values
+
+
+# Header words that mark a numeric data column. Whole words only, so e.g.
+# "empower" or "europe" do not match; plurals are listed explicitly.
+_NUMERIC_HINTS = frozenset(
+    ["price", "value", "cost", "demand", "power", "mw", "mwh", "eur", "profile"]
+    + ["prices", "values", "costs", "demands", "profiles"]
+)
+
+# camelCase boundaries ("spotPrice") and separators between header words
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_HEADER_TOKEN_SEP_RE = re.compile(r"[^a-z]+")
+
+
+def _find_first_numeric_column(headers: list[str]) -> int:
     """Find the first column that looks numeric based on the header name."""
-    numeric_hints = ["price", "value", "cost", "demand", "power", "mw", "mwh", "eur", "profile"]
+    return _first_numeric_column_index(tuple(headers))
+
+
+@functools.lru_cache(maxsize=128)
+def _first_numeric_column_index(headers: tuple[str, ...]) -> int:
+    """Cached body of _find_first_numeric_column, keyed by the header row."""
     for i, h in enumerate(headers):
-        h_lower = h.lower().strip()
-        for hint in numeric_hints:
-            if hint in h_lower:
-                return i
+        if not _NUMERIC_HINTS.isdisjoint(_HEADER_TOKEN_SEP_RE.split(_CAMEL_BOUNDARY_RE.sub("_", h).lower())):
+            return i
     return 0
 
 
@@ -224,70 +436,99 @@ def save_csv(
 
     resolved = _resolve_save_path(file_path, data_dir)
 
-    if not overwrite and os.path.exists(resolved):
-        raise FileExistsError(f"File already exists: {resolved}. Set overwrite=True to replace it.")
-
-    parent = os.path.dirname(resolved)
-    if parent:
-        os.makedirs(parent, exist_ok=True)
-
     col_names = list(columns.keys())
-    row_count = len(next(iter(columns.values())))
-
-    with open(resolved, "w", encoding="utf-8", newline="") as f:
+    with _open_for_save(resolved, overwrite) as f:
         writer = csv.writer(f)
         writer.writerow(col_names)
-        for i in range(row_count):
-            writer.writerow([columns[name][i] for name in col_names])
+        # Lengths are validated above, so zip() transposes columns to rows exactly
+        writer.writerows(zip(*columns.values()))
 
     return resolved
 
 
+def _open_for_save(path: str, overwrite: bool) -> IO[str]:
+    """Open a CSV file for writing, creating parent directories if missing.
+
+    Without overwrite the file is opened in exclusive-creation mode, which
+    checks for an existing file atomically instead of with a separate stat.
+
+    :param path: Absolute path of the file.
+    :param overwrite: Allow replacing an existing file.
+    :returns: Text stream opened for writing.
+    :raises FileExistsError: If file exists and overwrite is False.
+    """
+    mode = "w" if overwrite else "x"
+    try:
+        return open(path, mode, encoding="utf-8", newline="")
+    except FileExistsError:
+        raise FileExistsError(f"File already exists: {path}. Set overwrite=True to replace it.") from None
+    except FileNotFoundError:
+        pass  # Parent directory does not exist yet
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return open(path, mode, encoding="utf-8", newline="")
+
+
 def _get_csv_metadata(file_path: str) -> dict[str, Any]:
     """Extract metadata from a CSV file (rows, columns, numeric columns).
 
+    Results are cached per file path, modification time and size.
+
     :param file_path: Absolute path to the CSV file.
     :returns: Dict with rows, columns, columns_count, numeric_columns.
     """
-    with open(file_path, encoding="utf-8", newline="") as f:
-        sample = f.read(8192)
-        f.seek(0)
+    st = os.stat(file_path)
+    metadata = _read_csv_metadata(file_path, st.st_mtime_ns, st.st_size)
+    # Fresh lists so callers cannot modify the cached entry
+    return {**metadata, "columns": list(metadata["columns"]), "numeric_columns": list(metadata["numeric_columns"])}
 
-        try:
-            dialect = csv.Sniffer().sniff(sample)
-        except csv.Error:
-            dialect = csv.excel  # type: ignore[assignment]
 
-        has_header = csv.Sniffer().has_header(sample)
-        f.seek(0)
+@functools.lru_cache(maxsize=32)
+def _read_csv_metadata(file_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Scan a CSV file for _get_csv_metadata (mtime_ns and size key the cache)."""
+    sample = _read_csv_sample(file_path)
+    with open(file_path, encoding="utf-8", newline="", buffering=_IO_BUFFER_BYTES) as f:
+        return _scan_csv_metadata(f, sample, os.path.splitext(file_path)[1].lower())
 
-        reader = csv.reader(f, dialect)
 
-        if has_header:
-            headers = [h.strip() for h in next(reader)]
-        else:
-            first_row = next(reader)
-            headers = [f"col_{i}" for i in range(len(first_row))]
-            f.seek(0)
-            reader = csv.reader(f, dialect)
-
-        row_count = 0
-        numeric_cols: set[int] = set(range(len(headers)))
-        rows_to_sample = 10
-        for row in reader:
-            if not row or all(cell.strip() == "" for cell in row):
-                continue
-            row_count += 1
-            if row_count <= rows_to_sample:
-                for i in list(numeric_cols):
-                    if i < len(row):
-                        try:
-                            float(row[i])
-                        except ValueError:
-                            numeric_cols.discard(i)
-            if row_count == rows_to_sample:
-                row_count += sum(1 for _ in reader)
-                break
+# Data rows type-checked for numeric columns; later rows are only counted
+_METADATA_SAMPLE_ROWS = 10
+
+
+def _scan_csv_metadata(f: IO[str], sample: str, ext: str = "") -> dict[str, Any]:
+    """Extract CSV metadata from an open text stream positioned at its start.
+
+    :param f: Text stream of the CSV data.
+    :param sample: Leading part of the data, used for sniffing.
+    :param ext: Lowercase file extension including the dot, if known.
+    """
+    dialect, has_header = _sniff_csv(sample, ext)
+    reader = csv.reader(f, dialect)
+
+    rows: Iterator[list[str]] = reader
+    if has_header:
+        headers = [h.strip() for h in next(reader)]
+    else:
+        first_row = next(reader)
+        headers = [f"col_{i}" for i in range(len(first_row))]
+        rows = itertools.chain([first_row], reader)
+
+    row_count = 0
+    numeric_cols: set[int] = set(range(len(headers)))
+    for row in rows:
+        if not "".join(row).strip():
+            continue
+        row_count += 1
+        if row_count <= _METADATA_SAMPLE_ROWS:
+            for i in list(numeric_cols):
+                if i < len(row):
+                    try:
+                        float(row[i])
+                    except ValueError:
+                        numeric_cols.discard(i)
+        if row_count == _METADATA_SAMPLE_ROWS:
+            row_count += sum(1 for _ in rows)
+            break
 
     numeric_column_names = [headers[i] for i in sorted(numeric_cols) if i < len(headers)]
 
@@ -299,6 +540,60 @@ def _get_csv_metadata(file_path: str) -> dict[str, Any]:
     }
 
 
+class _CsvMetadataCollector:
+    """Collect CSV metadata from byte chunks while a file is downloaded.
+
+    Keeps the leading bytes for sniffing and type checks and only counts
+    newlines in the rest, so the downloaded file need not be read again.
+    ext is the target file's lowercase extension (see _sniff_csv).
+    """
+
+    def __init__(self, ext: str = "") -> None:
+        self._ext = ext
+        self._sample = bytearray()
+        self._tail_newlines = 0
+        self._tail_last_byte = b""
+        self._has_quotes = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next downloaded chunk."""
+        room = _SNIFF_SAMPLE_BYTES - len(self._sample)
+        if room > 0:
+            self._sample += chunk[:room]
+            chunk = chunk[room:]
+        if chunk:
+            self._tail_newlines += chunk.count(b"\n")
+            self._tail_last_byte = chunk[-1:]
+            self._has_quotes = self._has_quotes or b'"' in chunk
+
+    def result(self) -> Optional[dict[str, Any]]:
+        """Return the metadata dict of _get_csv_metadata, or None if undetermined.
+
+        None is returned when newline counting could differ from the csv
+        module (quoted fields, bare CR line endings) or the sample holds too
+        few rows; the caller then scans the saved file instead.
+        """
+        sample = bytes(self._sample)
+        if self._has_quotes or b'"' in sample:
+            return None
+        if not self._tail_last_byte:
+            # Whole file is in the sample - scan it directly
+            text = sample.decode("utf-8")
+            return _scan_csv_metadata(io.StringIO(text, newline=""), text, self._ext)
+
+        head_end = sample.rfind(b"\n") + 1
+        if head_end == 0 or b"\r" in sample.replace(b"\r\n", b""):
+            return None
+        text = sample[:head_end].decode("utf-8")
+        metadata = _scan_csv_metadata(io.StringIO(text, newline=""), text, self._ext)
+        if metadata["rows"] < _METADATA_SAMPLE_ROWS:
+            return None
+
+        # Lines after the sample: one per newline plus an unterminated last line
+        metadata["rows"] += self._tail_newlines + int(self._tail_last_byte != b"\n")
+        return metadata
+
+
 def fetch_url_to_file(
     url: str,
     data_dir: Optional[str] = None,
@@ -318,6 +613,124 @@ def fetch_url_to_file(
     """
     import httpx
 
+    resolved, collector = _prepare_download(url, data_dir, file_path, overwrite)
+
+    try:
+        with httpx.stream("GET", url, follow_redirects=True, timeout=_DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            with open(resolved, "wb") as f:
+                for chunk in response.iter_bytes(chunk_size=_IO_BUFFER_BYTES):
+                    f.write(chunk)
+                    if collector is not None:
+                        collector.feed(chunk)
+    except httpx.HTTPStatusError as e:
+        raise RuntimeError(f"HTTP error {e.response.status_code} downloading {url}") from e
+    except httpx.RequestError as e:
+        raise RuntimeError(f"Failed to download {url}: {e}") from e
+
+    return _download_result(url, resolved, collector)
+
+
+async def fetch_urls_to_files(
+    urls: list[str],
+    data_dir: Optional[str] = None,
+    file_paths: Optional[list[Optional[str]]] = None,
+    overwrite: bool = False,
+) -> list[dict[str, Any]]:
+    """Download several URLs concurrently and save them to the local filesystem.
+
+    All downloads share one httpx.AsyncClient, so total time is close to
+    the slowest download rather than the sum. Every URL and target path is
+    validated before any request is sent.
+
+    All or nothing: if one download fails, the others are cancelled and every
+    file this call has written is removed before the error is raised, so the
+    call can simply be retried. File writes and the metadata scan run in
+    worker threads, keeping the event loop free for other MCP tool calls.
+
+    :param urls: URLs to download.
+    :param data_dir: Base directory for relative paths (or None for cwd).
+    :param file_paths: Filename or path per URL; None entries (or no list)
+        derive the name from the URL.
+    :param overwrite: Allow overwriting existing files (default: False).
+    :returns: One fetch_url_to_file-style dict per URL, in input order.
+    :raises ValueError: If a URL is invalid, file_paths has the wrong length,
+        or two downloads resolve to the same file.
+    :raises FileExistsError: If a file exists and overwrite is False.
+    :raises RuntimeError: If a download fails.
+    """
+    import httpx
+
+    if file_paths is None:
+        file_paths = [None] * len(urls)
+    elif len(file_paths) != len(urls):
+        raise ValueError(f"file_paths must have one entry per URL ({len(urls)}), got {len(file_paths)}.")
+
+    targets = [_prepare_download(url, data_dir, fp, overwrite) for url, fp in zip(urls, file_paths)]
+    seen: set[str] = set()
+    for resolved, _ in targets:
+        if resolved in seen:
+            raise ValueError(f"Several URLs would be saved to {resolved}. Pass distinct file_paths.")
+        seen.add(resolved)
+
+    written: list[str] = []
+
+    async def download(
+        client: httpx.AsyncClient, url: str, resolved: str, collector: Optional[_CsvMetadataCollector]
+    ) -> dict[str, Any]:
+        try:
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                written.append(resolved)
+                f = await asyncio.to_thread(open, resolved, "wb")
+                try:
+                    async for chunk in response.aiter_bytes(chunk_size=_IO_BUFFER_BYTES):
+                        await asyncio.to_thread(f.write, chunk)
+                        if collector is not None:
+                            collector.feed(chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(f"HTTP error {e.response.status_code} downloading {url}") from e
+        except httpx.RequestError as e:
+            raise RuntimeError(f"Failed to download {url}: {e}") from e
+        # Quoted CSVs fall back to a full-file scan in _get_csv_metadata
+        return await asyncio.to_thread(_download_result, url, resolved, collector)
+
+    async with httpx.AsyncClient(follow_redirects=True, timeout=_DOWNLOAD_TIMEOUT) as client:
+        tasks = [
+            asyncio.ensure_future(download(client, url, resolved, collector))
+            for url, (resolved, collector) in zip(urls, targets)
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # gather() does not cancel the remaining awaitables on failure
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for resolved in written:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(resolved)
+            raise
+
+
+def _prepare_download(
+    url: str,
+    data_dir: Optional[str],
+    file_path: Optional[str],
+    overwrite: bool,
+) -> tuple[str, Optional[_CsvMetadataCollector]]:
+    """Validate a download URL and prepare its target file.
+
+    :param url: URL to download.
+    :param data_dir: Base directory for relative paths (or None for cwd).
+    :param file_path: Filename or path. If None, derived from the URL.
+    :param overwrite: Allow overwriting an existing file.
+    :returns: Absolute target path and a metadata collector for CSV-like files.
+    :raises ValueError: If the URL is invalid or empty.
+    :raises FileExistsError: If file exists and overwrite is False.
+    """
     if not url or not url.strip():
         raise ValueError("URL must not be empty.")
 
@@ -340,26 +753,26 @@ def fetch_url_to_file(
     if parent:
         os.makedirs(parent, exist_ok=True)
 
-    try:
-        with httpx.stream("GET", url, follow_redirects=True, timeout=30.0) as response:
-            response.raise_for_status()
-            with open(resolved, "wb") as f:
-                for chunk in response.iter_bytes(chunk_size=8192):
-                    f.write(chunk)
-    except httpx.HTTPStatusError as e:
-        raise RuntimeError(f"HTTP error {e.response.status_code} downloading {url}") from e
-    except httpx.RequestError as e:
-        raise RuntimeError(f"Failed to download {url}: {e}") from e
+    ext = os.path.splitext(resolved)[1].lower()
+    return resolved, _CsvMetadataCollector(ext) if ext in (".csv", ".tsv", ".txt") else None
 
+
+def _download_result(url: str, resolved: str, collector: Optional[_CsvMetadataCollector]) -> dict[str, Any]:
+    """Build the result dict for a finished download.
+
+    :param url: Downloaded URL.
+    :param resolved: Absolute path of the saved file.
+    :param collector: Metadata collector fed during the download, if any.
+    :returns: Dict with file_path, url, CSV metadata (if applicable) and message.
+    """
     result: dict[str, Any] = {
         "file_path": resolved,
         "url": url,
     }
 
-    ext = os.path.splitext(resolved)[1].lower()
-    if ext in (".csv", ".tsv", ".txt"):
+    if collector is not None:
         try:
-            metadata = _get_csv_metadata(resolved)
+            metadata = collector.result() or _get_csv_metadata(resolved)
             result.update(metadata)
         except Exception as e:
             result["metadata_error"] = f"Could not extract CSV metadata: {e}"
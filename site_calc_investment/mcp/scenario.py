@@ -1,10 +1,17 @@
 """In-memory storage for draft optimization scenarios."""
 
-import uuid
+import functools
+import math
+import secrets
 from dataclasses import dataclass, field
-from typing import Any, Literal, Optional, cast
+from datetime import datetime
+from typing import Any, Callable, Literal, Optional, Union
+from zoneinfo import ZoneInfo
 
-from site_calc_investment.models.common import Resolution
+import numpy as np
+
+from site_calc_investment.mcp.data_loaders import resolve_price_or_profile
+from site_calc_investment.models.common import Location, Resolution
 from site_calc_investment.models.devices import (
     CHP,
     Battery,
@@ -34,7 +41,7 @@ from site_calc_investment.models.requests import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class TimespanConfig:
     """Draft timespan configuration."""
 
@@ -42,8 +49,13 @@ class TimespanConfig:
     years: int = 1
     intervals: Optional[int] = None
 
+    @property
+    def effective_intervals(self) -> int:
+        """Hourly interval count: the explicit intervals, else years * 8760."""
+        return self.intervals if self.intervals is not None else self.years * 8760
+
 
-@dataclass
+@dataclass(slots=True)
 class InvestmentParamsConfig:
     """Draft investment parameters configuration."""
 
@@ -53,17 +65,19 @@ class InvestmentParamsConfig:
     device_annual_opex: Optional[dict[str, float]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceConfig:
     """Raw device configuration before conversion to Pydantic models."""
 
-    device_type: str
+    device_type: str  # Lowercase key of _DEVICE_BUILDERS (normalized by add_device)
     name: str
     properties: dict[str, Any]
     schedule: Optional[dict[str, Any]] = None
+    # Filled by _device_summary; configs are not modified after add_device
+    _summary: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     """A draft optimization scenario."""
 
@@ -74,9 +88,11 @@ class Scenario:
     timespan: Optional[TimespanConfig] = None
     investment_params: Optional[InvestmentParamsConfig] = None
     jobs: list[str] = field(default_factory=list)
+    # Name -> device, kept in step with devices by ScenarioStore
+    _devices_by_name: dict[str, DeviceConfig] = field(default_factory=dict, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioInfo:
     """Summary info for listing scenarios."""
 
@@ -87,27 +103,74 @@ class ScenarioInfo:
     job_count: int
 
 
-DEVICE_TYPE_MAP: dict[str, str] = {
-    "battery": "battery",
-    "chp": "chp",
-    "heat_accumulator": "heat_accumulator",
-    "photovoltaic": "photovoltaic",
-    "heat_demand": "heat_demand",
-    "electricity_demand": "electricity_demand",
-    "electricity_import": "electricity_import",
-    "electricity_export": "electricity_export",
-    "gas_import": "gas_import",
-    "heat_export": "heat_export",
+def _build_scheduled(
+    device_cls: Any,
+    props_cls: Any,
+    name: str,
+    props: dict[str, Any],
+    schedule: Optional[Schedule],
+    _expected_length: Optional[int],
+) -> Any:
+    """Build a device whose properties need no profile resolution (battery, CHP, heat accumulator)."""
+    return device_cls(name=name, properties=props_cls(**props), schedule=schedule)
+
+
+def _build_photovoltaic(
+    name: str, props: dict[str, Any], schedule: Optional[Schedule], expected_length: Optional[int]
+) -> Photovoltaic:
+    """Build a Photovoltaic device, resolving its location and generation profile."""
+    props = dict(props)
+    if "location" in props and isinstance(props["location"], dict):
+        props["location"] = Location(**props["location"])
+    if "generation_profile" in props and props["generation_profile"] is not None:
+        props["generation_profile"] = resolve_price_or_profile(props["generation_profile"], expected_length)
+    return Photovoltaic(name=name, properties=PhotovoltaicProperties(**props), schedule=schedule)
+
+
+def _build_demand(
+    device_cls: Any, name: str, props: dict[str, Any], _schedule: Optional[Schedule], expected_length: Optional[int]
+) -> Any:
+    """Build a heat or electricity demand device, resolving its demand profiles."""
+    props = dict(props)
+    props["max_demand_profile"] = resolve_price_or_profile(props["max_demand_profile"], expected_length)
+    if "min_demand_profile" in props and props["min_demand_profile"] is not None:
+        if not isinstance(props["min_demand_profile"], (int, float)):
+            props["min_demand_profile"] = resolve_price_or_profile(props["min_demand_profile"], expected_length)
+    return device_cls(name=name, properties=DemandProperties(**props))
+
+
+def _build_market(
+    device_cls: Any,
+    props_cls: Any,
+    name: str,
+    props: dict[str, Any],
+    _schedule: Optional[Schedule],
+    expected_length: Optional[int],
+) -> Any:
+    """Build a market import/export device, resolving its price."""
+    price = resolve_price_or_profile(props["price"], expected_length)
+    return device_cls(name=name, properties=props_cls(**{**props, "price": price}))
+
+
+# Device builders by type: (name, properties, schedule, expected_length) -> device model.
+# Builders receive the stored draft properties and copy them before replacing values.
+_DEVICE_BUILDERS: dict[str, Callable[[str, dict[str, Any], Optional[Schedule], Optional[int]], Any]] = {
+    "battery": functools.partial(_build_scheduled, Battery, BatteryProperties),
+    "chp": functools.partial(_build_scheduled, CHP, CHPProperties),
+    "heat_accumulator": functools.partial(_build_scheduled, HeatAccumulator, HeatAccumulatorProperties),
+    "photovoltaic": _build_photovoltaic,
+    "heat_demand": functools.partial(_build_demand, HeatDemand),
+    "electricity_demand": functools.partial(_build_demand, ElectricityDemand),
+    "electricity_import": functools.partial(_build_market, ElectricityImport, MarketImportProperties),
+    "electricity_export": functools.partial(_build_market, ElectricityExport, MarketExportProperties),
+    "gas_import": functools.partial(_build_market, GasImport, MarketImportProperties),
+    "heat_export": functools.partial(_build_market, HeatExport, MarketExportProperties),
 }
 
-VALID_DEVICE_TYPES: set[str] = set(DEVICE_TYPE_MAP.keys())
-
+VALID_DEVICE_TYPES: frozenset[str] = frozenset(_DEVICE_BUILDERS)
 
-def _build_schedule(schedule_dict: Optional[dict[str, Any]]) -> Optional[Schedule]:
-    """Build a Schedule object from a raw dict, or None."""
-    if schedule_dict is None:
-        return None
-    return Schedule(**schedule_dict)
+# Listed in the unknown-type error; joined once instead of per rejected call
+_VALID_DEVICE_TYPES_STR = ", ".join(sorted(VALID_DEVICE_TYPES))
 
 
 def _build_device(config: DeviceConfig, expected_length: Optional[int]) -> Any:
@@ -118,62 +181,14 @@ def _build_device(config: DeviceConfig, expected_length: Optional[int]) -> Any:
     :returns: A Pydantic device model instance.
     :raises ValueError: If the device type is unknown or properties are invalid.
     """
-    from site_calc_investment.mcp.data_loaders import resolve_price_or_profile
-
-    dtype = config.device_type.lower()
-    props = dict(config.properties)
-    schedule = _build_schedule(config.schedule)
-
-    if dtype == "battery":
-        return Battery(name=config.name, properties=BatteryProperties(**props), schedule=schedule)
-
-    elif dtype == "chp":
-        return CHP(name=config.name, properties=CHPProperties(**props), schedule=schedule)
-
-    elif dtype == "heat_accumulator":
-        return HeatAccumulator(name=config.name, properties=HeatAccumulatorProperties(**props), schedule=schedule)
-
-    elif dtype == "photovoltaic":
-        if "location" in props and isinstance(props["location"], dict):
-            from site_calc_investment.models.common import Location
-
-            props["location"] = Location(**props["location"])
-        if "generation_profile" in props and props["generation_profile"] is not None:
-            props["generation_profile"] = resolve_price_or_profile(props["generation_profile"], expected_length)
-        return Photovoltaic(name=config.name, properties=PhotovoltaicProperties(**props), schedule=schedule)
-
-    elif dtype == "heat_demand":
-        props["max_demand_profile"] = resolve_price_or_profile(props["max_demand_profile"], expected_length)
-        if "min_demand_profile" in props and props["min_demand_profile"] is not None:
-            if not isinstance(props["min_demand_profile"], (int, float)):
-                props["min_demand_profile"] = resolve_price_or_profile(props["min_demand_profile"], expected_length)
-        return HeatDemand(name=config.name, properties=DemandProperties(**props))
-
-    elif dtype == "electricity_demand":
-        props["max_demand_profile"] = resolve_price_or_profile(props["max_demand_profile"], expected_length)
-        if "min_demand_profile" in props and props["min_demand_profile"] is not None:
-            if not isinstance(props["min_demand_profile"], (int, float)):
-                props["min_demand_profile"] = resolve_price_or_profile(props["min_demand_profile"], expected_length)
-        return ElectricityDemand(name=config.name, properties=DemandProperties(**props))
-
-    elif dtype == "electricity_import":
-        props["price"] = resolve_price_or_profile(props["price"], expected_length)
-        return ElectricityImport(name=config.name, properties=MarketImportProperties(**props))
-
-    elif dtype == "electricity_export":
-        props["price"] = resolve_price_or_profile(props["price"], expected_length)
-        return ElectricityExport(name=config.name, properties=MarketExportProperties(**props))
-
-    elif dtype == "gas_import":
-        props["price"] = resolve_price_or_profile(props["price"], expected_length)
-        return GasImport(name=config.name, properties=MarketImportProperties(**props))
-
-    elif dtype == "heat_export":
-        props["price"] = resolve_price_or_profile(props["price"], expected_length)
-        return HeatExport(name=config.name, properties=MarketExportProperties(**props))
-
-    else:
-        raise ValueError(f"Unknown device type: {dtype}")
+    dtype = config.device_type
+    try:
+        builder = _DEVICE_BUILDERS[dtype]
+    except KeyError:
+        raise ValueError(f"Unknown device type: {dtype}") from None
+    # Schedules come straight from the caller, so they are validated (no model_construct)
+    schedule = None if config.schedule is None else Schedule(**config.schedule)
+    return builder(config.name, config.properties, schedule, expected_length)
 
 
 class ScenarioStore:
@@ -187,9 +202,9 @@ class ScenarioStore:
 
         :param name: Human-readable scenario name.
         :param description: Optional description.
-        :returns: scenario_id (UUID).
+        :returns: scenario_id ("sc_" + 8 random hex digits).
         """
-        scenario_id = f"sc_{uuid.uuid4().hex[:8]}"
+        scenario_id = f"sc_{secrets.token_hex(4)}"
         self._scenarios[scenario_id] = Scenario(id=scenario_id, name=name, description=description)
         return scenario_id
 
@@ -222,15 +237,13 @@ class ScenarioStore:
         :raises ValueError: If device_type is invalid or name is duplicate.
         """
         scenario = self.get(scenario_id)
-        dtype = device_type.lower()
+        # Tool input is normally lowercase already; lower() only when it is not
+        dtype = device_type if device_type in VALID_DEVICE_TYPES else device_type.lower()
 
         if dtype not in VALID_DEVICE_TYPES:
-            raise ValueError(
-                f"Unknown device type '{device_type}'. Valid types: {', '.join(sorted(VALID_DEVICE_TYPES))}"
-            )
+            raise ValueError(f"Unknown device type '{device_type}'. Valid types: {_VALID_DEVICE_TYPES_STR}")
 
-        existing_names = {d.name for d in scenario.devices}
-        if name in existing_names:
+        if name in scenario._devices_by_name:
             raise ValueError(
                 f"Device name '{name}' already exists in scenario '{scenario.name}'. "
                 "Device names must be unique within a scenario."
@@ -238,6 +251,7 @@ class ScenarioStore:
 
         config = DeviceConfig(device_type=dtype, name=name, properties=properties, schedule=schedule)
         scenario.devices.append(config)
+        scenario._devices_by_name[name] = config
 
         return _device_summary(config)
 
@@ -247,14 +261,13 @@ class ScenarioStore:
         :raises KeyError: If scenario not found or device not found.
         """
         scenario = self.get(scenario_id)
-        for i, d in enumerate(scenario.devices):
-            if d.name == device_name:
-                scenario.devices.pop(i)
-                return
-        raise KeyError(
-            f"Device '{device_name}' not found in scenario '{scenario.name}'. "
-            f"Devices: {', '.join(d.name for d in scenario.devices) or '(none)'}"
-        )
+        config = scenario._devices_by_name.pop(device_name, None)
+        if config is None:
+            raise KeyError(
+                f"Device '{device_name}' not found in scenario '{scenario.name}'. "
+                f"Devices: {', '.join(d.name for d in scenario.devices) or '(none)'}"
+            )
+        scenario.devices.remove(config)
 
     def set_timespan(self, scenario_id: str, start_year: int, years: int = 1, intervals: Optional[int] = None) -> str:
         """Set the optimization time horizon.
@@ -301,11 +314,12 @@ class ScenarioStore:
         parts = [f"discount_rate={discount_rate:.1%}"]
         if project_lifetime_years is not None:
             parts.append(f"lifetime={project_lifetime_years}y")
+        # Only summed when given; fsum keeps large fleets' totals exact
         if device_capital_costs:
-            total = sum(device_capital_costs.values())
+            total = math.fsum(device_capital_costs.values())
             parts.append(f"CAPEX total={total:,.0f} EUR")
         if device_annual_opex:
-            total = sum(device_annual_opex.values())
+            total = math.fsum(device_annual_opex.values())
             parts.append(f"annual OPEX total={total:,.0f} EUR")
         return f"Investment parameters set: {', '.join(parts)}"
 
@@ -315,40 +329,31 @@ class ScenarioStore:
         :returns: Summary dict with devices, timespan, investment params, validation.
         """
         scenario = self.get(scenario_id)
+        devices, ts, ip = scenario.devices, scenario.timespan, scenario.investment_params
 
-        device_summaries = []
-        for d in scenario.devices:
-            device_summaries.append(
-                {
-                    "name": d.name,
-                    "type": d.device_type,
-                    "summary": _device_summary(d),
-                }
-            )
+        device_summaries = [{"name": d.name, "type": d.device_type, "summary": _device_summary(d)} for d in devices]
 
         timespan_str = "not set"
-        if scenario.timespan:
-            ts = scenario.timespan
-            effective_intervals = ts.intervals if ts.intervals is not None else ts.years * 8760
+        if ts:
             if ts.intervals is not None:
-                timespan_str = f"{ts.start_year}, {effective_intervals} intervals (custom)"
+                timespan_str = f"{ts.start_year}, {ts.intervals} intervals (custom)"
             else:
-                timespan_str = f"{ts.start_year}, {ts.years} year(s), {effective_intervals} intervals"
+                timespan_str = f"{ts.start_year}, {ts.years} year(s), {ts.effective_intervals} intervals"
 
         investment_str = "not set (no CAPEX/OPEX analysis)"
-        if scenario.investment_params:
-            ip = scenario.investment_params
+        if ip:
             parts = [f"{ip.discount_rate:.1%} discount rate"]
             if ip.project_lifetime_years:
                 parts.append(f"{ip.project_lifetime_years}y lifetime")
-            if ip.device_capital_costs:
-                parts.append(f"CAPEX for {len(ip.device_capital_costs)} devices")
+            capital_costs = ip.device_capital_costs
+            if capital_costs:
+                parts.append(f"CAPEX for {len(capital_costs)} devices")
             investment_str = ", ".join(parts)
 
         errors = []
-        if not scenario.devices:
+        if not devices:
             errors.append("No devices added")
-        if not scenario.timespan:
+        if not ts:
             errors.append("No timespan set")
 
         validation = "Valid -- ready to submit" if not errors else f"Not ready: {'; '.join(errors)}"
@@ -381,32 +386,15 @@ class ScenarioStore:
             raise ValueError("Cannot submit: no timespan set. Use set_timespan first.")
 
         ts_config = scenario.timespan
-        if ts_config.intervals is not None:
-            from datetime import datetime
-            from zoneinfo import ZoneInfo
-
-            start = datetime(ts_config.start_year, 1, 1, tzinfo=ZoneInfo("Europe/Prague"))
-            timespan = TimeSpanInvestment(
-                start=start,
-                intervals=ts_config.intervals,
-                resolution=Resolution.HOUR_1,
-            )
-            expected_length = ts_config.intervals
-        else:
-            timespan = cast(
-                TimeSpanInvestment,
-                TimeSpanInvestment.for_years(
-                    start_year=ts_config.start_year,
-                    years=ts_config.years,
-                    resolution=Resolution.HOUR_1,
-                ),
-            )
-            expected_length = ts_config.years * 8760
+        expected_length = ts_config.effective_intervals
+        # Same as TimeSpanInvestment.for_years when no explicit intervals are set
+        timespan = TimeSpanInvestment(
+            start=datetime(ts_config.start_year, 1, 1, tzinfo=ZoneInfo("Europe/Prague")),
+            intervals=expected_length,
+            resolution=Resolution.HOUR_1,
+        )
 
-        devices = []
-        for dc in scenario.devices:
-            device = _build_device(dc, expected_length)
-            devices.append(device)
+        devices = [_build_device(dc, expected_length) for dc in scenario.devices]
 
         site = Site(
             site_id=f"site_{scenario_id}",
@@ -426,8 +414,6 @@ class ScenarioStore:
             if ip.project_lifetime_years:
                 lifetime = ip.project_lifetime_years
             elif ts_config.intervals is not None:
-                import math
-
                 lifetime = max(1, math.ceil(ts_config.intervals / 8760))
             else:
                 lifetime = ts_config.years
@@ -464,79 +450,92 @@ class ScenarioStore:
 
     def list(self) -> list[ScenarioInfo]:
         """List all active draft scenarios."""
-        result = []
-        for s in self._scenarios.values():
-            result.append(
-                ScenarioInfo(
-                    id=s.id,
-                    name=s.name,
-                    device_count=len(s.devices),
-                    has_timespan=s.timespan is not None,
-                    job_count=len(s.jobs),
-                )
-            )
-        return result
+        # Positional args: the generated __init__ skips keyword matching
+        return [
+            ScenarioInfo(s.id, s.name, len(s.devices), s.timespan is not None, len(s.jobs))
+            for s in self._scenarios.values()
+        ]
+
+
+def _storage_summary(props: dict[str, Any], suffix: str = "") -> str:
+    """Summarize a battery or heat accumulator."""
+    cap = props.get("capacity", "?")
+    pwr = props.get("max_power", "?")
+    eff = props.get("efficiency", "?")
+    eff_str = f"{float(eff) * 100:.0f}%" if isinstance(eff, (int, float)) else str(eff)
+    return f"{cap} MWh / {pwr} MW / {eff_str} eff{suffix}"
+
+
+def _chp_summary(props: dict[str, Any]) -> str:
+    """Summarize a CHP unit."""
+    gas = props.get("gas_input", "?")
+    el = props.get("el_output", "?")
+    heat = props.get("heat_output", "?")
+    return f"gas {gas} MW -> el {el} MW + heat {heat} MW"
+
+
+def _photovoltaic_summary(props: dict[str, Any]) -> str:
+    """Summarize a photovoltaic plant."""
+    return f"{props.get('peak_power_mw', '?')} MW peak"
+
+
+def _demand_summary(props: dict[str, Any]) -> str:
+    """Summarize a heat or electricity demand."""
+    profile = props.get("max_demand_profile", [])
+    if isinstance(profile, (list, np.ndarray)) and len(profile):
+        return f"avg {_mean(profile):.1f} MW, {len(profile)} intervals"
+    return "demand profile configured"
+
+
+def _market_summary(limit_key: str, props: dict[str, Any]) -> str:
+    """Summarize a market import or export by its capacity limit and price."""
+    return f"max {props.get(limit_key, '?')} MW, {_price_summary(props.get('price'))}"
+
+
+# Device summarizers by type: properties -> one-line description
+_DEVICE_SUMMARIZERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "battery": _storage_summary,
+    "chp": _chp_summary,
+    "heat_accumulator": functools.partial(_storage_summary, suffix=" (thermal)"),
+    "photovoltaic": _photovoltaic_summary,
+    "heat_demand": _demand_summary,
+    "electricity_demand": _demand_summary,
+    "electricity_import": functools.partial(_market_summary, "max_import"),
+    "gas_import": functools.partial(_market_summary, "max_import"),
+    "electricity_export": functools.partial(_market_summary, "max_export"),
+    "heat_export": functools.partial(_market_summary, "max_export"),
+}
 
 
 def _device_summary(config: DeviceConfig) -> str:
-    """Generate a human-readable summary of a device config."""
-    props = config.properties
-    dtype = config.device_type.lower()
-
-    if dtype == "battery":
-        cap = props.get("capacity", "?")
-        pwr = props.get("max_power", "?")
-        eff = props.get("efficiency", "?")
-        eff_str = f"{float(eff) * 100:.0f}%" if isinstance(eff, (int, float)) else str(eff)
-        return f"{cap} MWh / {pwr} MW / {eff_str} eff"
-
-    elif dtype == "chp":
-        gas = props.get("gas_input", "?")
-        el = props.get("el_output", "?")
-        heat = props.get("heat_output", "?")
-        return f"gas {gas} MW -> el {el} MW + heat {heat} MW"
-
-    elif dtype == "heat_accumulator":
-        cap = props.get("capacity", "?")
-        pwr = props.get("max_power", "?")
-        eff = props.get("efficiency", "?")
-        eff_str = f"{float(eff) * 100:.0f}%" if isinstance(eff, (int, float)) else str(eff)
-        return f"{cap} MWh / {pwr} MW / {eff_str} eff (thermal)"
-
-    elif dtype == "photovoltaic":
-        peak = props.get("peak_power_mw", "?")
-        return f"{peak} MW peak"
-
-    elif dtype in ("heat_demand", "electricity_demand"):
-        profile = props.get("max_demand_profile", [])
-        if isinstance(profile, list) and profile:
-            avg = sum(profile) / len(profile)
-            return f"avg {avg:.1f} MW, {len(profile)} intervals"
-        return "demand profile configured"
-
-    elif dtype in ("electricity_import", "gas_import"):
-        max_imp = props.get("max_import", "?")
-        price = props.get("price")
-        price_str = _price_summary(price)
-        return f"max {max_imp} MW, {price_str}"
-
-    elif dtype in ("electricity_export", "heat_export"):
-        max_exp = props.get("max_export", "?")
-        price = props.get("price")
-        price_str = _price_summary(price)
-        return f"max {max_exp} MW, {price_str}"
-
-    return f"{dtype} device"
+    """Generate a human-readable summary of a device config.
+
+    The summary is computed once per config and reused by later reviews.
+    """
+    if config._summary is None:
+        dtype = config.device_type
+        summarizer = _DEVICE_SUMMARIZERS.get(dtype)
+        config._summary = f"{dtype} device" if summarizer is None else summarizer(config.properties)
+    return config._summary
+
+
+def _mean(values: Union[list[float], np.ndarray]) -> float:
+    """Average a profile; NumPy's reduction for arrays, sum() for lists.
+
+    Converting a list to an array costs several times more than summing it.
+    """
+    if isinstance(values, np.ndarray):
+        return float(values.mean())
+    return sum(values) / len(values)
 
 
 def _price_summary(price: Any) -> str:
     """Summarize a price value for display."""
     if isinstance(price, (int, float)):
         return f"flat {price} EUR/MWh"
-    elif isinstance(price, list):
-        if price:
-            avg = sum(price) / len(price)
-            return f"avg {avg:.1f} EUR/MWh ({len(price)} pts)"
+    elif isinstance(price, (list, np.ndarray)):
+        if len(price):
+            return f"avg {_mean(price):.1f} EUR/MWh ({len(price)} pts)"
         return "empty price array"
     elif isinstance(price, dict):
         if "file" in price:
@@ -1,13 +1,16 @@
 """FastMCP server with all tool definitions for investment planning."""
 
-from typing import Any, Literal, Optional, cast
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Literal, Optional, cast
 
 from fastmcp import FastMCP
 
 from site_calc_investment import __version__
 from site_calc_investment.api.client import InvestmentClient
 from site_calc_investment.mcp.config import Config, get_data_dir
-from site_calc_investment.mcp.data_loaders import fetch_url_to_file, save_csv
+from site_calc_investment.mcp.data_loaders import fetch_url_to_file, fetch_urls_to_files, save_csv
 from site_calc_investment.mcp.scenario import ScenarioStore
 
 mcp = FastMCP(
@@ -27,15 +30,30 @@ _store = ScenarioStore()
 _client: Optional[InvestmentClient] = None
 
 
+# Guards the first creation of _client; batch_tool_calls may race to it from worker threads
+_client_lock = threading.Lock()
+
+
 def _get_client() -> InvestmentClient:
     """Get or create the InvestmentClient singleton."""
     global _client
     if _client is None:
-        config = Config.from_env()
-        _client = InvestmentClient(base_url=config.api_url, api_key=config.api_key)
+        with _client_lock:
+            if _client is None:
+                config = Config.from_env()
+                _client = InvestmentClient(base_url=config.api_url, api_key=config.api_key)
     return _client
 
 
+def _close_client() -> None:
+    """Close the shared client's connection pool at interpreter exit."""
+    if _client is not None:
+        _client.close()
+
+
+atexit.register(_close_client)
+
+
 # --- Scenario Assembly Tools ---
 
 
@@ -324,8 +342,7 @@ def _build_device_summaries(response: Any, detail_level: str) -> dict[str, Any]:
                 dev_summary["avg_soc"] = round(sum(schedule.soc) / len(schedule.soc), 3)
 
             if detail_level == "monthly" and schedule.flows:
-                first_flow = list(schedule.flows.values())[0]
-                hours_total = len(first_flow)
+                hours_total = len(next(iter(schedule.flows.values())))
                 monthly: list[dict[str, Any]] = []
                 for month_idx in range(min(12, (hours_total + 729) // 730)):
                     start = month_idx * 730
@@ -451,330 +468,361 @@ def fetch_url(
     )
 
 
-# --- Helper Tools ---
+async def fetch_urls(
+    urls: list[str],
+    file_paths: Optional[list[Optional[str]]] = None,
+    overwrite: bool = False,
+) -> list[dict[str, Any]]:
+    """Download several files concurrently and save them locally.
+
+    Same as calling fetch_url once per URL, but all downloads run at the same
+    time, so fetching e.g. several years of price data takes about as long as
+    the slowest file. Nothing is downloaded unless every URL and target path
+    is valid, and if any download fails no files are kept, so the call can
+    be retried as is.
+
+    :param urls: URLs to download (http or https).
+    :param file_paths: Local filename per URL (default: derived from each URL).
+        Use null entries to derive individual names.
+    :param overwrite: Allow overwriting existing files (default: False).
+    :returns: One fetch_url result dict per URL, in the same order.
+    """
+    data_dir = get_data_dir()
+    return await fetch_urls_to_files(
+        urls=urls,
+        data_dir=data_dir,
+        file_paths=file_paths,
+        overwrite=overwrite,
+    )
 
 
-def get_device_schema(device_type: str) -> dict[str, Any]:
-    """Get the properties schema for a device type.
+# --- Helper Tools ---
 
-    Shows required/optional properties, types, units, ranges, and defaults.
-    Use this before add_device to know what properties are needed.
 
-    :param device_type: e.g., "battery", "chp", "photovoltaic", "electricity_import".
-    :returns: Schema dict with properties documentation.
-    """
-    schemas: dict[str, dict[str, Any]] = {
-        "battery": {
-            "device_type": "battery",
-            "properties": {
-                "capacity": {"type": "float", "required": True, "unit": "MWh", "description": "Energy capacity"},
-                "max_power": {
-                    "type": "float",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Power rating for charge/discharge",
-                },
-                "efficiency": {
-                    "type": "float",
-                    "required": True,
-                    "range": "0-1",
-                    "description": "Round-trip efficiency",
-                },
-                "initial_soc": {
-                    "type": "float",
-                    "required": False,
-                    "default": 0.5,
-                    "range": "0-1",
-                    "description": "Initial state of charge",
-                },
-                "soc_anchor_interval_hours": {
-                    "type": "int",
-                    "required": False,
-                    "description": "Force SOC to target at regular intervals (hours). E.g., 4320 = every 6 months",
-                },
-                "soc_anchor_target": {
-                    "type": "float",
-                    "required": False,
-                    "default": 0.5,
-                    "range": "0-1",
-                    "description": "Target SOC at anchor points",
-                },
-            },
-            "supports_schedule": True,
-            "example": {
-                "capacity": 10.0,
-                "max_power": 5.0,
-                "efficiency": 0.90,
-                "initial_soc": 0.5,
+# Property schemas served by get_device_schema. Built once at import and returned
+# as is (the tool result is only serialized), so they must not be mutated.
+_DEVICE_SCHEMAS: dict[str, dict[str, Any]] = {
+    "battery": {
+        "device_type": "battery",
+        "properties": {
+            "capacity": {"type": "float", "required": True, "unit": "MWh", "description": "Energy capacity"},
+            "max_power": {
+                "type": "float",
+                "required": True,
+                "unit": "MW",
+                "description": "Power rating for charge/discharge",
+            },
+            "efficiency": {
+                "type": "float",
+                "required": True,
+                "range": "0-1",
+                "description": "Round-trip efficiency",
+            },
+            "initial_soc": {
+                "type": "float",
+                "required": False,
+                "default": 0.5,
+                "range": "0-1",
+                "description": "Initial state of charge",
+            },
+            "soc_anchor_interval_hours": {
+                "type": "int",
+                "required": False,
+                "description": "Force SOC to target at regular intervals (hours). E.g., 4320 = every 6 months",
+            },
+            "soc_anchor_target": {
+                "type": "float",
+                "required": False,
+                "default": 0.5,
+                "range": "0-1",
+                "description": "Target SOC at anchor points",
             },
         },
-        "chp": {
-            "device_type": "chp",
-            "properties": {
-                "gas_input": {"type": "float", "required": True, "unit": "MW", "description": "Gas consumption"},
-                "el_output": {
-                    "type": "float",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Electricity generation",
-                },
-                "heat_output": {
-                    "type": "float",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Heat generation",
-                },
-                "is_binary": {
-                    "type": "bool",
-                    "required": False,
-                    "default": False,
-                    "description": "On/off only (relaxed for investment)",
-                },
-                "min_power": {
-                    "type": "float",
-                    "required": False,
-                    "range": "0-1",
-                    "description": "Min power fraction",
-                },
-            },
-            "supports_schedule": True,
-            "example": {"gas_input": 4.0, "el_output": 2.0, "heat_output": 1.5},
+        "supports_schedule": True,
+        "example": {
+            "capacity": 10.0,
+            "max_power": 5.0,
+            "efficiency": 0.90,
+            "initial_soc": 0.5,
         },
-        "heat_accumulator": {
-            "device_type": "heat_accumulator",
-            "properties": {
-                "capacity": {
-                    "type": "float",
-                    "required": True,
-                    "unit": "MWh",
-                    "description": "Thermal energy capacity",
-                },
-                "max_power": {
-                    "type": "float",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Charge/discharge power",
-                },
-                "efficiency": {
-                    "type": "float",
-                    "required": True,
-                    "range": "0-1",
-                    "description": "Storage efficiency",
-                },
-                "initial_soc": {
-                    "type": "float",
-                    "required": False,
-                    "default": 0.5,
-                    "range": "0-1",
-                    "description": "Initial state of charge",
-                },
-                "loss_rate": {
-                    "type": "float",
-                    "required": False,
-                    "default": 0.001,
-                    "description": "Standing losses (fraction/hour)",
-                },
-            },
-            "supports_schedule": True,
-            "example": {
-                "capacity": 50.0,
-                "max_power": 10.0,
-                "efficiency": 0.95,
-                "loss_rate": 0.001,
+    },
+    "chp": {
+        "device_type": "chp",
+        "properties": {
+            "gas_input": {"type": "float", "required": True, "unit": "MW", "description": "Gas consumption"},
+            "el_output": {
+                "type": "float",
+                "required": True,
+                "unit": "MW",
+                "description": "Electricity generation",
+            },
+            "heat_output": {
+                "type": "float",
+                "required": True,
+                "unit": "MW",
+                "description": "Heat generation",
+            },
+            "is_binary": {
+                "type": "bool",
+                "required": False,
+                "default": False,
+                "description": "On/off only (relaxed for investment)",
+            },
+            "min_power": {
+                "type": "float",
+                "required": False,
+                "range": "0-1",
+                "description": "Min power fraction",
             },
         },
-        "photovoltaic": {
-            "device_type": "photovoltaic",
-            "properties": {
-                "peak_power_mw": {
-                    "type": "float",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Peak power capacity",
-                },
-                "location": {
-                    "type": "object",
-                    "required": True,
-                    "description": "Geographic location {latitude: float, longitude: float}",
-                },
-                "tilt": {
-                    "type": "int",
-                    "required": True,
-                    "range": "0-90",
-                    "unit": "degrees",
-                    "description": "Panel tilt angle",
-                },
-                "azimuth": {
-                    "type": "int",
-                    "required": True,
-                    "range": "0-359",
-                    "unit": "degrees",
-                    "description": "Azimuth (180=south)",
-                },
-                "generation_profile": {
-                    "type": "list[float]",
-                    "required": False,
-                    "description": "Normalized generation profile (0-1). Loaded from PVGIS if not provided.",
-                },
-            },
-            "supports_schedule": True,
-            "example": {
-                "peak_power_mw": 5.0,
-                "location": {"latitude": 50.07, "longitude": 14.44},
-                "tilt": 35,
-                "azimuth": 180,
+        "supports_schedule": True,
+        "example": {"gas_input": 4.0, "el_output": 2.0, "heat_output": 1.5},
+    },
+    "heat_accumulator": {
+        "device_type": "heat_accumulator",
+        "properties": {
+            "capacity": {
+                "type": "float",
+                "required": True,
+                "unit": "MWh",
+                "description": "Thermal energy capacity",
+            },
+            "max_power": {
+                "type": "float",
+                "required": True,
+                "unit": "MW",
+                "description": "Charge/discharge power",
+            },
+            "efficiency": {
+                "type": "float",
+                "required": True,
+                "range": "0-1",
+                "description": "Storage efficiency",
+            },
+            "initial_soc": {
+                "type": "float",
+                "required": False,
+                "default": 0.5,
+                "range": "0-1",
+                "description": "Initial state of charge",
+            },
+            "loss_rate": {
+                "type": "float",
+                "required": False,
+                "default": 0.001,
+                "description": "Standing losses (fraction/hour)",
+            },
+        },
+        "supports_schedule": True,
+        "example": {
+            "capacity": 50.0,
+            "max_power": 10.0,
+            "efficiency": 0.95,
+            "loss_rate": 0.001,
+        },
+    },
+    "photovoltaic": {
+        "device_type": "photovoltaic",
+        "properties": {
+            "peak_power_mw": {
+                "type": "float",
+                "required": True,
+                "unit": "MW",
+                "description": "Peak power capacity",
+            },
+            "location": {
+                "type": "object",
+                "required": True,
+                "description": "Geographic location {latitude: float, longitude: float}",
+            },
+            "tilt": {
+                "type": "int",
+                "required": True,
+                "range": "0-90",
+                "unit": "degrees",
+                "description": "Panel tilt angle",
+            },
+            "azimuth": {
+                "type": "int",
+                "required": True,
+                "range": "0-359",
+                "unit": "degrees",
+                "description": "Azimuth (180=south)",
+            },
+            "generation_profile": {
+                "type": "list[float]",
+                "required": False,
+                "description": "Normalized generation profile (0-1). Loaded from PVGIS if not provided.",
             },
         },
-        "electricity_import": {
-            "device_type": "electricity_import",
-            "properties": {
-                "price": {
-                    "type": "float | list[float] | {file: str}",
-                    "required": True,
-                    "unit": "EUR/MWh",
-                    "description": "Price profile. Supports: flat value, array, or {file: 'path.csv'}",
-                },
-                "max_import": {
-                    "type": "float",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Maximum import capacity",
-                },
-                "max_import_unit_cost": {
-                    "type": "float",
-                    "required": False,
-                    "unit": "EUR/MW/year",
-                    "description": "Reserved capacity cost",
-                },
-            },
-            "supports_schedule": False,
-            "example": {"price": 50.0, "max_import": 10.0},
+        "supports_schedule": True,
+        "example": {
+            "peak_power_mw": 5.0,
+            "location": {"latitude": 50.07, "longitude": 14.44},
+            "tilt": 35,
+            "azimuth": 180,
         },
-        "electricity_export": {
-            "device_type": "electricity_export",
-            "properties": {
-                "price": {
-                    "type": "float | list[float] | {file: str}",
-                    "required": True,
-                    "unit": "EUR/MWh",
-                    "description": "Price profile. Supports: flat value, array, or {file: 'path.csv'}",
-                },
-                "max_export": {
-                    "type": "float",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Maximum export capacity",
-                },
-                "max_export_unit_cost": {
-                    "type": "float",
-                    "required": False,
-                    "unit": "EUR/MW/year",
-                    "description": "Export capacity cost",
-                },
-            },
-            "supports_schedule": False,
-            "example": {"price": 50.0, "max_export": 10.0},
+    },
+    "electricity_import": {
+        "device_type": "electricity_import",
+        "properties": {
+            "price": {
+                "type": "float | list[float] | {file: str}",
+                "required": True,
+                "unit": "EUR/MWh",
+                "description": "Price profile. Supports: flat value, array, or {file: 'path.csv'}",
+            },
+            "max_import": {
+                "type": "float",
+                "required": True,
+                "unit": "MW",
+                "description": "Maximum import capacity",
+            },
+            "max_import_unit_cost": {
+                "type": "float",
+                "required": False,
+                "unit": "EUR/MW/year",
+                "description": "Reserved capacity cost",
+            },
         },
-        "gas_import": {
-            "device_type": "gas_import",
-            "properties": {
-                "price": {
-                    "type": "float | list[float] | {file: str}",
-                    "required": True,
-                    "unit": "EUR/MWh",
-                    "description": "Gas price profile",
-                },
-                "max_import": {
-                    "type": "float",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Maximum gas import capacity",
-                },
-                "max_import_unit_cost": {
-                    "type": "float",
-                    "required": False,
-                    "unit": "EUR/MW/year",
-                    "description": "Reserved capacity cost",
-                },
-            },
-            "supports_schedule": False,
-            "example": {"price": 35.0, "max_import": 5.0},
+        "supports_schedule": False,
+        "example": {"price": 50.0, "max_import": 10.0},
+    },
+    "electricity_export": {
+        "device_type": "electricity_export",
+        "properties": {
+            "price": {
+                "type": "float | list[float] | {file: str}",
+                "required": True,
+                "unit": "EUR/MWh",
+                "description": "Price profile. Supports: flat value, array, or {file: 'path.csv'}",
+            },
+            "max_export": {
+                "type": "float",
+                "required": True,
+                "unit": "MW",
+                "description": "Maximum export capacity",
+            },
+            "max_export_unit_cost": {
+                "type": "float",
+                "required": False,
+                "unit": "EUR/MW/year",
+                "description": "Export capacity cost",
+            },
         },
-        "heat_export": {
-            "device_type": "heat_export",
-            "properties": {
-                "price": {
-                    "type": "float | list[float] | {file: str}",
-                    "required": True,
-                    "unit": "EUR/MWh",
-                    "description": "Heat price profile",
-                },
-                "max_export": {
-                    "type": "float",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Maximum heat export capacity",
-                },
-                "max_export_unit_cost": {
-                    "type": "float",
-                    "required": False,
-                    "unit": "EUR/MW/year",
-                    "description": "Export capacity cost",
-                },
-            },
-            "supports_schedule": False,
-            "example": {"price": 40.0, "max_export": 2.0},
+        "supports_schedule": False,
+        "example": {"price": 50.0, "max_export": 10.0},
+    },
+    "gas_import": {
+        "device_type": "gas_import",
+        "properties": {
+            "price": {
+                "type": "float | list[float] | {file: str}",
+                "required": True,
+                "unit": "EUR/MWh",
+                "description": "Gas price profile",
+            },
+            "max_import": {
+                "type": "float",
+                "required": True,
+                "unit": "MW",
+                "description": "Maximum gas import capacity",
+            },
+            "max_import_unit_cost": {
+                "type": "float",
+                "required": False,
+                "unit": "EUR/MW/year",
+                "description": "Reserved capacity cost",
+            },
         },
-        "electricity_demand": {
-            "device_type": "electricity_demand",
-            "properties": {
-                "max_demand_profile": {
-                    "type": "float | list[float] | {file: str}",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Maximum demand profile (MW, not MWh!)",
-                },
-                "min_demand_profile": {
-                    "type": "float | list[float] | {file: str}",
-                    "required": False,
-                    "default": 0,
-                    "unit": "MW",
-                    "description": "Minimum demand profile or constant. Supports file loading.",
-                },
-            },
-            "supports_schedule": False,
-            "example": {"max_demand_profile": 5.0},
+        "supports_schedule": False,
+        "example": {"price": 35.0, "max_import": 5.0},
+    },
+    "heat_export": {
+        "device_type": "heat_export",
+        "properties": {
+            "price": {
+                "type": "float | list[float] | {file: str}",
+                "required": True,
+                "unit": "EUR/MWh",
+                "description": "Heat price profile",
+            },
+            "max_export": {
+                "type": "float",
+                "required": True,
+                "unit": "MW",
+                "description": "Maximum heat export capacity",
+            },
+            "max_export_unit_cost": {
+                "type": "float",
+                "required": False,
+                "unit": "EUR/MW/year",
+                "description": "Export capacity cost",
+            },
         },
-        "heat_demand": {
-            "device_type": "heat_demand",
-            "properties": {
-                "max_demand_profile": {
-                    "type": "float | list[float] | {file: str}",
-                    "required": True,
-                    "unit": "MW",
-                    "description": "Maximum heat demand profile (MW)",
-                },
-                "min_demand_profile": {
-                    "type": "float | list[float] | {file: str}",
-                    "required": False,
-                    "default": 0,
-                    "unit": "MW",
-                    "description": "Minimum heat demand profile or constant. Supports file loading.",
-                },
-            },
-            "supports_schedule": False,
-            "example": {"max_demand_profile": 3.0},
+        "supports_schedule": False,
+        "example": {"price": 40.0, "max_export": 2.0},
+    },
+    "electricity_demand": {
+        "device_type": "electricity_demand",
+        "properties": {
+            "max_demand_profile": {
+                "type": "float | list[float] | {file: str}",
+                "required": True,
+                "unit": "MW",
+                "description": "Maximum demand profile (MW, not MWh!)",
+            },
+            "min_demand_profile": {
+                "type": "float | list[float] | {file: str}",
+                "required": False,
+                "default": 0,
+                "unit": "MW",
+                "description": "Minimum demand profile or constant. Supports file loading.",
+            },
         },
-    }
+        "supports_schedule": False,
+        "example": {"max_demand_profile": 5.0},
+    },
+    "heat_demand": {
+        "device_type": "heat_demand",
+        "properties": {
+            "max_demand_profile": {
+                "type": "float | list[float] | {file: str}",
+                "required": True,
+                "unit": "MW",
+                "description": "Maximum heat demand profile (MW)",
+            },
+            "min_demand_profile": {
+                "type": "float | list[float] | {file: str}",
+                "required": False,
+                "default": 0,
+                "unit": "MW",
+                "description": "Minimum heat demand profile or constant. Supports file loading.",
+            },
+        },
+        "supports_schedule": False,
+        "example": {"max_demand_profile": 3.0},
+    },
+}
+
+
+def get_device_schema(device_type: str) -> dict[str, Any]:
+    """Get the properties schema for a device type.
 
-    dtype = device_type.lower()
-    if dtype not in schemas:
+    Shows required/optional properties, types, units, ranges, and defaults.
+    Use this before add_device to know what properties are needed.
+
+    :param device_type: e.g., "battery", "chp", "photovoltaic", "electricity_import".
+    :returns: Schema dict with properties documentation.
+    """
+    schema = _DEVICE_SCHEMAS.get(device_type.lower())
+    if schema is None:
         return {
             "error": f"Unknown device type '{device_type}'.",
-            "valid_types": sorted(schemas.keys()),
+            "valid_types": sorted(_DEVICE_SCHEMAS),
         }
 
-    return schemas[dtype]
+    return schema
 
 
 def get_version() -> dict:
@@ -802,22 +850,98 @@ def get_version() -> dict:
     return result
 
 
+# Tools batch_tool_calls may dispatch to: lookups only, nothing that changes state
+_READ_ONLY_TOOLS: dict[str, Callable[..., Any]] = {
+    "get_job_status": get_job_status,
+    "get_job_result": get_job_result,
+    "review_scenario": review_scenario,
+    "list_scenarios": list_scenarios,
+    "list_jobs": list_jobs,
+    "get_device_schema": get_device_schema,
+    "get_version": get_version,
+}
+
+# Upper bound on operations per batch, so one call cannot fan out unboundedly
+_MAX_BATCH_OPERATIONS = 16
+
+# Worker threads per batch; matches the client's connection pool (max_connections=8)
+_BATCH_WORKERS = 8
+
+
+def _run_batch_operation(index: int, operation: dict[str, Any]) -> dict[str, Any]:
+    """Run one batch_tool_calls operation, capturing any failure in the entry."""
+    tool_name = operation.get("tool")
+    entry: dict[str, Any] = {"index": index, "tool": tool_name}
+    tool = _READ_ONLY_TOOLS.get(tool_name) if isinstance(tool_name, str) else None
+    if tool is None:
+        entry["ok"] = False
+        entry["error"] = f"Tool '{tool_name}' cannot be batched. Allowed tools: {', '.join(sorted(_READ_ONLY_TOOLS))}"
+        return entry
+    try:
+        result = tool(**(operation.get("arguments") or {}))
+    except Exception as e:
+        entry["ok"] = False
+        entry["error"] = f"{type(e).__name__}: {e}"
+    else:
+        entry["ok"] = True
+        entry["result"] = result
+    return entry
+
+
+def batch_tool_calls(operations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Run several read-only tool calls in one round trip.
+
+    Use this instead of calling lookup tools one after another, e.g. checking
+    the status of several jobs, or fetching a result and reviewing its scenario.
+    Allowed tools: get_job_status, get_job_result, review_scenario,
+    list_scenarios, list_jobs, get_device_schema, get_version.
+
+    Operations run concurrently and independently; a failing operation is
+    reported in its own entry and does not stop the others.
+
+    :param operations: Up to 16 calls, each {"tool": "<name>", "arguments": {...}}.
+        Example: [{"tool": "get_job_status", "arguments": {"job_id": "job_1"}},
+        {"tool": "get_job_status", "arguments": {"job_id": "job_2"}}].
+    :returns: One entry per operation, in order: {"index", "tool", "ok", "result"}
+        on success or {"index", "tool", "ok", "error"} on failure.
+    :raises ValueError: If more than 16 operations are given.
+    """
+    if len(operations) > _MAX_BATCH_OPERATIONS:
+        raise ValueError(f"Too many operations ({len(operations)}). At most {_MAX_BATCH_OPERATIONS} per batch.")
+
+    if len(operations) <= 1:
+        return [_run_batch_operation(index, operation) for index, operation in enumerate(operations)]
+
+    # The API lookups are independent and I/O-bound: overlap them so the batch
+    # takes about as long as its slowest call. map() keeps the input order.
+    with ThreadPoolExecutor(max_workers=min(len(operations), _BATCH_WORKERS)) as pool:
+        return list(pool.map(_run_batch_operation, range(len(operations)), operations))
+
+
 # --- Register all functions as MCP tools ---
 
-mcp.tool()(get_version)
-mcp.tool()(create_scenario)
-mcp.tool()(add_device)
-mcp.tool()(set_timespan)
-mcp.tool()(set_investment_params)
-mcp.tool()(review_scenario)
-mcp.tool()(remove_device)
-mcp.tool()(delete_scenario)
-mcp.tool()(list_scenarios)
-mcp.tool()(submit_scenario)
-mcp.tool()(get_job_status)
-mcp.tool()(get_job_result)
-mcp.tool()(cancel_job)
-mcp.tool()(list_jobs)
-mcp.tool()(get_device_schema)
-mcp.tool()(save_data_file)
-mcp.tool()(fetch_url)
+# In the order list_tools reports them
+_TOOLS: tuple[Callable[..., Any], ...] = (
+    get_version,
+    create_scenario,
+    add_device,
+    set_timespan,
+    set_investment_params,
+    review_scenario,
+    remove_device,
+    delete_scenario,
+    list_scenarios,
+    submit_scenario,
+    get_job_status,
+    get_job_result,
+    cancel_job,
+    list_jobs,
+    get_device_schema,
+    batch_tool_calls,
+    save_data_file,
+    fetch_url,
+    fetch_urls,
+)
+
+for _tool in _TOOLS:
+    mcp.tool()(_tool)
@@ -1,11 +1,23 @@
 """Device models for investment client (NO ancillary services)."""
 
-from typing import List, Literal, Optional, Union
+from typing import Annotated, Any, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, BeforeValidator, Field, field_validator
 
 from site_calc_investment.models.common import Location
 
+
+def _array_to_list(v: Any) -> Any:
+    """Convert NumPy arrays to lists in one C-level pass before validation."""
+    if isinstance(v, np.ndarray):
+        return v.tolist()
+    return v
+
+
+# Float profile that also accepts NumPy arrays (and tuples) of any length
+PriceProfile = Annotated[List[float], BeforeValidator(_array_to_list)]
+
 # Device Properties Models
 
 
@@ -56,7 +68,7 @@ class PhotovoltaicProperties(BaseModel):
     location: Location = Field(..., description="Geographic location")
     tilt: int = Field(..., ge=0, le=90, description="Panel tilt angle (degrees)")
     azimuth: int = Field(..., ge=0, lt=360, description="Azimuth angle (degrees, 180=south)")
-    generation_profile: Optional[List[float]] = Field(None, description="Optional normalized generation profile (0-1)")
+    generation_profile: Optional[PriceProfile] = Field(None, description="Optional normalized generation profile (0-1)")
 
     @field_validator("generation_profile")
     @classmethod
@@ -71,8 +83,8 @@ class PhotovoltaicProperties(BaseModel):
 class DemandProperties(BaseModel):
     """Demand properties (heat or electricity)."""
 
-    max_demand_profile: List[float] = Field(..., description="Maximum demand profile (MW, not MWh!)")
-    min_demand_profile: Union[List[float], float] = Field(
+    max_demand_profile: PriceProfile = Field(..., description="Maximum demand profile (MW, not MWh!)")
+    min_demand_profile: Union[PriceProfile, float] = Field(
         0, description="Minimum demand profile (MW) or constant value"
     )
 
@@ -92,7 +104,7 @@ class DemandProperties(BaseModel):
 class MarketImportProperties(BaseModel):
     """Market import device properties (electricity or gas)."""
 
-    price: List[float] = Field(..., description="Price profile (EUR/MWh)")
+    price: PriceProfile = Field(..., description="Price profile (EUR/MWh)")
     max_import: float = Field(..., gt=0, description="Maximum import capacity (MW)")
     max_import_unit_cost: Optional[float] = Field(
         None, ge=0, description="Optional reserved capacity cost (EUR/MW/year)"
@@ -102,7 +114,7 @@ class MarketImportProperties(BaseModel):
 class MarketExportProperties(BaseModel):
     """Market export device properties (electricity or heat)."""
 
-    price: List[float] = Field(..., description="Price profile (EUR/MWh)")
+    price: PriceProfile = Field(..., description="Price profile (EUR/MWh)")
     max_export: float = Field(..., gt=0, description="Maximum export capacity (MW)")
     max_export_unit_cost: Optional[float] = Field(None, ge=0, description="Optional export capacity cost (EUR/MW/year)")
 
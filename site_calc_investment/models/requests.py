@@ -1,8 +1,15 @@
 """Request models for investment client."""
 
-from typing import Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+)
 
 from site_calc_investment.models.common import Resolution, TimeSpan
 from site_calc_investment.models.devices import Device
@@ -121,13 +128,31 @@ class InvestmentPlanningRequest(BaseModel):
         description="Optimization configuration",
     )
 
+    @field_serializer("timespan", mode="wrap")
+    def _serialize_timespan(
+        self, timespan: TimeSpanInvestment, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Any:
+        """Emit the API timespan format when serializing with the "api" context."""
+        if info.context and info.context.get("api"):
+            return timespan.to_api_dict()
+        return handler(timespan)
+
     def model_dump_for_api(self) -> dict:
         """Convert to API format.
 
         Returns:
             Dictionary ready for JSON serialization and API submission
         """
-        data = self.model_dump()
-        # Convert timespan to API format
-        data["timespan"] = self.timespan.to_api_dict()
-        return data
+        return self.model_dump(context={"api": True})
+
+    def model_dump_json_for_api(self) -> str:
+        """Serialize to the API's JSON body.
+
+        Same content as ``model_dump_for_api()``, but encoded directly by
+        pydantic-core without building the intermediate dict, which matters
+        for multi-year hourly price and demand profiles.
+
+        Returns:
+            JSON string ready for API submission
+        """
+        return self.model_dump_json(context={"api": True})
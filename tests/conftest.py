@@ -262,12 +262,14 @@ def skip_version_check(monkeypatch):
     This avoids needing to mock the /health endpoint in every test.
     The version validation logic should be tested separately.
     """
+    from site_calc_investment.api.async_client import InvestmentAsyncClient
     from site_calc_investment.api.client import InvestmentClient
 
-    original_init = InvestmentClient.__init__
+    for client_cls in (InvestmentClient, InvestmentAsyncClient):
+        original_init = client_cls.__init__
 
-    def patched_init(self, *args, **kwargs):
-        original_init(self, *args, **kwargs)
-        self._version_checked = True
+        def patched_init(self, *args, _original_init=original_init, **kwargs):
+            _original_init(self, *args, **kwargs)
+            self._version_checked = True
 
-    monkeypatch.setattr(InvestmentClient, "__init__", patched_init)
+        monkeypatch.setattr(client_cls, "__init__", patched_init)
@@ -1,11 +1,14 @@
 """Tests for InvestmentClient API client with mocked HTTP."""
 
+import json
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
 from site_calc_investment.api.client import InvestmentClient
 from site_calc_investment.exceptions import (
+    ApiError,
     AuthenticationError,
     ForbiddenFeatureError,
     JobNotFoundError,
@@ -89,6 +92,10 @@ class TestCreatePlanningJob:
         assert job.status == "pending"
         mock_request.assert_called_once()
 
+        body = json.loads(mock_request.call_args.kwargs["content"])
+        assert body["timespan"]["period_start"] == timespan.start.isoformat()
+        assert body["sites"][0]["site_id"] == simple_site.site_id
+
     @patch("httpx.Client.request")
     def test_create_planning_job_validation_error(self, mock_request):
         """Test validation error response."""
@@ -115,7 +122,7 @@ class TestCreatePlanningJob:
                 from site_calc_investment.models.requests import InvestmentPlanningRequest
 
                 mock_request_obj = Mock(spec=InvestmentPlanningRequest)
-                mock_request_obj.model_dump_for_api.return_value = {}
+                mock_request_obj.model_dump_json_for_api.return_value = "{}"
                 client.create_planning_job(mock_request_obj)
 
     @patch("httpx.Client.request")
@@ -135,7 +142,7 @@ class TestCreatePlanningJob:
 
             with pytest.raises(ForbiddenFeatureError, match="Ancillary services"):
                 mock_request_obj = Mock()
-                mock_request_obj.model_dump_for_api.return_value = {}
+                mock_request_obj.model_dump_json_for_api.return_value = "{}"
                 client.create_planning_job(mock_request_obj)
 
     @patch("httpx.Client.request")
@@ -159,7 +166,7 @@ class TestCreatePlanningJob:
 
             with pytest.raises(LimitExceededError) as exc_info:
                 mock_request_obj = Mock()
-                mock_request_obj.model_dump_for_api.return_value = {}
+                mock_request_obj.model_dump_json_for_api.return_value = "{}"
                 client.create_planning_job(mock_request_obj)
 
             assert exc_info.value.requested == 150000
@@ -205,7 +212,7 @@ class TestGetJobResult:
         """Test getting completed job result."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_job_result_api_response
+        mock_response.content = json.dumps(mock_job_result_api_response).encode()
         mock_request.return_value = mock_response
 
         client = InvestmentClient("https://api.example.com", "inv_test")
@@ -350,7 +357,7 @@ class TestWaitForCompletion:
         # Third call returns full results (API response with 'result' wrapper)
         mock_response_full_result = Mock()
         mock_response_full_result.status_code = 200
-        mock_response_full_result.json.return_value = mock_job_result_api_response
+        mock_response_full_result.content = json.dumps(mock_job_result_api_response).encode()
 
         mock_request.side_effect = [mock_response_running, mock_response_status_completed, mock_response_full_result]
 
@@ -393,6 +400,87 @@ class TestWaitForCompletion:
         with pytest.raises(TimeoutError, match="did not complete"):
             client.wait_for_completion("test_job_123", poll_interval=1, timeout=50)
 
+    @patch("httpx.Client.request")
+    @patch("time.sleep")
+    def test_wait_for_completion_backoff(self, mock_sleep, mock_request, mock_job_running_response):
+        """Test poll interval grows by 1.5x up to poll_interval_max."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = mock_job_running_response
+
+        failed_response = Mock()
+        failed_response.status_code = 200
+        failed_response.headers = {}
+        failed_response.json.return_value = {
+            "job_id": "test_job_123",
+            "status": "failed",
+            "created_at": "2025-01-01T10:00:00+01:00",
+            "error": {"message": "stop"},
+        }
+        mock_request.side_effect = [mock_response] * 5 + [failed_response]
+
+        client = InvestmentClient("https://api.example.com", "inv_test")
+
+        with pytest.raises(OptimizationError):
+            client.wait_for_completion("test_job_123", poll_interval=2, poll_interval_max=5, timeout=None)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 3, 4.5, 5, 5]
+
+    @patch("httpx.Client.request")
+    @patch("time.time")
+    @patch("time.sleep")
+    def test_wait_for_completion_sleep_clamped_to_timeout(
+        self, mock_sleep, mock_time, mock_request, mock_job_running_response
+    ):
+        """Test the last wait is shortened so the timeout is not overshot."""
+        mock_time.side_effect = [0, 55, 61]  # Start, after 1st poll, after 2nd poll
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = mock_job_running_response
+        mock_request.return_value = mock_response
+
+        client = InvestmentClient("https://api.example.com", "inv_test")
+
+        with pytest.raises(TimeoutError, match="did not complete"):
+            client.wait_for_completion("test_job_123", poll_interval=30, timeout=60)
+
+        mock_sleep.assert_called_once_with(5)
+
+    @patch("httpx.Client.request")
+    @patch("time.sleep")
+    def test_wait_for_completion_not_modified(self, mock_sleep, mock_request, mock_job_running_response):
+        """Test ETag is sent on re-polls and a 304 reuses the previous status."""
+        running = Mock()
+        running.status_code = 200
+        running.headers = {"ETag": '"v1"'}
+        running.json.return_value = mock_job_running_response
+
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {"ETag": '"v1"'}
+        not_modified.json.side_effect = AssertionError("304 body must not be parsed")
+
+        cancelled = Mock()
+        cancelled.status_code = 200
+        cancelled.headers = {}
+        cancelled.json.return_value = {
+            "job_id": "test_job_123",
+            "status": "cancelled",
+            "created_at": "2025-01-01T10:00:00+01:00",
+        }
+        mock_request.side_effect = [running, not_modified, cancelled]
+
+        client = InvestmentClient("https://api.example.com", "inv_test")
+
+        with pytest.raises(ApiError, match="cancelled"):
+            client.wait_for_completion("test_job_123", poll_interval=1, timeout=None)
+
+        sent_headers = [c.kwargs["headers"] for c in mock_request.call_args_list]
+        assert sent_headers == [None, {"If-None-Match": '"v1"'}, {"If-None-Match": '"v1"'}]
+
 
 class TestRetryLogic:
     """Tests for retry logic."""
@@ -439,3 +527,79 @@ class TestRetryLogic:
         # Should NOT retry on 400
         assert mock_request.call_count == 1
         assert not mock_sleep.called
+
+    @patch("httpx.Client.request")
+    @patch("time.sleep")
+    def test_no_retry_on_post_server_error(self, mock_sleep, mock_request):
+        """Test POST is not re-sent after a 5xx (it may have created a job)."""
+        mock_request.return_value = Mock(status_code=500, text="Server error")
+
+        client = InvestmentClient("https://api.example.com", "inv_test", max_retries=3)
+
+        with pytest.raises(ApiError, match="Server error"):
+            client._request_with_retry("POST", "/api/v1/jobs/device-planning", content=b"{}")
+
+        assert mock_request.call_count == 1
+        assert not mock_sleep.called
+
+    @patch("httpx.Client.request")
+    @patch("time.sleep")
+    def test_no_retry_on_post_timeout(self, mock_sleep, mock_request):
+        """Test POST is not re-sent after a read timeout."""
+        mock_request.side_effect = httpx.ReadTimeout("timed out")
+
+        client = InvestmentClient("https://api.example.com", "inv_test", max_retries=3)
+
+        with pytest.raises(TimeoutError):
+            client._request_with_retry("POST", "/api/v1/jobs/device-planning", content=b"{}")
+
+        assert mock_request.call_count == 1
+
+    @patch("httpx.Client.request")
+    @patch("time.sleep")
+    def test_retry_post_on_connect_error(self, mock_sleep, mock_request):
+        """Test POST is retried when the connection was never established."""
+        ok = Mock(status_code=202)
+        mock_request.side_effect = [httpx.ConnectError("refused"), ok]
+
+        client = InvestmentClient("https://api.example.com", "inv_test", max_retries=3)
+
+        assert client._request_with_retry("POST", "/api/v1/jobs/device-planning", content=b"{}") is ok
+        assert mock_request.call_count == 2
+
+    @patch("httpx.Client.request")
+    @patch("time.sleep")
+    def test_retry_honors_retry_after(self, mock_sleep, mock_request):
+        """Test 429 responses wait for the Retry-After delay."""
+        throttled = Mock(status_code=429, headers={"Retry-After": "7"}, text="Too many requests")
+        ok = Mock(
+            status_code=200,
+            json=lambda: {"job_id": "test", "status": "pending", "created_at": "2025-01-01T10:00:00+01:00"},
+        )
+        mock_request.side_effect = [throttled, ok]
+
+        client = InvestmentClient("https://api.example.com", "inv_test", max_retries=3)
+
+        job = client.get_job_status("test")
+        assert job.status == "pending"
+        mock_sleep.assert_called_once_with(7.0)
+
+    @pytest.mark.parametrize(
+        "retry_after, expected_delay",
+        [("3600", 60.0), ("1e400", 1.0), ("inf", 1.0), ("nan", 1.0), ("-5", 0.0), ("soon", 1.0)],
+    )
+    @patch("httpx.Client.request")
+    @patch("time.sleep")
+    def test_retry_after_is_bounded(self, mock_sleep, mock_request, retry_after, expected_delay):
+        """Test huge or non-finite Retry-After values are capped or fall back to backoff."""
+        throttled = Mock(status_code=429, headers={"Retry-After": retry_after}, text="Too many requests")
+        ok = Mock(
+            status_code=200,
+            json=lambda: {"job_id": "test", "status": "pending", "created_at": "2025-01-01T10:00:00+01:00"},
+        )
+        mock_request.side_effect = [throttled, ok]
+
+        client = InvestmentClient("https://api.example.com", "inv_test", max_retries=3)
+
+        assert client.get_job_status("test").status == "pending"
+        mock_sleep.assert_called_once_with(expected_delay)
@@ -0,0 +1,227 @@
+"""Tests for InvestmentAsyncClient and run_scenarios."""
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from site_calc_investment.api.async_client import InvestmentAsyncClient, run_scenarios
+from site_calc_investment.exceptions import ApiError, JobNotFoundError, OptimizationError, TimeoutError
+from site_calc_investment.models.common import Resolution
+from site_calc_investment.models.requests import InvestmentPlanningRequest, TimeSpanInvestment
+from site_calc_investment.models.responses import InvestmentPlanningResponse, Job
+
+
+def _json_response(status_code, payload):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+@pytest.fixture
+def planning_request(simple_site, prague_tz):
+    """Minimal one-year planning request."""
+    timespan = TimeSpanInvestment(
+        start=datetime(2025, 1, 1, 0, 0, 0, tzinfo=prague_tz), intervals=8760, resolution=Resolution.HOUR_1
+    )
+    return InvestmentPlanningRequest(sites=[simple_site], timespan=timespan)
+
+
+class TestInvestmentAsyncClient:
+    """Tests for the async client methods."""
+
+    def test_client_requires_inv_prefix(self):
+        """Test that the async client shares the API key validation."""
+        with pytest.raises(ValueError, match="must start with 'inv_'"):
+            InvestmentAsyncClient("https://api.example.com", "op_test")
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes(self):
+        """Test async context manager closes the HTTP client."""
+        async with InvestmentAsyncClient("https://api.example.com", "inv_test") as client:
+            assert isinstance(client._client, httpx.AsyncClient)
+        assert client._client.is_closed
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    async def test_create_planning_job(self, mock_request, planning_request, mock_job_response):
+        """Test job creation sends the serialized request."""
+        mock_request.return_value = _json_response(202, mock_job_response)
+
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test")
+        job = await client.create_planning_job(planning_request)
+
+        assert isinstance(job, Job)
+        assert job.job_id == "test_job_123"
+        body = json.loads(mock_request.call_args.kwargs["content"])
+        assert body["sites"][0]["site_id"] == planning_request.sites[0].site_id
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    async def test_get_job_status_not_found(self, mock_request):
+        """Test 404 maps to JobNotFoundError."""
+        mock_request.return_value = _json_response(
+            404, {"error": {"code": "job_not_found", "message": "Job not found"}}
+        )
+
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test")
+        with pytest.raises(JobNotFoundError):
+            await client.get_job_status("missing")
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_on_server_error(self, mock_sleep, mock_request, mock_job_running_response):
+        """Test GET requests are retried after a 5xx with asyncio.sleep."""
+        mock_request.side_effect = [
+            _json_response(503, {"error": {"message": "unavailable"}}),
+            _json_response(200, mock_job_running_response),
+        ]
+
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test")
+        job = await client.get_job_status("test_job_123")
+
+        assert job.status == "running"
+        assert mock_request.call_count == 2
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_gives_up_with_last_error(self, mock_sleep, mock_request):
+        """Test transport errors are retried, then surface as ApiError."""
+        mock_request.side_effect = httpx.ConnectError("refused")
+
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test", max_retries=3)
+        with pytest.raises(ApiError, match="Request failed: refused"):
+            await client.get_job_status("test_job_123")
+
+        assert mock_request.call_count == 3
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1, 2]
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_no_retry_on_post_timeout(self, mock_sleep, mock_request, planning_request):
+        """Test job creation is not re-sent after a read timeout."""
+        mock_request.side_effect = httpx.ReadTimeout("timed out")
+
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test", max_retries=3)
+        with pytest.raises(TimeoutError):
+            await client.create_planning_job(planning_request)
+
+        assert mock_request.call_count == 1
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_submit_and_wait_cancels_server_job(self, planning_request):
+        """Test cancelling the wait also cancels the job on the server."""
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test")
+        waiting = asyncio.Event()
+
+        async def hang(job_id, **wait_kwargs):
+            waiting.set()
+            await asyncio.Event().wait()
+
+        with (
+            patch.object(client, "create_planning_job", AsyncMock(return_value=Mock(job_id="job_1"))),
+            patch.object(client, "wait_for_completion", side_effect=hang),
+            patch.object(client, "cancel_job", AsyncMock()) as cancel_job,
+        ):
+            task = asyncio.ensure_future(client.submit_and_wait(planning_request))
+            await waiting.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        cancel_job.assert_awaited_once_with("job_1")
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_wait_for_completion_success(
+        self, mock_sleep, mock_request, mock_job_running_response, mock_job_result_api_response
+    ):
+        """Test polling until completed, then fetching the result."""
+        mock_request.side_effect = [
+            _json_response(200, mock_job_running_response),
+            _json_response(200, {**mock_job_running_response, "status": "completed"}),
+            _json_response(200, mock_job_result_api_response),
+        ]
+
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test")
+        result = await client.wait_for_completion("test_job_123", poll_interval=1, timeout=60)
+
+        assert isinstance(result, InvestmentPlanningResponse)
+        assert result.status == "completed"
+        mock_sleep.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    async def test_wait_for_completion_failed(self, mock_request, mock_job_failed_response):
+        """Test failed jobs raise OptimizationError."""
+        mock_request.return_value = _json_response(200, mock_job_failed_response)
+
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test")
+        with pytest.raises(OptimizationError):
+            await client.wait_for_completion("test_job_123")
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    async def test_wait_for_completion_cancelled(self, mock_request, mock_job_running_response):
+        """Test cancelled jobs raise ApiError."""
+        mock_request.return_value = _json_response(200, {**mock_job_running_response, "status": "cancelled"})
+
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test")
+        with pytest.raises(ApiError, match="cancelled"):
+            await client.wait_for_completion("test_job_123")
+
+
+class TestRunScenarios:
+    """Tests for concurrent scenario execution."""
+
+    @pytest.mark.asyncio
+    async def test_run_scenarios_preserves_order(self, planning_request, mock_job_completed_response):
+        """Test results come back in request order."""
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test")
+        requests = [planning_request, planning_request.model_copy()]
+        results = {
+            id(request): InvestmentPlanningResponse(**{**mock_job_completed_response, "job_id": f"job_{i}"})
+            for i, request in enumerate(requests)
+        }
+
+        async def fake_submit_and_wait(request, **wait_kwargs):
+            assert wait_kwargs == {"timeout": 60}
+            return results[id(request)]
+
+        with patch.object(client, "submit_and_wait", side_effect=fake_submit_and_wait):
+            responses = await run_scenarios(client, requests, timeout=60)
+
+        assert [r.job_id for r in responses] == ["job_0", "job_1"]
+
+    @pytest.mark.asyncio
+    async def test_run_scenarios_cancels_others_on_failure(self, planning_request):
+        """Test the first failure cancels the remaining scenarios and propagates."""
+        client = InvestmentAsyncClient("https://api.example.com", "inv_test")
+        failing = planning_request.model_copy()
+        cancelled = []
+
+        async def fake_submit_and_wait(request, **wait_kwargs):
+            if request is failing:
+                raise OptimizationError("infeasible")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(request)
+                raise
+
+        with patch.object(client, "submit_and_wait", side_effect=fake_submit_and_wait):
+            with pytest.raises(OptimizationError, match="infeasible"):
+                await run_scenarios(client, [planning_request, failing])
+
+        assert cancelled == [planning_request]
@@ -1,5 +1,6 @@
 """Tests for device models."""
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -229,6 +230,13 @@ class TestDemandDevices:
         assert demand.type == "electricity_demand"
         assert demand.properties.min_demand_profile == 2.0
 
+    def test_demand_accepts_numpy_arrays(self):
+        """Test demand profiles given as NumPy arrays are stored as lists of floats."""
+        props = DemandProperties(max_demand_profile=np.full(24, 3.0), min_demand_profile=np.zeros(24))
+
+        assert props.max_demand_profile == [3.0] * 24
+        assert type(props.min_demand_profile) is list
+
     def test_demand_validation_positive(self):
         """Test demand values must be non-negative."""
         with pytest.raises(ValidationError):
@@ -286,6 +294,21 @@ class TestMarketDevices:
 
         assert device.properties.max_import_unit_cost == 144.0
 
+    def test_market_price_accepts_numpy_array(self):
+        """Test price profile given as a NumPy array is stored as a list of floats."""
+        prices = np.linspace(20.0, 80.0, 24)
+        props = MarketImportProperties(price=prices, max_import=8.0)
+
+        assert props.price == prices.tolist()
+        assert type(props.price) is list
+        assert type(props.price[0]) is float
+
+    def test_market_price_accepts_tuple(self):
+        """Test price profile given as a tuple."""
+        props = MarketExportProperties(price=(30.0, 40.0), max_export=5.0)
+
+        assert props.price == [30.0, 40.0]
+
 
 class TestSchedule:
     """Tests for Schedule model."""
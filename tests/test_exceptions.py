@@ -0,0 +1,34 @@
+"""Tests for client exceptions."""
+
+import copy
+import pickle
+
+import pytest
+
+from site_calc_investment.exceptions import (
+    JobNotFoundError,
+    LimitExceededError,
+    SiteCalcError,
+    TimeoutError,
+)
+
+
+class TestExceptionAttributes:
+    """Tests for exception attributes."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            SiteCalcError("Bad request", code="bad", details={"field": "sites"}),
+            LimitExceededError("Too many intervals", requested=200000, max_allowed=100000),
+            TimeoutError("Request timeout after 30s", timeout=30.0),
+            JobNotFoundError("Job not found", code="job_not_found"),
+        ],
+    )
+    def test_pickle_and_copy_keep_attributes(self, error):
+        """Test pickling and copying preserve every attribute."""
+        for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+            assert type(restored) is type(error)
+            assert restored.args == error.args
+            for name in ("message", "code", "details", "requested", "max_allowed", "timeout"):
+                assert getattr(restored, name, None) == getattr(error, name, None)
@@ -1,11 +1,13 @@
 """Tests for financial analysis functions."""
 
+import numpy as np
 import pytest
 
 from site_calc_investment.analysis.financial import (
     aggregate_annual,
     calculate_irr,
     calculate_npv,
+    calculate_npv_batch,
     calculate_payback_period,
 )
 
@@ -61,6 +63,37 @@ class TestCalculateNPV:
         # Approximate check
         assert 250_000 < npv < 300_000
 
+    def test_npv_numpy_input(self):
+        """Test NPV accepts a NumPy array and matches the list result."""
+        cash_flows = [100_000, 105_000, 110_000]
+
+        npv_list = calculate_npv(cash_flows, 0.05, -250_000)
+        npv_array = calculate_npv(np.array(cash_flows, dtype=np.float64), 0.05, -250_000)
+
+        assert isinstance(npv_array, float)
+        assert npv_array == pytest.approx(npv_list)
+
+
+class TestCalculateNPVBatch:
+    """Tests for batched NPV calculation."""
+
+    def test_npv_batch_matches_single(self):
+        """Test batched NPV equals calculate_npv for each rate."""
+        cash_flows = [100_000, 105_000, 110_000, 115_000, 120_000]
+        rates = [0.0, 0.03, 0.05, 0.1]
+
+        npvs = calculate_npv_batch(cash_flows, rates, initial_investment=-500_000)
+
+        assert len(npvs) == len(rates)
+        for rate, npv in zip(rates, npvs):
+            assert abs(npv - calculate_npv(cash_flows, rate, -500_000)) < 1e-6
+
+    def test_npv_batch_decreases_with_rate(self):
+        """Test NPV decreases as the discount rate grows for positive cash flows."""
+        npvs = calculate_npv_batch([100] * 10, [0.02, 0.05, 0.08], initial_investment=-500)
+
+        assert npvs[0] > npvs[1] > npvs[2]
+
 
 class TestCalculateIRR:
     """Tests for IRR calculation."""
@@ -117,6 +150,31 @@ class TestCalculateIRR:
         assert irr is not None
         assert abs(irr - 1.0) < 0.01  # 100% IRR
 
+    def test_irr_long_horizon(self):
+        """Test IRR on an hourly-length cash flow series with known rate."""
+        rate = 0.0001
+        periods = np.arange(1, 87_601)
+        investment = float(np.sum(50.0 / (1 + rate) ** periods))
+        cash_flows = np.concatenate(([-investment], np.full(periods.size, 50.0)))
+
+        irr = calculate_irr(cash_flows, initial_guess=0.0)
+
+        assert irr is not None
+        assert irr == pytest.approx(rate, rel=1e-6)
+
+    def test_irr_bracketed_fallback(self):
+        """Test IRR falls back to a bracketed solve when Newton-Raphson diverges."""
+        # From the default 10% guess Newton overshoots on this hourly series
+        rate = 0.0001
+        periods = np.arange(1, 87_601)
+        investment = float(np.sum(50.0 / (1 + rate) ** periods))
+        cash_flows = np.concatenate(([-investment], np.full(periods.size, 50.0)))
+
+        irr = calculate_irr(cash_flows)
+
+        assert irr is not None
+        assert irr == pytest.approx(rate, rel=1e-6)
+
 
 class TestCalculatePaybackPeriod:
     """Tests for payback period calculation."""
@@ -172,6 +230,17 @@ class TestCalculatePaybackPeriod:
         # Immediate (year 0)
         assert payback == 0.0
 
+    def test_payback_first_crossing(self):
+        """Test payback uses the first crossing when cumulative flow dips again."""
+        # Cumulative: -1000, -400, 200, -800, 400
+        cash_flows = [-1000, 600, 600, -1000, 1200]
+
+        payback = calculate_payback_period(cash_flows)
+
+        # Year 2 needs 400 out of 600
+        assert payback is not None
+        assert abs(payback - (1 + 400 / 600)) < 1e-9
+
 
 class TestAggregateAnnual:
     """Tests for aggregate_annual function."""
@@ -233,6 +302,18 @@ class TestAggregateAnnual:
         assert abs(annual[1] - 613_200.0) < 1.0
         assert abs(annual[2] - 700_800.0) < 1.0
 
+    def test_aggregate_annual_numpy_input(self):
+        """Test aggregating NumPy arrays gives the same result as lists."""
+        import numpy as np
+
+        hourly_power = np.full(8760 * 2, 2.0)
+        hourly_prices = np.repeat([30.0, 40.0], 8760)
+
+        annual = aggregate_annual(hourly_power, hourly_prices, years=2)
+
+        assert annual == aggregate_annual(hourly_power.tolist(), hourly_prices.tolist(), years=2)
+        assert abs(annual[1] - 700_800.0) < 1.0
+
     def test_aggregate_annual_length_validation(self):
         """Test length validation."""
         # Wrong length
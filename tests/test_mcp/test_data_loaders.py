@@ -1,14 +1,23 @@
 """Tests for data_loaders — price/profile resolution from shorthand."""
 
+import csv
 import json
 import os
-from unittest.mock import MagicMock, patch
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from site_calc_investment.mcp.data_loaders import (
+    _SNIFF_SAMPLE_BYTES,
+    _CsvMetadataCollector,
+    _find_first_numeric_column,
     _get_csv_metadata,
+    _load_csv_column_numpy,
+    _read_csv_sample,
     fetch_url_to_file,
+    fetch_urls_to_files,
     resolve_price_or_profile,
     save_csv,
 )
@@ -31,6 +40,13 @@ class TestScalarExpansion:
         with pytest.raises(ValueError, match="timespan"):
             resolve_price_or_profile(50.0, expected_length=None)
 
+    def test_scalar_expansion_is_float64_array(self) -> None:
+        result = resolve_price_or_profile(42, expected_length=525_600)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float64
+        assert result.shape == (525_600,)
+        assert result[0] == result[-1] == 42.0
+
     def test_zero_expansion(self) -> None:
         result = resolve_price_or_profile(0.0, expected_length=24)
         assert len(result) == 24
@@ -43,7 +59,7 @@ class TestListValues:
     def test_list_passthrough(self) -> None:
         values = [30.0, 40.0, 80.0, 50.0]
         result = resolve_price_or_profile(values, expected_length=4)
-        assert result == values
+        assert result.tolist() == values
 
     def test_list_wrong_length_raises(self) -> None:
         with pytest.raises(ValueError, match="does not match"):
@@ -51,12 +67,24 @@ class TestListValues:
 
     def test_list_no_length_validation(self) -> None:
         result = resolve_price_or_profile([1.0, 2.0], expected_length=None)
-        assert result == [1.0, 2.0]
+        assert result.tolist() == [1.0, 2.0]
 
     def test_list_converts_ints(self) -> None:
         result = resolve_price_or_profile([1, 2, 3], expected_length=3)
-        assert result == [1.0, 2.0, 3.0]
-        assert all(isinstance(v, float) for v in result)
+        assert result.tolist() == [1.0, 2.0, 3.0]
+        assert result.dtype == np.float64
+
+    def test_list_non_numeric_raises(self) -> None:
+        with pytest.raises(ValueError, match="List contains non-numeric values"):
+            resolve_price_or_profile([1.0, "high", 3.0], expected_length=3)
+
+    def test_list_null_raises(self) -> None:
+        with pytest.raises(ValueError, match="non-numeric values: null"):
+            resolve_price_or_profile([1.0, None, 3.0], expected_length=3)  # type: ignore[list-item]
+
+    def test_list_nested_raises(self) -> None:
+        with pytest.raises(ValueError, match="flat array"):
+            resolve_price_or_profile([[1.0, 2.0], [3.0, 4.0]], expected_length=None)  # type: ignore[list-item]
 
 
 class TestCsvLoading:
@@ -83,9 +111,117 @@ class TestCsvLoading:
         with pytest.raises(ValueError, match="8760 values, but expected 100"):
             resolve_price_or_profile({"file": tmp_csv}, expected_length=100)
 
-    def test_file_not_found_raises(self) -> None:
-        with pytest.raises(FileNotFoundError, match="not found"):
-            resolve_price_or_profile({"file": "/nonexistent/path.csv"}, expected_length=100)
+    @pytest.mark.parametrize("name", ["path.csv", "path.json", "path.xlsx"])
+    def test_file_not_found_raises(self, name: str) -> None:
+        with pytest.raises(FileNotFoundError, match="Data file not found"):
+            resolve_price_or_profile({"file": f"/nonexistent/{name}"}, expected_length=100)
+
+    def test_load_csv_single_column_with_header(self, tmp_path: object) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "single.csv"
+        path.write_text("price\n10.0\n20.0\n30.0\n")
+        result = resolve_price_or_profile({"file": str(path)}, expected_length=3)
+        assert result.tolist() == [10.0, 20.0, 30.0]
+
+    def test_load_csv_blank_cells_fall_back_to_stdlib(self, tmp_path: object) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "blank_rows.csv"
+        path.write_text("10.0,0\n,\n20.0,1\n")
+        assert _load_csv_column_numpy(str(path), csv.excel, False, 0) is None
+        result = resolve_price_or_profile({"file": str(path)}, expected_length=2)
+        assert result.tolist() == [10.0, 20.0]
+
+    def test_load_csv_arrow_matches_stdlib(self, tmp_csv: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("pyarrow")
+        expected = resolve_price_or_profile({"file": tmp_csv}, expected_length=8760)
+        monkeypatch.setattr("site_calc_investment.mcp.data_loaders._ARROW_MIN_BYTES", 0)
+        assert resolve_price_or_profile({"file": tmp_csv}, expected_length=8760) == expected
+
+    def test_load_csv_without_arrow_falls_back(self, tmp_csv: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("site_calc_investment.mcp.data_loaders._ARROW_MIN_BYTES", 0)
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        result = resolve_price_or_profile({"file": tmp_csv}, expected_length=8760)
+        assert result[:12].tolist() == [25.0] * 9 + [40.0] * 3
+
+    def test_load_csv_arrow_bad_value_reports_row(self, tmp_path: object, monkeypatch: pytest.MonkeyPatch) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "bad.csv"
+        path.write_text("hour,price\n0,10.0\n1,oops\n")
+        monkeypatch.setattr("site_calc_investment.mcp.data_loaders._ARROW_MIN_BYTES", 0)
+        with pytest.raises(ValueError, match="Non-numeric value 'oops' at row 3"):
+            resolve_price_or_profile({"file": str(path)}, expected_length=None)
+
+    def test_load_csv_short_row_reports_row(self, tmp_path: object) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "ragged.csv"
+        path.write_text("hour,price\n0,10.0\n1\n2,12.0\n")
+        with pytest.raises(ValueError, match="Row 3 .* has only 1 columns"):
+            resolve_price_or_profile({"file": str(path), "column": "price"}, expected_length=None)
+
+    def test_load_single_column_decimals_without_header(self, tmp_path: object) -> None:
+        """Decimal points and digits are never taken as the delimiter."""
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "single.txt"
+        path.write_text("1.25\n2.5\n3.75\n10.5\n")
+        assert resolve_price_or_profile({"file": str(path)}, expected_length=4).tolist() == [1.25, 2.5, 3.75, 10.5]
+
+    def test_load_semicolon_csv_extension(self, tmp_path: object) -> None:
+        """A .csv file with ';' separators is still sniffed, not read as commas."""
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "semicolon.csv"
+        path.write_text("date;price_eur\n2026-01-01;30.5\n2026-01-02;42.1\n")
+        assert resolve_price_or_profile({"file": str(path), "column": "price_eur"}, expected_length=2).tolist() == [
+            30.5,
+            42.1,
+        ]
+
+    def test_load_tsv_extension(self, tmp_path: object) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "prices.tsv"
+        path.write_text("hour\tprice\n0\t10.5\n1\t11.5\n")
+        assert resolve_price_or_profile({"file": str(path)}, expected_length=2).tolist() == [10.5, 11.5]
+
+    def test_csv_extension_skips_dialect_sniffing(self, tmp_csv: str) -> None:
+        with patch("csv.Sniffer.sniff", side_effect=AssertionError("sniffed")):
+            result = resolve_price_or_profile({"file": tmp_csv}, expected_length=8760)
+        assert len(result) == 8760
+
+    def test_sample_cut_inside_multibyte_character(self, tmp_path: object) -> None:
+        """A character split by the sample boundary is dropped, not an error."""
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "wide.csv"
+        head = "a" * (_SNIFF_SAMPLE_BYTES - 1)
+        path.write_text(head + "\u20ac\n", encoding="utf-8")
+        assert _read_csv_sample(str(path)) == head
+
+    @pytest.mark.parametrize("data", [b"price\n\xff30.5\n", b"price\n30.5 \xe2\x82"])
+    def test_sample_invalid_utf8_raises(self, tmp_path: object, data: bytes) -> None:
+        """Invalid bytes, including a truncated character at end of file, are reported."""
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "latin1.csv"
+        path.write_bytes(data)
+        with pytest.raises(UnicodeDecodeError):
+            _read_csv_sample(str(path))
+
+    @pytest.mark.parametrize(
+        "header",
+        ["price_eur", "Price (EUR/MWh)", "spotPrice", "demand-MW", "prices", "value2"],
+    )
+    def test_numeric_hint_matches_header_words(self, header: str) -> None:
+        assert _find_first_numeric_column(["timestamp", header]) == 1
+
+    @pytest.mark.parametrize("header", ["empower", "europe", "hour"])
+    def test_numeric_hint_ignores_partial_words(self, header: str) -> None:
+        assert _find_first_numeric_column(["timestamp", header]) == 0
 
 
 class TestJsonLoading:
@@ -95,6 +231,55 @@ class TestJsonLoading:
         result = resolve_price_or_profile({"file": tmp_json}, expected_length=8760)
         assert len(result) == 8760
 
+    def test_load_json_returns_array(self, tmp_json: str) -> None:
+        result = resolve_price_or_profile({"file": tmp_json}, expected_length=8760)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float64
+
+    def test_load_json_quoted_numbers(self, tmp_path: object) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "quoted.json"
+        path.write_text(' [ "1.5", 2, 3e1 ]\n')
+        result = resolve_price_or_profile({"file": str(path)}, expected_length=3)
+        assert result.tolist() == [1.5, 2.0, 30.0]
+
+    def test_load_json_null_raises(self, tmp_path: object) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "nulls.json"
+        path.write_text("[1.0, null, 3.0]")
+        with pytest.raises(ValueError, match="non-numeric"):
+            resolve_price_or_profile({"file": str(path)}, expected_length=None)
+
+    def test_load_json_nested_raises(self, tmp_path: object) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "nested.json"
+        path.write_text("[[1.0, 2.0], [3.0, 4.0]]")
+        with pytest.raises(ValueError, match="flat array"):
+            resolve_price_or_profile({"file": str(path)}, expected_length=None)
+
+    def test_load_json_invalid_raises(self, tmp_path: object) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "broken.json"
+        path.write_text("[1.0, 2.0,")
+        with pytest.raises(ValueError):
+            resolve_price_or_profile({"file": str(path)}, expected_length=None)
+
+    @pytest.mark.parametrize(
+        "text",
+        ["[1, 2, null, 4]", '[1, 2, "abc"]', "[1, 2, 3,]", "[1 2 3]", "[1, 2, 3] 4"],
+    )
+    def test_load_json_rejects_malformed_arrays(self, tmp_path: object, text: str) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "malformed.json"
+        path.write_text(text)
+        with pytest.raises(ValueError):
+            resolve_price_or_profile({"file": str(path)}, expected_length=None)
+
     def test_load_json_wrong_format(self, tmp_path: object) -> None:
         import pathlib
 
@@ -137,7 +322,7 @@ class TestSaveCsv:
         saved = save_csv(str(out), columns={"price_eur": prices})
         assert os.path.isfile(saved)
         result = resolve_price_or_profile({"file": saved, "column": "price_eur"}, expected_length=4)
-        assert result == prices
+        assert result.tolist() == prices
 
     def test_save_appends_csv_extension(self, tmp_path: object) -> None:
         """If no extension, .csv is appended."""
@@ -189,6 +374,16 @@ class TestSaveCsv:
         with pytest.raises(FileExistsError):
             save_csv(str(out), columns={"v": [2.0]}, overwrite=False)
 
+    def test_save_no_overwrite_keeps_existing_content(self, tmp_path: object) -> None:
+        """A refused save leaves the existing file untouched."""
+        import pathlib
+
+        out = pathlib.Path(str(tmp_path)) / "keep.csv"
+        out.write_text("v\n1.0\n")
+        with pytest.raises(FileExistsError, match="already exists"):
+            save_csv(str(out), columns={"v": [2.0]})
+        assert out.read_text() == "v\n1.0\n"
+
     def test_save_overwrite_replaces_file(self, tmp_path: object) -> None:
         """overwrite=True replaces existing file."""
         import pathlib
@@ -197,7 +392,41 @@ class TestSaveCsv:
         save_csv(str(out), columns={"v": [1.0]})
         save_csv(str(out), columns={"v": [99.0]}, overwrite=True)
         result = resolve_price_or_profile({"file": str(out), "column": "v"}, expected_length=1)
-        assert result == [99.0]
+        assert result.tolist() == [99.0]
+
+    def test_save_multiple_columns_row_order(self, tmp_path: object) -> None:
+        """Columns are transposed into rows in column order."""
+        import pathlib
+
+        out = pathlib.Path(str(tmp_path)) / "multi.csv"
+        saved = save_csv(str(out), columns={"a": [1.0, 2.0], "b": [3.0, 4.0], "c": [5.0, 6.0]})
+        with open(saved, encoding="utf-8") as f:
+            assert f.read().splitlines() == ["a,b,c", "1.0,3.0,5.0", "2.0,4.0,6.0"]
+
+    def test_save_large_table_text(self, tmp_path: object) -> None:
+        """Values are written as their shortest round-trip text, whatever the row count."""
+        import pathlib
+
+        out = pathlib.Path(str(tmp_path)) / "exact.csv"
+        a = [i / 3 for i in range(5000)]
+        b = [0.1 * i - 1e-9 for i in range(5000)]
+        saved = save_csv(str(out), columns={"a": a, "b_mw": b})
+        with open(saved, encoding="utf-8", newline="") as f:
+            lines = f.read().split("\r\n")
+        assert lines[0] == "a,b_mw"
+        assert lines[1:3] == ["0.0,-1e-09", "0.3333333333333333,0.099999999"]
+        assert lines[1:-1] == [f"{x!r},{y!r}" for x, y in zip(a, b)]
+        assert resolve_price_or_profile({"file": saved, "column": "b_mw"}, expected_length=5000).tolist() == b
+
+    def test_save_large_table_keeps_values_as_given(self, tmp_path: object) -> None:
+        """Strings and bools in large tables are written as-is, not coerced to floats."""
+        import pathlib
+
+        out = pathlib.Path(str(tmp_path)) / "labels.csv"
+        columns = {"label": ["x, y"] * 2000, "v": ["1.5"] * 2000, "on": [True] * 2000}
+        saved = save_csv(str(out), columns=columns)  # type: ignore[arg-type]
+        with open(saved, encoding="utf-8") as f:
+            assert f.read().splitlines()[1] == '"x, y",1.5,True'
 
     def test_save_creates_parent_directories(self, tmp_path: object) -> None:
         """Nested parent directories are created automatically."""
@@ -257,6 +486,37 @@ class TestGetCsvMetadata:
         assert "volume" in metadata["numeric_columns"]
         assert "date" not in metadata["numeric_columns"]
 
+    def test_metadata_refreshes_when_file_changes(self, tmp_path: object) -> None:
+        import pathlib
+
+        path = pathlib.Path(str(tmp_path)) / "changing.csv"
+        path.write_text("hour,price\n0,1.0\n1,2.0\n")
+        first = _get_csv_metadata(str(path))
+        first["columns"].append("mutated")
+        assert _get_csv_metadata(str(path))["columns"] == ["hour", "price"]
+
+        path.write_text("hour,price\n0,1.0\n1,2.0\n2,3.0\n")
+        assert _get_csv_metadata(str(path))["rows"] == 3
+
+
+class TestCsvMetadataCollector:
+    """Tests for collecting CSV metadata while downloading."""
+
+    def test_collector_matches_file_scan(self, tmp_csv: str) -> None:
+        with open(tmp_csv, "rb") as f:
+            content = f.read()
+        assert len(content) > 64 * 1024
+
+        collector = _CsvMetadataCollector()
+        for start in range(0, len(content), 10_000):
+            collector.feed(content[start : start + 10_000])
+        assert collector.result() == _get_csv_metadata(tmp_csv)
+
+    def test_collector_defers_quoted_files(self) -> None:
+        collector = _CsvMetadataCollector()
+        collector.feed(b'name,price\n"a, b",1.0\n')
+        assert collector.result() is None
+
 
 def _make_mock_response(content: bytes, status_code: int = 200) -> MagicMock:
     """Create a mock httpx streaming response."""
@@ -383,3 +643,100 @@ class TestFetchUrl:
 
         with pytest.raises(ValueError, match="must not be empty"):
             fetch_url_to_file(url="", data_dir=str(data_dir))
+
+
+def _make_async_mock_response(content: bytes) -> MagicMock:
+    """Create a mock httpx.AsyncClient streaming response."""
+
+    async def aiter_bytes(chunk_size: int = 0):  # type: ignore[no-untyped-def]
+        yield content
+
+    mock_response = MagicMock()
+    mock_response.raise_for_status = MagicMock()
+    mock_response.aiter_bytes = aiter_bytes
+    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_response.__aexit__ = AsyncMock(return_value=False)
+    return mock_response
+
+
+class TestFetchUrls:
+    """Tests for fetch_urls_to_files -- concurrent downloads."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_several_urls_in_order(self, tmp_path: object) -> None:
+        """Each URL is saved to its own file and results keep input order."""
+        import pathlib
+
+        data_dir = pathlib.Path(str(tmp_path)) / "data"
+        bodies = {
+            "https://example.com/prices.csv": b"hour,price\n0,30.5\n1,42.1\n",
+            "https://example.com/demand.csv": b"hour,demand_mw\n0,1.0\n1,2.0\n2,3.0\n",
+        }
+
+        with patch("httpx.AsyncClient.stream", side_effect=lambda method, url: _make_async_mock_response(bodies[url])):
+            results = await fetch_urls_to_files(list(bodies), data_dir=str(data_dir))
+
+        assert [r["url"] for r in results] == list(bodies)
+        assert [r["rows"] for r in results] == [2, 3]
+        assert results[1]["file_path"].endswith("demand.csv")
+        with open(results[0]["file_path"], "rb") as f:
+            assert f.read() == bodies["https://example.com/prices.csv"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_duplicate_targets_raise_before_download(self, tmp_path: object) -> None:
+        """URLs resolving to the same file are rejected without any request."""
+        urls = ["https://a.example.com/data.csv", "https://b.example.com/data.csv"]
+
+        with patch("httpx.AsyncClient.stream") as mock_stream:
+            with pytest.raises(ValueError, match="distinct file_paths"):
+                await fetch_urls_to_files(urls, data_dir=str(tmp_path))
+        mock_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_file_paths_length_mismatch_raises(self, tmp_path: object) -> None:
+        """file_paths must match urls one-to-one."""
+        with pytest.raises(ValueError, match="one entry per URL"):
+            await fetch_urls_to_files(["https://example.com/a.csv"], data_dir=str(tmp_path), file_paths=[])
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_cancels_others_and_removes_files(self, tmp_path: object) -> None:
+        """One failed download cancels the rest and leaves no files behind."""
+        import asyncio
+        import pathlib
+
+        import httpx
+
+        data_dir = pathlib.Path(str(tmp_path))
+        slow_started = asyncio.Event()
+        slow_cancelled = []
+
+        async def slow_bytes(chunk_size: int = 0):  # type: ignore[no-untyped-def]
+            yield b"hour,price\n0,30.5\n"
+            slow_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                slow_cancelled.append(True)
+                raise
+            yield b"1,42.1\n"
+
+        slow = _make_async_mock_response(b"")
+        slow.aiter_bytes = slow_bytes
+
+        async def enter_missing():  # type: ignore[no-untyped-def]
+            await slow_started.wait()
+            return missing
+
+        missing = _make_async_mock_response(b"")
+        missing.__aenter__ = AsyncMock(side_effect=enter_missing)
+        missing.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Not Found", request=MagicMock(), response=MagicMock(status_code=404)
+        )
+        responses = {"https://example.com/slow.csv": slow, "https://example.com/missing.csv": missing}
+
+        with patch("httpx.AsyncClient.stream", side_effect=lambda method, url: responses[url]):
+            with pytest.raises(RuntimeError, match="HTTP error 404"):
+                await fetch_urls_to_files(list(responses), data_dir=str(data_dir))
+
+        assert slow_cancelled == [True]
+        assert list(data_dir.iterdir()) == []
@@ -50,7 +50,7 @@ async def client():
 
 @pytest.mark.asyncio
 async def test_list_tools(client: Client) -> None:
-    """All 17 tools are registered and discoverable via MCP protocol."""
+    """All 19 tools are registered and discoverable via MCP protocol."""
     tools = await client.list_tools()
     tool_names = {t.name for t in tools}
     expected = {
@@ -69,8 +69,10 @@ async def test_list_tools(client: Client) -> None:
         "cancel_job",
         "list_jobs",
         "get_device_schema",
+        "batch_tool_calls",
         "save_data_file",
         "fetch_url",
+        "fetch_urls",
     }
     assert tool_names == expected, f"Missing tools: {expected - tool_names}, Extra: {tool_names - expected}"
 
@@ -95,6 +97,24 @@ async def test_get_device_schema_via_mcp(client: Client) -> None:
     assert schema["properties"]["capacity"]["required"] is True
 
 
+@pytest.mark.asyncio
+async def test_batch_tool_calls_via_mcp(client: Client) -> None:
+    """batch_tool_calls returns one entry per operation via MCP protocol."""
+    result = await client.call_tool(
+        "batch_tool_calls",
+        {
+            "operations": [
+                {"tool": "get_device_schema", "arguments": {"device_type": "battery"}},
+                {"tool": "create_scenario", "arguments": {"name": "Not allowed"}},
+            ]
+        },
+    )
+    entries = _parse_result(result)
+    assert [e["ok"] for e in entries] == [True, False]
+    assert entries[0]["result"]["device_type"] == "battery"
+    assert mcp_server._store.list() == []
+
+
 @pytest.mark.asyncio
 async def test_full_scenario_assembly_via_mcp(client: Client) -> None:
     """Full scenario assembly workflow via MCP protocol (no submission -- no API needed)."""
@@ -241,6 +261,23 @@ async def test_save_data_file_via_mcp(client: Client, tmp_path: object) -> None:
     assert pathlib.Path(data["file_path"]).exists()
 
 
+@pytest.mark.asyncio
+async def test_fetch_urls_via_mcp(client: Client) -> None:
+    """fetch_urls passes the URL list through and returns one result per URL."""
+    from unittest.mock import AsyncMock, patch
+
+    urls = ["https://example.com/2025.csv", "https://example.com/2026.csv"]
+    downloaded = [{"file_path": f"/data/{year}.csv", "url": url, "rows": 8760} for year, url in zip((2025, 2026), urls)]
+    with (
+        patch("site_calc_investment.mcp.server.get_data_dir", return_value="/data"),
+        patch("site_calc_investment.mcp.server.fetch_urls_to_files", AsyncMock(return_value=downloaded)) as fetch,
+    ):
+        result = await client.call_tool("fetch_urls", {"urls": urls, "file_paths": [None, "prices_2026.csv"]})
+
+    fetch.assert_awaited_once_with(urls=urls, data_dir="/data", file_paths=[None, "prices_2026.csv"], overwrite=False)
+    assert _parse_result(result) == downloaded
+
+
 @pytest.mark.asyncio
 async def test_error_handling_via_mcp(client: Client) -> None:
     """Errors are propagated correctly through MCP protocol."""
@@ -1,8 +1,11 @@
 """Tests for ScenarioStore — in-memory draft scenario management."""
 
+from unittest.mock import Mock, patch
+
+import numpy as np
 import pytest
 
-from site_calc_investment.mcp.scenario import ScenarioStore
+from site_calc_investment.mcp.scenario import ScenarioInfo, ScenarioStore
 
 
 class TestScenarioCreate:
@@ -19,6 +22,12 @@ class TestScenarioCreate:
         assert scenario.name == "Test"
         assert scenario.description == "A test scenario"
 
+    def test_scenario_containers_use_slots(self, store: ScenarioStore) -> None:
+        scenario = store.get(store.create(name="Slots"))
+        assert not hasattr(scenario, "__dict__")
+        with pytest.raises(AttributeError):
+            scenario.extra = 1  # type: ignore[attr-defined]
+
     def test_create_multiple_unique_ids(self, store: ScenarioStore) -> None:
         ids = {store.create(name=f"S{i}") for i in range(10)}
         assert len(ids) == 10
@@ -71,7 +80,7 @@ class TestScenarioAddDevice:
         assert len(scenario.devices) == 1
 
     def test_add_device_invalid_type(self, store: ScenarioStore, scenario_id: str) -> None:
-        with pytest.raises(ValueError, match="Unknown device type"):
+        with pytest.raises(ValueError, match="Unknown device type .*Valid types: battery, chp, electricity_demand"):
             store.add_device(
                 scenario_id=scenario_id,
                 device_type="nuclear_reactor",
@@ -112,6 +121,7 @@ class TestScenarioAddDevice:
         )
         scenario = store.get(scenario_id)
         assert scenario.devices[0].device_type == "battery"
+        assert store.build_request(scenario_id).sites[0].devices[0].type == "battery"
 
     def test_add_device_with_schedule(self, store: ScenarioStore, scenario_id: str) -> None:
         store.add_device(
@@ -166,6 +176,15 @@ class TestScenarioRemoveDevice:
         scenario = store.get(scenario_id)
         assert len(scenario.devices) == 0
 
+    def test_remove_then_readd_same_name(self, store: ScenarioStore, scenario_id: str) -> None:
+        props = {"capacity": 10.0, "max_power": 5.0, "efficiency": 0.9}
+        for name in ("Bat1", "Bat2", "Bat3"):
+            store.add_device(scenario_id=scenario_id, device_type="battery", name=name, properties=props)
+        store.remove_device(scenario_id, "Bat2")
+        store.add_device(scenario_id=scenario_id, device_type="battery", name="Bat2", properties=props)
+        scenario = store.get(scenario_id)
+        assert [d.name for d in scenario.devices] == ["Bat1", "Bat3", "Bat2"]
+
     def test_remove_nonexistent_device(self, store: ScenarioStore, scenario_id: str) -> None:
         with pytest.raises(KeyError, match="not found"):
             store.remove_device(scenario_id, "NoSuchDevice")
@@ -225,6 +244,13 @@ class TestScenarioTimespan:
         assert scenario.timespan is not None
         assert scenario.timespan.intervals is None
 
+    def test_effective_intervals(self, store: ScenarioStore) -> None:
+        sid = store.create(name="Test")
+        store.set_timespan(sid, start_year=2025, years=3)
+        assert store.get(sid).timespan.effective_intervals == 3 * 8760  # type: ignore[union-attr]
+        store.set_timespan(sid, start_year=2025, years=3, intervals=500)
+        assert store.get(sid).timespan.effective_intervals == 500  # type: ignore[union-attr]
+
 
 class TestScenarioInvestmentParams:
     """Tests for setting investment parameters."""
@@ -246,6 +272,15 @@ class TestScenarioInvestmentParams:
         assert "500,000" in result
         assert "10,000" in result
 
+    def test_cost_totals_are_exact(self, store: ScenarioStore, scenario_id: str) -> None:
+        result = store.set_investment_params(
+            scenario_id,
+            device_capital_costs={"B1": 1e16, "B2": 1.0, "B3": 1.0},
+            device_annual_opex={f"D{i}": 0.1 for i in range(10)},
+        )
+        assert "CAPEX total=10,000,000,000,000,002 EUR" in result
+        assert "annual OPEX total=1 EUR" in result
+
 
 class TestScenarioReview:
     """Tests for reviewing scenarios."""
@@ -269,6 +304,36 @@ class TestScenarioReview:
         assert len(review["devices"]) == 1
         assert review["devices"][0]["name"] == "B1"
 
+    def test_review_reuses_device_summary(self, store: ScenarioStore, scenario_id: str) -> None:
+        store.add_device(
+            scenario_id=scenario_id,
+            device_type="electricity_demand",
+            name="Load",
+            properties={"max_demand_profile": [2.0] * 8760},
+        )
+        first = store.review(scenario_id)
+        summarizers = "site_calc_investment.mcp.scenario._DEVICE_SUMMARIZERS"
+        with patch.dict(summarizers, {"electricity_demand": Mock(side_effect=AssertionError("recomputed"))}):
+            second = store.review(scenario_id)
+        assert second["devices"] == first["devices"]
+        assert first["devices"][0]["summary"] == "avg 2.0 MW, 8760 intervals"
+
+    def test_review_summarizes_numpy_profiles(self, store: ScenarioStore, scenario_id: str) -> None:
+        store.add_device(
+            scenario_id=scenario_id,
+            device_type="electricity_demand",
+            name="Load",
+            properties={"max_demand_profile": np.full(8760, 2.0)},
+        )
+        store.add_device(
+            scenario_id=scenario_id,
+            device_type="electricity_import",
+            name="Grid",
+            properties={"price": np.linspace(20.0, 40.0, 8760), "max_import": 5.0},
+        )
+        summaries = [d["summary"] for d in store.review(scenario_id)["devices"]]
+        assert summaries == ["avg 2.0 MW, 8760 intervals", "max 5.0 MW, avg 30.0 EUR/MWh (8760 pts)"]
+
     def test_review_no_timespan(self, store: ScenarioStore) -> None:
         sid = store.create(name="No TS")
         store.add_device(
@@ -327,6 +392,41 @@ class TestScenarioBuildRequest:
         assert len(request.sites[0].devices) == 2
         assert request.timespan.intervals == 8760
 
+    @pytest.mark.parametrize(
+        ("device_type", "properties"),
+        [
+            ("battery", {"capacity": 10.0, "max_power": 5.0, "efficiency": 1.5}),
+            ("electricity_demand", {"max_demand_profile": -1.0}),
+        ],
+    )
+    def test_build_request_validates_device_properties(
+        self, store: ScenarioStore, scenario_id: str, device_type: str, properties: dict[str, float]
+    ) -> None:
+        """Draft properties are unchecked until build_request validates them."""
+        store.add_device(scenario_id=scenario_id, device_type=device_type, name="D1", properties=properties)
+        with pytest.raises(ValueError):
+            store.build_request(scenario_id)
+
+    def test_build_request_leaves_draft_properties_unchanged(self, store: ScenarioStore, scenario_id: str) -> None:
+        drafts = {
+            "photovoltaic": {
+                "peak_power_mw": 5.0,
+                "location": {"latitude": 50.0, "longitude": 14.0},
+                "tilt": 35,
+                "azimuth": 180,
+            },
+            "electricity_demand": {"max_demand_profile": 2.0, "min_demand_profile": [1.0] * 8760},
+            "electricity_import": {"price": 50.0, "max_import": 10.0},
+            "battery": {"capacity": 10.0, "max_power": 5.0, "efficiency": 0.9},
+        }
+        for device_type, properties in drafts.items():
+            store.add_device(scenario_id=scenario_id, device_type=device_type, name=device_type, properties=properties)
+        snapshot = {name: dict(properties) for name, properties in drafts.items()}
+
+        store.build_request(scenario_id)
+
+        assert drafts == snapshot
+
     def test_build_request_no_devices_raises(self, store: ScenarioStore) -> None:
         sid = store.create(name="Empty")
         store.set_timespan(sid, start_year=2025)
@@ -463,6 +563,18 @@ class TestScenarioBuildRequest:
         assert device.schedule is not None
         assert device.schedule.max_hours_per_day == 12
 
+    def test_build_request_rejects_invalid_schedule(self, store: ScenarioStore, scenario_id: str) -> None:
+        store.add_device(
+            scenario_id=scenario_id,
+            device_type="battery",
+            name="B1",
+            properties={"capacity": 10.0, "max_power": 5.0, "efficiency": 0.9},
+            schedule={"can_run": [1] * 10},
+        )
+        store.set_timespan(scenario_id, start_year=2025, years=1)
+        with pytest.raises(ValueError, match="can_run"):
+            store.build_request(scenario_id)
+
 
 class TestScenarioDelete:
     """Tests for deleting scenarios."""
@@ -501,9 +613,9 @@ class TestScenarioList:
             name="B1",
             properties={"capacity": 10.0, "max_power": 5.0, "efficiency": 0.9},
         )
+        store.record_job(sid, "job_1")
         result = store.list()
-        assert result[0].device_count == 1
-        assert result[0].has_timespan is True
+        assert result == [ScenarioInfo(id=sid, name="WithDevices", device_count=1, has_timespan=True, job_count=1)]
 
 
 class TestScenarioRecordJob:
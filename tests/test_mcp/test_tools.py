@@ -1,12 +1,13 @@
 """Tests for MCP tool integration — end-to-end tool calls with mocked client."""
 
 import os
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from site_calc_investment.mcp import server as mcp_server
-from site_calc_investment.mcp.scenario import ScenarioStore
+from site_calc_investment.mcp.scenario import VALID_DEVICE_TYPES, ScenarioStore
 from site_calc_investment.models.responses import Job
 
 
@@ -254,6 +255,31 @@ class TestGetJobResult:
         assert "device_summaries" in result
         assert "Battery1" in result["device_summaries"]
 
+    def test_get_result_monthly_totals(self, mock_result_response: dict) -> None:
+        from site_calc_investment.models.responses import InvestmentPlanningResponse
+
+        schedule = mock_result_response["result"]["sites"]["site_sc_test"]["device_schedules"]["Battery1"]
+        schedule["flows"] = {"electricity": [0.5] * 1000, "heat": [0.25] * 1000}
+        schedule["soc"] = [0.2, 0.4] * 500
+        mock_client = MagicMock()
+        mock_client.get_job_result.return_value = InvestmentPlanningResponse(
+            job_id=mock_result_response["job_id"],
+            status=mock_result_response["status"],
+            **mock_result_response["result"],
+        )
+        mcp_server._client = mock_client
+
+        result = mcp_server.get_job_result(job_id="test_job_mcp_123", detail_level="monthly")
+        assert result["device_summaries"]["Battery1"] == {
+            "total_electricity_mwh": 500.0,
+            "total_heat_mwh": 250.0,
+            "avg_soc": 0.3,
+            "monthly": [
+                {"month": 1, "total_electricity_mwh": 365.0, "total_heat_mwh": 182.5},
+                {"month": 2, "total_electricity_mwh": 135.0, "total_heat_mwh": 67.5},
+            ],
+        }
+
     def test_get_result_invalid_detail_level(self) -> None:
         with pytest.raises(ValueError, match="Invalid detail_level"):
             mcp_server.get_job_result(job_id="job_123", detail_level="detailed")
@@ -274,6 +300,26 @@ class TestGetJobResult:
         assert "sites" in result
         assert "device_summaries" in result
 
+    def test_get_result_full_shares_schedule_lists(self, mock_result_response: dict) -> None:
+        from site_calc_investment.models.responses import InvestmentPlanningResponse
+
+        response = InvestmentPlanningResponse(
+            job_id=mock_result_response["job_id"],
+            status=mock_result_response["status"],
+            **mock_result_response["result"],
+        )
+        mock_client = MagicMock()
+        mock_client.get_job_result.return_value = response
+        mcp_server._client = mock_client
+
+        result = mcp_server.get_job_result(job_id="test_job_mcp_123", detail_level="full")
+
+        # Hourly arrays are passed through by reference, never copied before serialization
+        schedule = response.sites["site_sc_test"].device_schedules["Battery1"]
+        device = result["sites"]["site_sc_test"]["device_schedules"]["Battery1"]
+        assert device["flows"] is schedule.flows
+        assert device["soc"] is schedule.soc
+
 
 class TestCancelJob:
     """Tests for cancel_job tool."""
@@ -350,6 +396,12 @@ class TestGetDeviceSchema:
         schema = mcp_server.get_device_schema("Battery")
         assert "properties" in schema
 
+    def test_schema_built_once(self) -> None:
+        assert mcp_server.get_device_schema("chp") is mcp_server.get_device_schema("CHP")
+
+    def test_schemas_cover_valid_device_types(self) -> None:
+        assert mcp_server.get_device_schema("fusion_reactor")["valid_types"] == sorted(VALID_DEVICE_TYPES)
+
 
 class TestEndToEndWorkflow:
     """End-to-end integration tests for the full workflow."""
@@ -489,6 +541,82 @@ class TestSaveDataFile:
         assert len(review["devices"]) == 1
 
 
+class TestBatchToolCalls:
+    """Tests for batch_tool_calls tool."""
+
+    def test_runs_operations_in_order(self) -> None:
+        mock_client = MagicMock()
+        mock_client.get_job_status.side_effect = lambda job_id: Job(job_id=job_id, status="running")
+        mcp_server._client = mock_client
+        sid = mcp_server.create_scenario(name="Batch")["scenario_id"]
+
+        results = mcp_server.batch_tool_calls(
+            operations=[
+                {"tool": "get_job_status", "arguments": {"job_id": "job_1"}},
+                {"tool": "get_job_status", "arguments": {"job_id": "job_2"}},
+                {"tool": "review_scenario", "arguments": {"scenario_id": sid}},
+                {"tool": "list_scenarios"},
+            ]
+        )
+
+        assert [r["index"] for r in results] == [0, 1, 2, 3]
+        assert all(r["ok"] for r in results)
+        assert results[0]["result"] == {"job_id": "job_1", "status": "running"}
+        assert results[1]["result"]["job_id"] == "job_2"
+        assert results[2]["result"]["name"] == "Batch"
+        assert results[3]["result"][0]["id"] == sid
+
+    def test_api_lookups_run_concurrently(self) -> None:
+        # Each status call waits for the other two; run one after another they would time out
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get_job_status(job_id: str) -> Job:
+            barrier.wait()
+            return Job(job_id=job_id, status="completed")
+
+        mock_client = MagicMock()
+        mock_client.get_job_status.side_effect = get_job_status
+        mcp_server._client = mock_client
+
+        results = mcp_server.batch_tool_calls(
+            operations=[{"tool": "get_job_status", "arguments": {"job_id": f"job_{i}"}} for i in range(3)]
+        )
+
+        assert [r["result"]["job_id"] for r in results] == ["job_0", "job_1", "job_2"]
+
+    def test_failures_reported_per_operation(self) -> None:
+        results = mcp_server.batch_tool_calls(
+            operations=[
+                {"tool": "review_scenario", "arguments": {"scenario_id": "sc_missing"}},
+                {"tool": "get_device_schema", "arguments": {"device_type": "battery"}},
+            ]
+        )
+
+        assert results[0]["ok"] is False
+        assert results[0]["error"].startswith("KeyError:")
+        assert "sc_missing" in results[0]["error"]
+        assert results[1]["ok"] is True
+        assert results[1]["result"]["device_type"] == "battery"
+
+    def test_rejects_state_changing_tools(self) -> None:
+        sid = mcp_server.create_scenario(name="Keep")["scenario_id"]
+
+        results = mcp_server.batch_tool_calls(
+            operations=[{"tool": "delete_scenario", "arguments": {"scenario_id": sid}}, {"arguments": {}}]
+        )
+
+        assert results[0]["tool"] == "delete_scenario"
+        assert results[0]["ok"] is False
+        assert "result" not in results[0]
+        assert "cannot be batched" in results[0]["error"]
+        assert results[1]["ok"] is False
+        assert mcp_server._store.get(sid).name == "Keep"
+
+    def test_too_many_operations(self) -> None:
+        with pytest.raises(ValueError, match="Too many operations"):
+            mcp_server.batch_tool_calls(operations=[{"tool": "get_version"}] * 17)
+
+
 class TestGetVersion:
     """Tests for get_version tool."""
 
@@ -538,3 +666,24 @@ class TestGetVersion:
         assert result["client_version"] == mcp_server.__version__
         assert "server_api_version" not in result
         assert "compatible" not in result
+
+
+class TestGetClient:
+    """Tests for the lazily created InvestmentClient singleton."""
+
+    def test_client_created_once(self) -> None:
+        config = mcp_server.Config(api_url="http://localhost:8000", api_key="inv_test_key")
+        with patch.object(mcp_server.Config, "from_env", return_value=config) as from_env:
+            client = mcp_server._get_client()
+            assert mcp_server._get_client() is client
+        from_env.assert_called_once_with()
+        assert client.base_url == "http://localhost:8000"
+        client.close()
+
+    def test_client_closed_at_exit(self) -> None:
+        mock_client = MagicMock()
+        mcp_server._client = mock_client
+
+        mcp_server._close_client()
+
+        mock_client.close.assert_called_once_with()
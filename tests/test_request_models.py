@@ -1,9 +1,11 @@
 """Tests for request models."""
 
+import json
 from datetime import datetime
 
 import pytest
 from pydantic import ValidationError
+from pydantic_core import to_json
 
 from site_calc_investment.models.common import Resolution, TimeSpan
 from site_calc_investment.models.requests import (
@@ -232,3 +234,20 @@ class TestInvestmentPlanningRequest:
         # Check sites included
         assert "sites" in api_dict
         assert len(api_dict["sites"]) == 1
+
+    def test_investment_planning_request_to_api_json(self, simple_site, prague_tz, investment_params):
+        """Test direct JSON serialization matches the API dict."""
+        start = datetime(2025, 1, 1, 0, 0, 0, tzinfo=prague_tz)
+        timespan = TimeSpanInvestment(start=start, intervals=8760, resolution=Resolution.HOUR_1)
+
+        request = InvestmentPlanningRequest(
+            sites=[simple_site], timespan=timespan, investment_parameters=investment_params
+        )
+
+        api_json = json.loads(request.model_dump_json_for_api())
+
+        assert api_json == json.loads(to_json(request.model_dump_for_api()))
+        assert api_json["timespan"]["period_start"] == start.isoformat()
+
+        # Plain dumps keep the model's own timespan fields
+        assert request.model_dump()["timespan"]["intervals"] == 8760